@@ -0,0 +1,5 @@
+"""
+Performance Check Script များ (Request တစ်ခုချင်းစီက ပြောထားတဲ့ Behaviour ကို တိုင်းပြီး စစ်မယ်)
+Project Root ကနေ Module အဖြစ် Run ရမယ်:  python -m bench.bench_client_pool
+ပြောထားတဲ့ အကျိုး မရရင် Exit Code 1 နဲ့ ထွက်မယ်။
+"""
@@ -0,0 +1,56 @@
+"""
+user-008: Agent တစ်ခါ လိုတိုင်း JarvisAgent() အသစ်ဆောက်တာ (အဟောင်း) နဲ့ Prewarmed agent_pool.acquire() ရဲ့
+Acquisition Latency ကို နှိုင်းယှဉ်မယ်၊ Checkout တစ်ခုက Role Prompt Override နောက်တစ်ခုဆီ မပါသွားတာကိုပါ စစ်မယ်
+    python -m bench.bench_agent_pool [acquisitions_per_role]
+"""
+import sys
+import time
+import shutil
+import asyncio
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("agents")  # core.agent က Memory Singleton တွေကို Import လုပ်လို့
+from core.agent import JarvisAgent  # noqa: E402
+from core.agent_pool import AgentPool  # noqa: E402
+
+ROLES = ["planner", "researcher", "coder", "qa_tester"]
+
+async def main(rounds: int):
+    construct = {role: [] for role in ROLES}
+    for _ in range(rounds):
+        for role in ROLES:
+            started = time.perf_counter()
+            JarvisAgent(role=role)
+            construct[role].append(elapsed_ms(started))
+
+    pool = AgentPool(max_idle_per_role=2)
+    pool.warm(ROLES)
+    pooled = {role: [] for role in ROLES}
+    for _ in range(rounds):
+        for role in ROLES:
+            started = time.perf_counter()
+            async with pool.acquire(role, system_instruction=f"override for {role}") as agent:
+                pooled[role].append(elapsed_ms(started))
+
+    rows = []
+    for role in ROLES:
+        rows.append({"role": role, "path": "new JarvisAgent()", **summarize(construct[role])})
+        rows.append({"role": role, "path": "warm pool acquire", **summarize(pooled[role])})
+    print_table(f"Agent acquisition latency ({rounds} per role)", rows)
+
+    async with pool.acquire("planner") as agent:
+        isolated = agent.brain.system_instruction != "override for planner"
+    stats = pool.stats()
+    print(f"\n   pool stats: {stats}")
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    construct_p50 = sorted(sum(construct.values(), []))[len(ROLES) * rounds // 2]
+    pooled_p50 = sorted(sum(pooled.values(), []))[len(ROLES) * rounds // 2]
+    check(stats["misses"] == 0, "every acquisition after warm-up is served from the pool")
+    check(pooled_p50 < construct_p50, f"pooled p50 {pooled_p50:.2f}ms < construction p50 {construct_p50:.2f}ms")
+    check(isolated, "a system_instruction override does not leak into the next checkout")
+    finish()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
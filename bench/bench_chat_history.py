@@ -0,0 +1,109 @@
+"""
+user-012: chat_history ကို Row 1M အထိ တဖြည်းဖြည်း ကြီးလာအောင် ထည့်ပြီး get_chat_history Latency က
+(user_id, id) Index ကြောင့် မပြောင်းဘဲ Flat ဖြစ်နေတာကို စစ်မယ် (NOT INDEXED Query နဲ့ နှိုင်းယှဉ်)
+ပြီးရင် Retention (Archive) + Incremental Vacuum နဲ့ Hot Table / DB File ကျုံ့သွားတာကို စစ်မယ်
+    python -m bench.bench_chat_history [max_rows]
+"""
+import os
+import sys
+import time
+import random
+import shutil
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("history")
+from memory.sql_storage import SQLStorage  # noqa: E402
+
+USERS = 50
+QUIET_USER = 999  # Table အစမှာပဲ Turn ရှိတဲ့ User (Index မရှိရင် Table တစ်ခုလုံး Scan ရတဲ့ Worst Case)
+SAMPLES = 200
+
+def grow(storage: SQLStorage, start: int, stop: int, old_fraction: float = 0.8):
+    """Row [start, stop) ကို User 50 ယောက်ကြား ခွဲထည့်မယ် (အစပိုင်း 80% က ရက် 60 ကျော် ဟောင်းတဲ့ Turn)"""
+    now = time.time()
+    batch = []
+    if start == 0:
+        batch += [(QUIET_USER, "user", f"turn quiet {i}", now - 90 * 86400) for i in range(20)]
+    for i in range(start, stop):
+        age_days = 60 if i < stop * old_fraction else 1
+        batch.append((i % USERS, "user" if i % 2 == 0 else "model", f"turn {i} " + "lorem ipsum " * 8, now - age_days * 86400))
+        if len(batch) == 50000:
+            with storage._write() as conn:
+                conn.executemany("INSERT INTO chat_history (user_id, role, content, timestamp) VALUES (?, ?, ?, ?)", batch)
+            batch = []
+    if batch:
+        with storage._write() as conn:
+            conn.executemany("INSERT INTO chat_history (user_id, role, content, timestamp) VALUES (?, ?, ?, ?)", batch)
+
+def time_history(storage: SQLStorage, user_id: int = None) -> list:
+    latencies = []
+    for _ in range(SAMPLES):
+        started = time.perf_counter()
+        storage.get_chat_history(random.randrange(USERS) if user_id is None else user_id, 10)
+        latencies.append(elapsed_ms(started))
+    return latencies
+
+def time_unindexed(storage: SQLStorage, samples: int = 5) -> list:
+    latencies = []
+    with storage._read() as conn:
+        for _ in range(samples):
+            started = time.perf_counter()
+            conn.execute("SELECT role, content FROM chat_history NOT INDEXED WHERE user_id = ? ORDER BY id DESC LIMIT 10",
+                         (QUIET_USER,)).fetchall()
+            latencies.append(elapsed_ms(started))
+    return latencies
+
+def db_size(path: str) -> int:
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+
+def main(max_rows: int):
+    storage = SQLStorage()
+    sizes = [n for n in (10_000, 100_000, 1_000_000) if n < max_rows] + [max_rows]
+    rows, filled = [], 0
+    for size in sizes:
+        grow(storage, filled, size)
+        filled = size
+        indexed = summarize(time_history(storage))
+        quiet = summarize(time_history(storage, QUIET_USER))
+        plain = summarize(time_unindexed(storage))
+        rows.append({"rows": size, "active_p50_ms": indexed["p50_ms"], "active_p95_ms": indexed["p95_ms"],
+                     "quiet_p50_ms": quiet["p50_ms"], "quiet_not_indexed_p50_ms": plain["p50_ms"]})
+    print_table("get_chat_history(limit=10) latency vs table size", rows)
+
+    with storage._read() as conn:
+        plan = " ".join(str(r) for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT role, content, timestamp FROM chat_history WHERE user_id = ? ORDER BY id DESC LIMIT 10", (1,)))
+    print(f"\n   query plan: {plan}")
+
+    size_before = db_size(storage.db_path)
+    started = time.perf_counter()
+    archived = storage.archive_old_messages(max_age_days=30, max_rows_per_user=500)
+    archive_s = time.perf_counter() - started
+    freed = storage.incremental_vacuum()
+    size_after = db_size(storage.db_path)
+    with storage._read() as conn:
+        hot = conn.execute("SELECT COUNT(*) FROM chat_history").fetchone()[0]
+    after = summarize(time_history(storage))
+    print_table("Retention + incremental vacuum", [{
+        "archived": archived, "hot_rows": hot, "archive_s": round(archive_s, 1), "pages_freed": freed,
+        "db_mb_before": round(size_before / 1e6, 1), "db_mb_after": round(size_after / 1e6, 1),
+        "history_p50_ms": after["p50_ms"],
+    }])
+    sample = storage.get_archived_history(1, 3)
+    storage.close()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    first, last = rows[0], rows[-1]
+    check("idx_chat_history_user_id" in plan, "get_chat_history uses the (user_id, id) index")
+    for column in ("active_p50_ms", "quiet_p50_ms"):
+        check(last[column] <= max(first[column] * 3, 1.0),
+              f"{column.split('_')[0]} user latency stays flat from {first['rows']} to {last['rows']} rows "
+              f"({first[column]} -> {last[column]}ms)")
+    check(hot <= USERS * 500, f"retention keeps at most 500 hot rows per user ({hot} left)")
+    check(len(sample) == 3 and sample[0]["content"].startswith("turn"), "archived turns decompress back to the original text")
+    check(size_after < size_before, f"incremental vacuum shrinks the DB file ({size_before / 1e6:.1f} -> {size_after / 1e6:.1f} MB)")
+    finish()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
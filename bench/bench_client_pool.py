@@ -0,0 +1,82 @@
+"""
+user-001: Call တိုင်း genai.Client အသစ် + asyncio.to_thread (အဟောင်း) နဲ့ Pooled Async Client (client_pool) ကို
+Local Fake Gemini Endpoint ပေါ်မှာ နှိုင်းယှဉ်မယ် (Latency / Calls per second / TCP Connection အသစ်)
+    python -m bench.bench_client_pool [calls] [concurrency]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+
+from bench.common import FixtureServer, check, elapsed_ms, finish, print_table, summarize
+
+MODEL = "gemini-fake"
+RESPONSE = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}, "finishReason": "STOP"}],
+    "usageMetadata": {"promptTokenCount": 3, "candidatesTokenCount": 1, "totalTokenCount": 4},
+}).encode()
+
+def fake_gemini(method, path, headers, body):
+    time.sleep(0.005)  # Model Latency အတု
+    return 200, {"Content-Type": "application/json"}, RESPONSE
+
+async def per_call_clients(genai, api_key: str, calls: int, concurrency: int):
+    """Baseline: Call တိုင်း Client အသစ်ဆောက်ပြီး Sync generate_content ကို Worker Thread မှာ Run"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            client = genai.Client(api_key=api_key)
+            await asyncio.to_thread(client.models.generate_content, model=MODEL, contents="ping")
+            latencies.append(elapsed_ms(started))
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies
+
+async def pooled_client(client_pool, api_key: str, calls: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            client = client_pool.get_async_client(api_key)
+            await client.models.generate_content(model=MODEL, contents="ping")
+            latencies.append(elapsed_ms(started))
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies
+
+async def main(calls: int, concurrency: int):
+    with FixtureServer(fake_gemini) as server:
+        # SDK ရဲ့ Default Base URL ကို Local Fixture ဆီ လှည့်မယ် (Client မဆောက်ခင် ထားရမယ်)
+        os.environ["GOOGLE_GEMINI_BASE_URL"] = server.url
+        from google import genai
+        from core.client_pool import client_pool
+        api_key = "bench-key-0000"
+
+        rows = []
+        for name, runner in (("per-call client + to_thread", lambda: per_call_clients(genai, api_key, calls, concurrency)),
+                             ("pooled async client", lambda: pooled_client(client_pool, api_key, calls, concurrency))):
+            server.reset_counters()
+            started = time.perf_counter()
+            latencies = await runner()
+            wall = time.perf_counter() - started
+            rows.append({"path": name, **summarize(latencies), "calls_per_s": round(calls / wall, 1),
+                         "tcp_connections": server.connections})
+        await client_pool.close()
+
+    print_table(f"Gemini client layer ({calls} calls, concurrency {concurrency})", rows)
+    baseline, pooled = rows
+    check(pooled["tcp_connections"] <= concurrency,
+          f"pooled client reuses connections ({pooled['tcp_connections']} opened for {calls} calls)")
+    check(pooled["tcp_connections"] < baseline["tcp_connections"],
+          f"fewer connections than per-call clients ({pooled['tcp_connections']} vs {baseline['tcp_connections']})")
+    finish()
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    asyncio.run(main(*(args + [200, 8][len(args):])))
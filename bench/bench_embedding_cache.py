@@ -0,0 +1,86 @@
+"""
+user-015: Knowledge Search Query တွေကို (စာလုံးအကြီးအသေး / Space ကွဲပြီး) ထပ်ခါထပ်ခါ ရှာတဲ့အခါ
+Cache မပါ Embed (အဟောင်း) / In-memory LRU Hit / Restart ပြီး Disk Layer Hit တို့ရဲ့ Latency နဲ့ Hit Rate ကို နှိုင်းယှဉ်မယ်
+Sentence-Transformer မရှိရင် Batch တစ်ခုကို 20ms ကြာတဲ့ Synthetic Embedder နဲ့ Cache Mechanics ကိုပဲ တိုင်းမယ်
+    python -m bench.bench_embedding_cache [repeats]
+"""
+import os
+import sys
+import time
+import shutil
+import hashlib
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("embeddings")
+from config import Config  # noqa: E402
+from memory import vector_storage as storage_module  # noqa: E402
+from memory.embedding_cache import EmbeddingCache  # noqa: E402
+
+QUERIES = [
+    "nginx 502 bad gateway after deploy", "pip install externally-managed-environment", "restart uvicorn service",
+    "lancedb version cleanup", "telegram 429 too many requests", "playwright chromium missing dependencies",
+    "sqlite database is locked", "git push rejected non-fast-forward", "disk full /var/log", "python venv activate",
+]
+
+def variants(query: str, round_index: int) -> str:
+    """Agent တွေ Query ကို နည်းနည်းစီ ကွဲပြီး ပြန်ရှာတတ်တာကို အတုယူမယ် (Normalize နဲ့ တူသွားရမယ်)"""
+    return [query, query.upper(), f"  {query}  ", query.replace(" ", "   ")][round_index % 4]
+
+def synthetic_embed(texts):
+    time.sleep(0.02)
+    return [[b / 255 for b in hashlib.sha256(t.encode()).digest()] * 12 for t in texts]
+
+def load_embedder():
+    if storage_module._load_backend():
+        return storage_module.embed_fn.compute_source_embeddings, "sentence-transformers"
+    print("⚠️ sentence-transformers unavailable - using a 20ms synthetic embedder.")
+    return synthetic_embed, "synthetic"
+
+def run(embed, repeats: int) -> list:
+    latencies = []
+    for r in range(repeats):
+        for query in QUERIES:
+            started = time.perf_counter()
+            embed([variants(query, r)])
+            latencies.append(elapsed_ms(started))
+    return latencies
+
+def main(repeats: int):
+    compute, source = load_embedder()
+    compute(["warm the model up"])  # Model Load ချိန်ကို မရောအောင်
+    disk_path = os.path.join(WORKDIR, "bench_embeddings.db")
+
+    cache = EmbeddingCache(Config.EMBEDDING_MODEL_NAME, max_entries=256, disk_path=disk_path)
+    uncached = run(compute, repeats)
+    cold = run(lambda texts: cache.get_many(texts, compute), 1)
+    warm = run(lambda texts: cache.get_many(texts, compute), repeats)
+    memory_stats = cache.stats()
+    cache.close()
+
+    # Restart ကို အတုယူမယ်: Memory LRU အလွတ်၊ Disk Layer ပဲ ရှိမယ်
+    restarted = EmbeddingCache(Config.EMBEDDING_MODEL_NAME, max_entries=256, disk_path=disk_path)
+    after_restart = run(lambda texts: restarted.get_many(texts, compute), 1)
+    disk_stats = restarted.stats()
+    restarted.close()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    print_table(f"Repeated knowledge-query embedding latency ({source}, {len(QUERIES)} queries x {repeats})", [
+        {"path": "no cache", **summarize(uncached)},
+        {"path": "cache, first sight", **summarize(cold)},
+        {"path": "cache, repeated", **summarize(warm)},
+        {"path": "disk layer after restart", **summarize(after_restart)},
+    ])
+    print(f"\n   stats (memory run): {memory_stats}")
+    print(f"   stats (after restart): {disk_stats}")
+
+    uncached_p50 = summarize(uncached)["p50_ms"]
+    warm_p50 = summarize(warm)["p50_ms"]
+    check(memory_stats["misses"] == len(QUERIES), "each normalized query is embedded exactly once")
+    check(memory_stats["hit_rate"] >= 0.9, f"repeated queries hit the cache (hit rate {memory_stats['hit_rate']})")
+    check(warm_p50 * 10 < uncached_p50, f"cached lookups are >10x faster ({warm_p50}ms vs {uncached_p50}ms)")
+    check(disk_stats["disk_hits"] == len(QUERIES) and disk_stats["misses"] == 0, "disk layer serves every query after a restart")
+    finish()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,94 @@
+"""
+user-024: Local Fixture Server ပေါ်မှာ URL တိုင်း Connection အသစ်နဲ့ Body တစ်ခုလုံး Download (အဟောင်း) နဲ့
+Shared http_pool.fetch (Keep-alive Pool + Stream Byte Cap) ရဲ့ Pages/s၊ TCP Connection အသစ်နဲ့ Page ကြီးမှာ Peak Memory ကို နှိုင်းယှဉ်မယ်
+read_page_content က Page ကြီးကို SCRAPER_MAX_BYTES မှာ ဖြတ်ပြီး SCRAPER_MAX_CHARS ထက် မပိုတာကိုပါ စစ်မယ်
+    python -m bench.bench_http_pool [pages] [concurrency]
+"""
+import sys
+import time
+import shutil
+import asyncio
+import tracemalloc
+
+from bench.common import FixtureServer, check, finish, print_table, use_temp_storage
+
+WORKDIR = use_temp_storage("http")
+from config import Config  # noqa: E402
+from core.http_pool import http_pool  # noqa: E402
+from tools.web.scraper import ScraperTool  # noqa: E402
+
+PAGE = ("<html><head><title>fixture</title><script>var x = 1;</script></head><body>"
+        + "<p>Jarvis fixture paragraph with some <a href='/next'>links</a> and text.</p>" * 600
+        + "</body></html>").encode()  # ~50KB
+BIG_PAGE = b"<html><body>" + (b"<p>" + b"y" * 1000 + b"</p>") * 6000 + b"</body></html>"  # ~6MB
+
+def fixture(method, path, headers, body):
+    time.sleep(0.002)  # Server Latency အတု
+    payload = BIG_PAGE if path.startswith("/big") else PAGE
+    return 200, {"Content-Type": "text/html; charset=utf-8"}, payload
+
+async def per_request_fetch(httpx, url: str) -> bytes:
+    """Baseline: URL တိုင်း Client (Connection) အသစ်ဆောက်ပြီး Body တစ်ခုလုံးကို Memory ထဲ ဖတ်တာ"""
+    async with httpx.AsyncClient(timeout=Config.HTTP_TIMEOUT) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
+async def pooled_fetch(httpx, url: str) -> bytes:
+    return (await http_pool.fetch(url, max_bytes=Config.SCRAPER_MAX_BYTES)).content
+
+async def throughput(fetch, httpx, base: str, pages: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await fetch(httpx, f"{base}/page/{i}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(pages)))
+    return pages / (time.perf_counter() - started)
+
+async def peak_memory(fetch, httpx, url: str) -> tuple:
+    tracemalloc.start()
+    content = await fetch(httpx, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(content), peak
+
+async def main(pages: int, concurrency: int):
+    import httpx
+    rows, downloads = [], {}
+    with FixtureServer(fixture) as server:
+        for name, fetch in (("connection per URL, full body", per_request_fetch), ("http_pool.fetch", pooled_fetch)):
+            await fetch(httpx, f"{server.url}/warm")
+            server.reset_counters()
+            rate = await throughput(fetch, httpx, server.url, pages, concurrency)
+            connections = server.connections
+            size, peak = await peak_memory(fetch, httpx, f"{server.url}/big")
+            downloads[name] = size
+            rows.append({"path": name, "pages_per_s": round(rate, 1), "new_connections": connections,
+                         "big_page_bytes": size, "big_page_peak_mb": round(peak / 1e6, 1)})
+        tool_output = await ScraperTool().execute(url=f"{server.url}/big")
+        pool_stats = http_pool.stats()
+    await http_pool.close()
+    print_table(f"{pages} pages, {concurrency} concurrent readers on one host (+ one {len(BIG_PAGE) / 1e6:.1f} MB page)", rows)
+    print(f"\n   http_pool stats: {pool_stats}")
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    baseline, pooled = rows
+    check(pooled["pages_per_s"] > baseline["pages_per_s"],
+          f"pooled fetch reads more pages/s ({pooled['pages_per_s']} vs {baseline['pages_per_s']})")
+    # Host တစ်ခုကို HTTP_PER_HOST_LIMIT ထက် ပိုမဖွင့်ရဘူး (ကျန်တဲ့ Reader တွေက Semaphore မှာ တန်းစီပြီး Connection ပြန်သုံးမယ်)
+    check(pooled["new_connections"] <= Config.HTTP_PER_HOST_LIMIT < baseline["new_connections"],
+          f"keep-alive reuses connections ({pooled['new_connections']} vs {baseline['new_connections']} new)")
+    check(downloads["http_pool.fetch"] == Config.SCRAPER_MAX_BYTES, f"download stops at SCRAPER_MAX_BYTES ({downloads['http_pool.fetch']} bytes)")
+    check(pooled["big_page_peak_mb"] < baseline["big_page_peak_mb"],
+          f"peak memory on the big page drops ({pooled['big_page_peak_mb']} vs {baseline['big_page_peak_mb']} MB)")
+    check(pool_stats["truncated"] >= 2, "truncated downloads are counted in http_pool stats")
+    check(len(tool_output) <= Config.SCRAPER_MAX_CHARS + 50 and tool_output.endswith("(Content truncated for brevity)"),
+          f"read_page_content returns at most SCRAPER_MAX_CHARS ({len(tool_output)} chars)")
+    finish()
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [500, 50][len(args):])))
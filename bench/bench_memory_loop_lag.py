@@ -0,0 +1,69 @@
+"""
+user-011: Memory Operation တွေ (SQLite + Knowledge Search/Embedding) ကို Event Loop ပေါ်မှာ တိုက်ရိုက် Sync ခေါ်တာ (အဟောင်း)
+နဲ့ MemoryController ရဲ့ Async API (SQL / Vector Thread Pool) ကို ပြိုင်တူ ခေါ်နေတုန်း Event Loop Lag ကို နှိုင်းယှဉ်မယ်
+    python -m bench.bench_memory_loop_lag [rounds]
+"""
+import sys
+import shutil
+import asyncio
+
+from bench.common import LoopLagProbe, check, finish, print_table, use_temp_storage
+
+WORKDIR = use_temp_storage("memory")
+from memory.memory_controller import memory_controller  # noqa: E402
+
+USER_ID = 4242
+QUERIES = ["nginx 502 bad gateway after deploy", "pip install fails with externally-managed-environment",
+           "how to restart uvicorn service", "lancedb table version cleanup", "telegram bot rate limit 429"]
+
+def seed():
+    for i in range(2000):
+        memory_controller.add_chat_message(USER_ID, "user" if i % 2 == 0 else "model", f"turn {i} " + "x" * 200)
+    memory_controller.sql.flush()
+    items = [{"category": ("Skill", "Mistake", "Fact")[i % 3], "task_or_query": f"{QUERIES[i % 5]} variant {i}",
+              "solution": f"solution {i}", "code_snippet": ""} for i in range(300)]
+    return memory_controller.save_knowledge_many(items) > 0
+
+async def sync_on_loop(rounds: int):
+    """Baseline: Tool / Chat Handler က Sync Method ကို Coroutine ထဲကနေ တိုက်ရိုက်ခေါ်တာ"""
+    async def one(i):
+        memory_controller.search_knowledge(QUERIES[i % 5] + f" #{i}")
+        memory_controller.get_recent_chat(USER_ID, 1000)
+        memory_controller.add_chat_message(USER_ID, "user", f"sync {i}")
+        await asyncio.sleep(0)
+    await asyncio.gather(*(one(i) for i in range(rounds)))
+
+async def async_api(rounds: int):
+    async def one(i):
+        await asyncio.gather(
+            memory_controller.asearch_knowledge(QUERIES[i % 5] + f" #{i}"),
+            memory_controller.aget_recent_chat(USER_ID, 1000),
+            memory_controller.aadd_chat_message(USER_ID, "user", f"async {i}"),
+        )
+    await asyncio.gather(*(one(i) for i in range(rounds)))
+
+async def main(rounds: int):
+    vector_ready = await asyncio.to_thread(seed)
+    if not vector_ready:
+        print("⚠️ Vector backend (lancedb / sentence-transformers) unavailable - measuring SQL work only.")
+
+    rows = []
+    for name, runner in (("sync calls on the loop", sync_on_loop), ("async API (executors)", async_api)):
+        async with LoopLagProbe() as probe:
+            await runner(rounds)
+        rows.append({"path": name, "ticks": len(probe.lags_ms), "lag_p95_ms": round(probe.p95_ms, 2),
+                     "lag_max_ms": round(probe.max_ms, 2)})
+    print_table(f"Event-loop lag during {rounds} concurrent memory round trips", rows)
+
+    memory_controller.shutdown()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    sync_row, async_row = rows
+    # Worker Thread တွေက GIL ကို ခဏခဏ ယူလို့ Lag လုံးဝ မရှိတာ မဟုတ်ပေမယ့် Operation တစ်ခုလုံးစာ Block မဖြစ်ရဘူး
+    check(async_row["lag_max_ms"] < sync_row["lag_max_ms"],
+          f"async API lag is below the sync baseline ({async_row['lag_max_ms']} vs {sync_row['lag_max_ms']}ms)")
+    check(async_row["lag_p95_ms"] < 25, f"loop stays responsive with the async API (p95 lag {async_row['lag_p95_ms']}ms)")
+    finish()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
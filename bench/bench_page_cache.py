@@ -0,0 +1,91 @@
+"""
+user-025: ETag / If-None-Match ကို နားလည်တဲ့ Local Fixture Server ပေါ်မှာ read_page_content ရဲ့ Page Cache ကို စစ်မယ်
+Cold Fetch / TTL အတွင်း Fresh Hit (Network မထိ) / TTL ကျော်ပြီး 304 Revalidation / Content ပြောင်းသွားတဲ့ Page တို့ရဲ့
+Latency၊ Fixture Request အရေအတွက်နဲ့ hit / miss / revalidated / bytes_saved Counter တွေကို နှိုင်းယှဉ်မယ်
+    python -m bench.bench_page_cache [urls]
+"""
+import sys
+import time
+import shutil
+import asyncio
+import hashlib
+
+from bench.common import FixtureServer, check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("pages")
+from core.http_pool import http_pool  # noqa: E402
+from core.page_cache import page_cache  # noqa: E402
+from tools.web.scraper import ScraperTool  # noqa: E402
+
+VERSIONS = {}  # path -> Content Version (ပြောင်းရင် ETag ပါ ပြောင်းမယ်)
+RESPONSES = {"200": 0, "304": 0}
+
+def render(path: str) -> bytes:
+    version = VERSIONS.get(path, 1)
+    body = "".join(f"<p>Section {i} of {path} (revision {version}) with enough text to be worth caching.</p>" for i in range(400))
+    return f"<html><head><title>{path}</title></head><body><h1>{path}</h1>{body}</body></html>".encode()
+
+def fixture(method, path, headers, body):
+    time.sleep(0.02)  # Origin Server Latency အတု
+    payload = render(path)
+    etag = '"' + hashlib.md5(payload).hexdigest() + '"'
+    if headers.get("If-None-Match") == etag:
+        RESPONSES["304"] += 1
+        return 304, {"ETag": etag}, b""
+    RESPONSES["200"] += 1
+    return 200, {"Content-Type": "text/html; charset=utf-8", "ETag": etag}, payload
+
+async def read_all(tool: ScraperTool, base: str, paths: list) -> tuple:
+    latencies, outputs = [], []
+    for path in paths:
+        started = time.perf_counter()
+        outputs.append(await tool.execute(url=base + path))
+        latencies.append(elapsed_ms(started))
+    return latencies, outputs
+
+async def main(count: int):
+    tool = ScraperTool()
+    paths = [f"/doc/{i}" for i in range(count)]
+    rows, phases = [], {}
+    with FixtureServer(fixture) as server:
+        async def phase(name: str, targets: list):
+            server.reset_counters()
+            RESPONSES.update({"200": 0, "304": 0})
+            before = page_cache.stats()
+            latencies, outputs = await read_all(tool, server.url, targets)
+            after = page_cache.stats()
+            delta = {key: after[key] - before[key] for key in ("hits", "revalidated", "misses", "parse_reused", "bytes_saved")}
+            rows.append({"phase": name, "p50_ms": summarize(latencies)["p50_ms"], "origin_requests": server.requests,
+                         "200s": RESPONSES["200"], "304s": RESPONSES["304"], **delta})
+            phases[name] = {**rows[-1], "outputs": outputs}
+
+        await phase("cold (empty cache)", paths)
+        await phase("fresh (within TTL)", paths)
+        page_cache.default_ttl = 0  # TTL ကုန်သွားတာကို အတုယူမယ်
+        await phase("stale, unchanged (304)", paths)
+        VERSIONS[paths[0]] = 2
+        await phase("stale, one page changed", paths)
+    await http_pool.close()
+    stats = page_cache.stats()
+    page_cache.close()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    print_table(f"read_page_content over {count} URLs with an ETag-aware origin", rows)
+    print(f"\n   page cache stats: {stats}")
+
+    cold, fresh, stale, changed = (phases[row["phase"]] for row in rows)
+    cold_p50, fresh_p50, stale_p50 = (row["p50_ms"] for row in rows[:3])
+    check(cold["misses"] == count and cold["200s"] == count, "cold reads download and store every page")
+    check(fresh["origin_requests"] == 0 and fresh["hits"] == count, "fresh hits are served without touching the network")
+    check(fresh["outputs"] == cold["outputs"], "cached markdown matches what the cold read returned")
+    check(stale["304s"] == count and stale["revalidated"] == count and stale["200s"] == 0,
+          "stale pages are revalidated with If-None-Match and the origin answers 304")
+    check(stale["bytes_saved"] >= count * len(render(paths[-1])) * 0.9, f"304s count the unsent bodies as bytes_saved ({stale['bytes_saved']})")
+    check(changed["200s"] == 1 and changed["304s"] == count - 1 and "revision 2" in changed["outputs"][0],
+          "a changed page (new ETag) is re-downloaded while the rest revalidate")
+    check(fresh_p50 < cold_p50 and stale_p50 < cold_p50,
+          f"fresh and revalidated reads beat cold reads ({fresh_p50} / {stale_p50} vs {cold_p50}ms)")
+    finish()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
@@ -0,0 +1,121 @@
+"""
+user-003: f-string Prompt (အဟောင်း) နဲ့ Role-tagged Content Turns (build_contents + FunctionResponse) ကို
+ReAct Conversation အတု တစ်ခုပေါ်မှာ Token အရေအတွက် နှိုင်းယှဉ်မယ်
+- total = Iteration တိုင်း ပို့တဲ့ Token ပေါင်း
+- uncached = ယခင် Request နဲ့ Prefix မတူတော့တဲ့ အပိုင်း (Implicit Context Cache မမိနိုင်တဲ့ Token)
+    python -m bench.bench_prompt_tokens [tool_iterations] [--api]
+--api ပေးရင် Gemini count_tokens နဲ့ တကယ်ရေတွက်မယ် (မပေးရင် 4 chars ≈ 1 token နဲ့ ခန့်မှန်းမယ်)
+"""
+import sys
+import json
+import shutil
+from google.genai import types
+
+from bench.common import check, finish, print_table, use_temp_storage
+
+WORKDIR = use_temp_storage("tokens")  # core.agent က Memory Singleton တွေကို Import လုပ်လို့
+from core.agent import TOOL_LOOP_INSTRUCTION  # noqa: E402
+from core.brain import JarvisBrain  # noqa: E402
+
+DYNAMIC_CONTEXT = "Current Time: 2026-10-18 09:00 (Asia/Yangon)\nUser Profile:\n- name: Sir\n- server: 2GB VPS\n- stack: python, fastapi"
+CONTEXT_MEMORY = "\n".join(f"- Skill #{i}: restart uvicorn with systemctl restart jarvis after editing config.py" for i in range(5))
+HISTORY = [f"Sir: question {i} about the deployment pipeline?" if i % 2 == 0
+           else f"Jarvis: answer {i} explaining the nginx and uvicorn setup in detail." for i in range(10)]
+USER_INPUT = "Server ရဲ့ disk usage ကို စစ်ပြီး log ဖိုင်ဟောင်းတွေကို ရှင်းပေးပါ"
+
+def tool_output(i: int) -> str:
+    return f"Filesystem report #{i}\n" + "\n".join(f"/var/log/app{j}.log  {j * 13} MB" for j in range(60))
+
+def legacy_prompts(iterations: int) -> list:
+    """Baseline core/brain.py: Iteration တိုင်း f-string တစ်ခုတည်း (History ရဲ့ repr + ကြီးလာနေတဲ့ Task Context)"""
+    prompts, task_context = [], USER_INPUT
+    for i in range(iterations + 1):
+        prompts.append(f"""
+                {DYNAMIC_CONTEXT}
+
+                Context from Memory:
+                {CONTEXT_MEMORY}
+
+                Chat History:
+                {HISTORY}
+
+                User Input:
+                {task_context}
+                """)
+        task_context += (f"\n\n[SYSTEM: Tool 'shell_exec' executed. Output:\n{tool_output(i)}]\n\n{TOOL_LOOP_INSTRUCTION}")
+    return prompts
+
+def structured_requests(brain: JarvisBrain, iterations: int) -> list:
+    """JarvisAgent._react_loop အတိုင်း: Turn တွေကို နောက်ကပဲ ဆက်ဖြည့်မယ်"""
+    contents = brain.build_contents(USER_INPUT, HISTORY, CONTEXT_MEMORY, dynamic_context=DYNAMIC_CONTEXT)
+    contents[-1].parts.append(types.Part(text=TOOL_LOOP_INSTRUCTION))
+    requests = []
+    for i in range(iterations + 1):
+        requests.append([c.model_copy(deep=True) for c in contents])
+        call = types.FunctionCall(id=f"call-{i}", name="shell_exec", args={"command": "du -sh /var/log/*"})
+        contents.append(types.Content(role="model", parts=[types.Part(function_call=call)]))
+        contents.append(types.Content(role="user", parts=[types.Part(function_response=types.FunctionResponse(
+            id=call.id, name=call.name, response={"output": tool_output(i)}))]))
+    return requests
+
+def serialize(content: types.Content) -> str:
+    return json.dumps(content.model_dump(mode="json", exclude_none=True), ensure_ascii=False, sort_keys=True)
+
+def payload_text(payload) -> str:
+    """ခန့်မှန်းဖို့ Model မြင်မယ့် စာသား (Text Part + Function Call/Response ရဲ့ JSON) ကိုပဲ ယူမယ်"""
+    if isinstance(payload, str):
+        return payload
+    chunks = []
+    for content in payload:
+        for part in content.parts:
+            if part.text is not None:
+                chunks.append(part.text)
+            elif part.function_call:
+                chunks.append(part.function_call.name + json.dumps(part.function_call.args, ensure_ascii=False))
+            elif part.function_response:
+                chunks.append(part.function_response.name + json.dumps(part.function_response.response, ensure_ascii=False))
+    return "\n".join(chunks)
+
+def make_counter(use_api: bool):
+    if not use_api:
+        return lambda payload: max(len(payload_text(payload)) // 4, 1)
+    from config import Config
+    from core.client_pool import client_pool
+    client = client_pool.get_client(Config.API_KEYS[0])
+    return lambda payload: client.models.count_tokens(model=Config.MODEL_NAME, contents=payload).total_tokens
+
+def main(iterations: int, use_api: bool):
+    count = make_counter(use_api)
+    brain = JarvisBrain(role="ceo")
+
+    legacy = legacy_prompts(iterations)
+    legacy_tokens = [count(p) for p in legacy]
+    # f-string က User Input နေရာမှာ ကြီးလာလို့ ရှေ့ပိုင်း (Context + History) ပဲ Request အချင်းချင်း တူတယ်
+    legacy_shared = count(legacy[0].split("User Input:")[0])
+    legacy_uncached = legacy_tokens[0] + sum(t - legacy_shared for t in legacy_tokens[1:])
+
+    structured = structured_requests(brain, iterations)
+    structured_tokens = [count(r) for r in structured]
+    stable = all([serialize(c) for c in prev] == [serialize(c) for c in cur[:len(prev)]]
+                 for prev, cur in zip(structured, structured[1:]))
+    structured_uncached = structured_tokens[0] + sum(cur - prev for prev, cur in zip(structured_tokens, structured_tokens[1:]))
+
+    rows = [
+        {"prompt": "legacy f-string", "requests": len(legacy), "total_tokens": sum(legacy_tokens),
+         "uncached_tokens": legacy_uncached, "last_request": legacy_tokens[-1]},
+        {"prompt": "role-tagged contents", "requests": len(structured), "total_tokens": sum(structured_tokens),
+         "uncached_tokens": structured_uncached, "last_request": structured_tokens[-1]},
+    ]
+    mode = "count_tokens API" if use_api else "≈4 chars/token"
+    print_table(f"Prompt tokens per conversation ({iterations} tool iterations, {mode})", rows)
+    saved = 1 - structured_uncached / legacy_uncached
+    print(f"\n   uncached tokens saved: {saved:.0%}")
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    check(stable, "each request's contents are a byte-identical prefix of the next request")
+    check(structured_uncached < legacy_uncached, "structured contents send fewer uncacheable tokens per conversation")
+    finish()
+
+if __name__ == "__main__":
+    positional = [int(a) for a in sys.argv[1:] if a.isdigit()]
+    main(positional[0] if positional else 6, "--api" in sys.argv)
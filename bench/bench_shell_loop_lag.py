@@ -0,0 +1,80 @@
+"""
+user-021: ကြာပြီး Output များတဲ့ shell_exec Command တွေ ပြိုင်တူ Run နေတုန်း Event Loop Lag ကို
+Coroutine ထဲက Blocking subprocess.run (အဟောင်း) နဲ့ ShellTool ရဲ့ Asyncio Subprocess Engine (One-shot / Persistent Session) ကြား နှိုင်းယှဉ်မယ်
+Output က head + tail Buffer ထဲမှာပဲ ကန့်သတ်ထားတာနဲ့ Progress Status တွေ ထွက်လာတာကိုပါ စစ်မယ်
+    python -m bench.bench_shell_loop_lag [concurrent_commands]
+"""
+import sys
+import time
+import asyncio
+import subprocess
+
+from bench.common import LoopLagProbe, check, finish, print_table
+
+from config import Config
+from tools.base import close_run_resources, tool_run_resources, tool_status_callback
+from tools.system.shell import ShellTool
+
+# ~2s ကြာပြီး stdout ကို 2MB လောက် ထုတ်မယ် (Pipe Buffer ပြည့်အောင်)
+COMMAND = "sleep 1; yes 'jarvis shell bench output line' | head -c 2000000; sleep 1; echo done"
+OUTPUT_LIMIT = Config.SHELL_OUTPUT_HEAD_CHARS + Config.SHELL_OUTPUT_TAIL_CHARS + 200  # Omitted Marker + "STDOUT:" + Usage
+
+async def blocking_baseline(concurrency: int) -> list:
+    """Baseline: async execute() ထဲကနေ subprocess.run ကို တိုက်ရိုက်ခေါ်တာ (Event Loop ကို Command ကြာသလောက် ပိတ်တယ်)"""
+    async def one():
+        result = subprocess.run(COMMAND, shell=True, capture_output=True, text=True, timeout=Config.SHELL_TIMEOUT)
+        await asyncio.sleep(0)
+        return result.stdout
+    return await asyncio.gather(*(one() for _ in range(concurrency)))
+
+async def shell_tool(concurrency: int, persistent: bool, statuses: list) -> list:
+    Config.SHELL_PERSISTENT_SESSION = persistent
+
+    async def on_status(message):
+        statuses.append(message)
+
+    async def one():
+        # Agent Run တစ်ခုစီလို Run Resource (Persistent Session) သီးသန့်ရမယ်
+        resources = {}
+        tool_run_resources.set(resources)
+        tool_status_callback.set(on_status)
+        try:
+            return await ShellTool().execute(command=COMMAND)
+        finally:
+            await close_run_resources(resources)
+    return await asyncio.gather(*(one() for _ in range(concurrency)))
+
+async def main(concurrency: int):
+    Config.SHELL_PROGRESS_INTERVAL = 0.5
+    paths = [
+        ("blocking subprocess.run", lambda statuses: blocking_baseline(concurrency)),
+        ("ShellTool one-shot", lambda statuses: shell_tool(concurrency, False, statuses)),
+        ("ShellTool persistent session", lambda statuses: shell_tool(concurrency, True, statuses)),
+    ]
+    rows, outputs, status_counts = [], {}, {}
+    for name, runner in paths:
+        statuses = []
+        started = time.perf_counter()
+        async with LoopLagProbe() as probe:
+            outputs[name] = await runner(statuses)
+        wall = time.perf_counter() - started
+        status_counts[name] = len(statuses)
+        rows.append({"path": name, "wall_s": round(wall, 2), "lag_p95_ms": round(probe.p95_ms, 2),
+                     "lag_max_ms": round(probe.max_ms, 2), "max_output_chars": max(len(o) for o in outputs[name]),
+                     "status_updates": len(statuses)})
+    print_table(f"Event-loop lag while {concurrency} long shell commands run concurrently", rows)
+
+    baseline = rows[0]
+    for row in rows[1:]:
+        name = row["path"]
+        check(row["lag_max_ms"] < 100 and row["lag_max_ms"] * 10 < baseline["lag_max_ms"],
+              f"{name}: loop stays responsive (max lag {row['lag_max_ms']} vs {baseline['lag_max_ms']}ms)")
+        check(row["wall_s"] < baseline["wall_s"] / 2,
+              f"{name}: commands overlap instead of running back to back ({row['wall_s']} vs {baseline['wall_s']}s)")
+        check(row["max_output_chars"] <= OUTPUT_LIMIT and all("done" in o and "chars omitted" in o for o in outputs[name]),
+              f"{name}: 2MB of output is capped to head + tail ({row['max_output_chars']} chars)")
+        check(row["status_updates"] > 0, f"{name}: progress status is reported while the command runs")
+    finish()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 4))
@@ -0,0 +1,144 @@
+"""
+user-010: Call တိုင်း sqlite3.connect (အဟောင်း - Rollback Journal) နဲ့ Long-lived WAL Connection (SQLStorage) ကို
+Thread အများ (asyncio.to_thread လို) ကနေ Read/Write ရောပြီး ပြိုင်တူ ခေါ်တဲ့အခါ ops/s နဲ့ Read Latency နှိုင်းယှဉ်မယ်
+WAL မှာ Writer က Transaction ဖွင့်ထားတုန်း Reader တွေ မစောင့်ရတာကိုပါ စစ်မယ်
+    python -m bench.bench_sql_storage [seconds] [threads]
+"""
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize
+from config import Config
+
+WORKDIR = tempfile.mkdtemp(prefix="jarvis-bench-sql-")
+Config.MEMORY_DB_PATH = os.path.join(WORKDIR, "wal.db")  # Singleton က Repo ထဲက DB ကို မထိအောင် Import မလုပ်ခင် ပြောင်းမယ်
+from memory.sql_storage import SQLStorage  # noqa: E402
+
+class PerCallStorage:
+    """Baseline memory/sql_storage.py ရဲ့ Pattern (Method တိုင်း connect -> execute -> commit -> close)"""
+    def __init__(self, path: str):
+        self.db_path = path
+        conn = sqlite3.connect(path)
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS chat_history (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER,
+                role TEXT, content TEXT, timestamp REAL);
+            CREATE TABLE IF NOT EXISTS user_profile (user_id INTEGER, key_name TEXT, value_text TEXT,
+                PRIMARY KEY (user_id, key_name));
+        ''')
+        conn.close()
+
+    def add_message(self, user_id, role, content):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO chat_history (user_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                     (user_id, role, content, time.time()))
+        conn.commit()
+        conn.close()
+
+    def get_chat_history(self, user_id, limit=10):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT role, content FROM chat_history WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+                            (user_id, limit)).fetchall()
+        conn.close()
+        return rows[::-1]
+
+    def update_profile(self, user_id, key, value):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT OR REPLACE INTO user_profile (user_id, key_name, value_text) VALUES (?, ?, ?)",
+                     (user_id, key, value))
+        conn.commit()
+        conn.close()
+
+    def get_user_profile(self, user_id):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT key_name, value_text FROM user_profile WHERE user_id = ?", (user_id,)).fetchall()
+        conn.close()
+        return rows
+
+def workload(storage, seconds: float, threads: int):
+    """Chat Turn တစ်ခုလို: Message 2 ခု ရေး + History / Profile ဖတ် + တစ်ခါတစ်ရံ Profile ရေး"""
+    stop = time.monotonic() + seconds
+    counts = {"ops": 0, "errors": 0}
+    read_ms = []
+    lock = threading.Lock()
+
+    def worker(user_id):
+        ops, errors, reads = 0, 0, []
+        i = 0
+        while time.monotonic() < stop:
+            i += 1
+            try:
+                storage.add_message(user_id, "user", f"message {i}")
+                started = time.perf_counter()
+                storage.get_chat_history(user_id, 10)
+                storage.get_user_profile(user_id)
+                reads.append(elapsed_ms(started))
+                storage.add_message(user_id, "model", f"reply {i}")
+                if i % 5 == 0:
+                    storage.update_profile(user_id, "last_topic", f"topic {i}")
+                ops += 5 + (i % 5 == 0)
+            except sqlite3.OperationalError:
+                errors += 1
+        with lock:
+            counts["ops"] += ops
+            counts["errors"] += errors
+            read_ms.extend(reads)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return counts, read_ms
+
+def reader_blocked_by_open_write(storage: SQLStorage) -> float:
+    """Writer Transaction ဖွင့်ထားတုန်း (Commit မလုပ်ရသေး) တခြား Thread က ဖတ်ရင် ဘယ်လောက်ကြာလဲ"""
+    holding = threading.Event()
+    release = threading.Event()
+
+    def writer():
+        with storage._write() as conn:
+            conn.execute("INSERT OR REPLACE INTO user_profile (user_id, key_name, value_text) VALUES (1, 'k', 'v')")
+            holding.set()
+            release.wait(2)
+
+    t = threading.Thread(target=writer)
+    t.start()
+    holding.wait()
+    started = time.perf_counter()
+    storage.get_user_profile(1)
+    waited = elapsed_ms(started)
+    release.set()
+    t.join()
+    return waited
+
+def main(seconds: float, threads: int):
+    legacy = PerCallStorage(os.path.join(WORKDIR, "per_call.db"))
+    wal = SQLStorage()
+
+    rows = []
+    for name, storage in (("per-call connect", legacy), ("WAL + pooled connections", wal)):
+        counts, read_ms = workload(storage, seconds, threads)
+        rows.append({"storage": name, "ops_per_s": round(counts["ops"] / seconds), "locked_errors": counts["errors"],
+                     **{f"read_{k}": v for k, v in summarize(read_ms).items() if k != "n"}})
+    print_table(f"SQLStorage mixed workload ({threads} threads, {seconds:.0f}s)", rows)
+
+    waited = reader_blocked_by_open_write(wal)
+    print(f"\n   read during an open write transaction: {waited:.2f}ms")
+    wal.close()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    legacy_row, wal_row = rows
+    check(wal_row["ops_per_s"] > legacy_row["ops_per_s"],
+          f"WAL storage is faster ({wal_row['ops_per_s']} vs {legacy_row['ops_per_s']} ops/s)")
+    check(wal_row["locked_errors"] == 0, "no 'database is locked' errors under concurrent threads")
+    check(waited < 100, "readers are not blocked by an open write transaction")
+    finish()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 3.0, int(args[1]) if len(args) > 1 else 4)
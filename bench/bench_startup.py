@@ -0,0 +1,85 @@
+"""
+user-014: `import main` (FastAPI App + Singleton အားလုံး) ရဲ့ Import-time Profile (Module အလိုက် ကုန်ချိန်) ကို
+python -X importtime နဲ့ ယူပြီး Artifact File အဖြစ် သိမ်းမယ်
+Embedding Model / LanceDB / Playwright / Tavily တွေ Startup မှာ Load မဖြစ်တာနဲ့ /ready က Cold State ကို ပြတာကို စစ်မယ်
+    python -m bench.bench_startup [--out importtime.txt]
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+
+from bench.common import check, finish, print_table
+
+HEAVY_MODULES = ["sentence_transformers", "torch", "lancedb", "pyarrow", "playwright", "tavily"]
+
+CHILD = f"""
+import sys, json, time, asyncio
+from bench.common import use_temp_storage
+workdir = use_temp_storage("startup")
+started = time.perf_counter()
+import main
+seconds = time.perf_counter() - started
+response = asyncio.run(main.readiness())
+print("@@" + json.dumps({{
+    "seconds": seconds,
+    "heavy_loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+    "ready_status": response.status_code,
+    "ready": json.loads(response.body),
+    "workdir": workdir,
+}}))
+"""
+
+def parse_importtime(stderr: str) -> list:
+    """'import time: self [us] | cumulative | imported package' Line တွေကို (module, self_us, cumulative_us) အဖြစ်"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|", 2))
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+def main(out_path: str):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD],
+                          capture_output=True, text=True, timeout=300, cwd=root)
+    with open(out_path, "w") as f:
+        f.write(proc.stderr)
+    result_line = next((line for line in proc.stdout.splitlines() if line.startswith("@@")), None)
+    if result_line is None:
+        print(proc.stdout[-2000:], proc.stderr[-2000:])
+        check(False, "`import main` succeeded in a child process")
+        finish()
+    result = json.loads(result_line[2:])
+    shutil.rmtree(result["workdir"], ignore_errors=True)
+
+    modules = parse_importtime(proc.stderr)
+    top_level = {}
+    for name, self_us, cumulative_us in modules:
+        root = name.split(".")[0]
+        top_level[root] = top_level.get(root, 0) + self_us
+    print_table("Slowest imports (cumulative)", [
+        {"module": name, "self_ms": round(self_us / 1000, 1), "cumulative_ms": round(cumulative_us / 1000, 1)}
+        for name, self_us, cumulative_us in sorted(modules, key=lambda m: m[2], reverse=True)[:15]
+    ])
+    print_table("Self time per top-level package", [
+        {"package": name, "self_ms": round(us / 1000, 1)}
+        for name, us in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:10]
+    ])
+    print(f"\n   import main: {result['seconds']:.2f}s | profile artifact: {out_path}")
+    print(f"   /ready before warm-up ({result['ready_status']}): {json.dumps(result['ready']['subsystems']['vector'])}")
+
+    vector = result["ready"]["subsystems"]["vector"]
+    check(not result["heavy_loaded"], f"no heavy dependency is imported at startup (loaded: {result['heavy_loaded']})")
+    check(not vector["embedding_model_loaded"] and not vector["connected"],
+          "embedding model and LanceDB stay cold until first use / warm-up")
+    check(result["ready_status"] == 503, "/ready reports not-ready before the bot is polling")
+    finish()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    default = os.path.join(tempfile.gettempdir(), "jarvis_importtime.txt")
+    main(args[args.index("--out") + 1] if "--out" in args else default)
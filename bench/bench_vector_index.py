@@ -0,0 +1,135 @@
+"""
+user-016: Synthetic Knowledge Table (10k → 1M Row) ပေါ်မှာ Brute-force Scan (အဟောင်း) နဲ့ ensure_indexes() က ဆောက်တဲ့
+ANN (IVF_PQ + nprobes/refine) Index ရဲ့ Recall@10 နဲ့ Latency ကို နှိုင်းယှဉ်မယ်၊ category Prefilter ပါတဲ့ Query ကိုလည်း တိုင်းမယ်
+Vector တွေကို Embedding Model မသုံးဘဲ Table ထဲ တိုက်ရိုက်ထည့်မယ် (Ground Truth ကို numpy နဲ့ တွက်မယ်)
+    python -m bench.bench_vector_index [max_rows]
+"""
+import sys
+import time
+import shutil
+from datetime import datetime
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("vectors")
+from config import Config  # noqa: E402
+from memory import vector_storage as storage_module  # noqa: E402
+
+try:
+    import numpy as np
+    import pyarrow as pa
+except ImportError:
+    np = pa = None
+
+K = 10
+QUERIES = 50
+CLUSTERS = 256
+CATEGORIES = storage_module.KNOWLEDGE_CATEGORIES
+NPROBE_SWEEP = (5, 10, 40, 80)  # အကြီးဆုံး Size မှာ Config Default အပြင် ဒီ nprobes တွေနဲ့ပါ Recall/Latency Trade-off ကို ပြမယ်
+
+def synthetic_vectors(rng, count: int, centers):
+    """Embedding တွေလို Topic အလိုက် စုနေအောင် Cluster Center ပတ်လည်မှာ ထုတ်ပြီး Unit Length ဖြစ်အောင် Normalize လုပ်မယ်"""
+    vectors = centers[rng.integers(0, len(centers), count)] + rng.normal(0, 0.35, (count, centers.shape[1]))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+def grow(storage, rng, centers, vectors: list, categories: list, start: int, stop: int):
+    timestamp = datetime.now().isoformat()
+    for offset in range(start, stop, 50_000):
+        count = min(50_000, stop - offset)
+        batch = synthetic_vectors(rng, count, centers)
+        labels = [CATEGORIES[(offset + i) % len(CATEGORIES)] for i in range(count)]
+        storage.table.add(pa.table({
+            "id": [f"row-{offset + i}" for i in range(count)],
+            "category": labels,
+            "task_or_query": [f"synthetic task {offset + i}" for i in range(count)],
+            "solution": [""] * count,
+            "code_snippet": [""] * count,
+            "timestamp": [timestamp] * count,
+            "vector": pa.FixedSizeListArray.from_arrays(pa.array(batch.ravel()), storage.VECTOR_DIM),
+        }))
+        vectors.append(batch)
+        categories.extend(labels)
+
+def ground_truth(matrix, labels, query, category: str = None) -> set:
+    distances = ((matrix - query) ** 2).sum(axis=1)
+    if category:
+        distances = np.where(labels == category, distances, np.inf)
+    return {f"row-{i}" for i in np.argpartition(distances, K)[:K]}
+
+def measure(search, queries, truths) -> tuple:
+    latencies, recalls = [], []
+    for (query, category), truth in zip(queries, truths):
+        started = time.perf_counter()
+        results = search(query, category)
+        latencies.append(elapsed_ms(started))
+        recalls.append(len(truth & {r["id"] for r in results}) / K)
+    return summarize(latencies), round(sum(recalls) / len(recalls), 3)
+
+def main(max_rows: int):
+    if np is None or not storage_module.VectorStorage()._ensure_table():
+        print("⚠️ lancedb / numpy unavailable - nothing to benchmark.")
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+        return
+
+    rng = np.random.default_rng(16)
+    centers = rng.normal(0, 1, (CLUSTERS, storage_module.VectorStorage.VECTOR_DIM))
+    Config.VECTOR_INDEX_MIN_ROWS = 1  # Size တိုင်းမှာ Index ဆောက်ပြီး တိုင်းမယ်
+    storage = storage_module.VectorStorage()
+    storage._ensure_table()
+
+    def brute(query, category):
+        search = storage.table.search(query, vector_column_name="vector").bypass_vector_index().limit(K)
+        if category:
+            search = search.where(f"category = '{category}'", prefilter=True)
+        return search.to_list()
+
+    def ann(query, category):
+        return storage._vector_search(query, K, category)
+
+    sizes = [n for n in (10_000, 100_000, 1_000_000) if n < max_rows] + [max_rows]
+    vectors, categories, rows, filled = [], [], [], 0
+    for size in sizes:
+        grow(storage, rng, centers, vectors, categories, filled, size)
+        filled = size
+        matrix, labels = np.concatenate(vectors), np.array(categories)
+        started = time.perf_counter()
+        storage.ensure_indexes(force=True)
+        build_s = time.perf_counter() - started
+
+        picks = rng.integers(0, size, QUERIES)
+        for category in (None, "Mistake"):
+            queries = [(matrix[i] + rng.normal(0, 0.05, matrix.shape[1]).astype(np.float32), category) for i in picks]
+            truths = [ground_truth(matrix, labels, query, category) for query, _ in queries]
+            if category is None:
+                unfiltered = (queries, truths)
+            for name, search in (("brute force", brute), ("ANN index", ann)):
+                latency, recall = measure(search, queries, truths)
+                rows.append({"rows": size, "filter": category or "-", "path": name, "recall@10": recall,
+                             "p50_ms": latency["p50_ms"], "p95_ms": latency["p95_ms"],
+                             "build_s": round(build_s, 1) if name == "ANN index" else "-"})
+
+    default_nprobes = Config.VECTOR_SEARCH_NPROBES
+    sweep = []
+    for nprobes in sorted(set(NPROBE_SWEEP) | {default_nprobes}):
+        Config.VECTOR_SEARCH_NPROBES = nprobes
+        latency, recall = measure(ann, *unfiltered)
+        sweep.append({"nprobes": nprobes, "recall@10": recall, "p50_ms": latency["p50_ms"], "p95_ms": latency["p95_ms"]})
+    Config.VECTOR_SEARCH_NPROBES = default_nprobes
+    print_table(f"Vector search recall vs latency (nprobes={Config.VECTOR_SEARCH_NPROBES}, "
+                f"refine_factor={Config.VECTOR_SEARCH_REFINE_FACTOR})", rows)
+    print_table(f"ANN nprobes sweep at {sizes[-1]} rows (unfiltered)", sweep)
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    largest = [row for row in rows if row["rows"] == sizes[-1]]
+    for category in ("-", "Mistake"):
+        brute_row, ann_row = (row for row in largest if row["filter"] == category)
+        label = "category-prefiltered" if category != "-" else "unfiltered"
+        check(ann_row["recall@10"] >= 0.85, f"{label} ANN recall@10 stays >= 0.85 at {sizes[-1]} rows ({ann_row['recall@10']})")
+        check(ann_row["p50_ms"] < brute_row["p50_ms"],
+              f"{label} ANN p50 beats brute force at {sizes[-1]} rows ({ann_row['p50_ms']} vs {brute_row['p50_ms']}ms)")
+    check(sweep[-1]["recall@10"] >= sweep[0]["recall@10"], "more nprobes never lowers recall")
+    finish()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+_failures: List[str] = []
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+def summarize(values_ms: List[float]) -> Dict[str, float]:
+    """Latency List (ms) ကို p50 / p95 / max အဖြစ် ချုံ့မယ်"""
+    return {
+        "n": len(values_ms),
+        "p50_ms": round(percentile(values_ms, 50), 2),
+        "p95_ms": round(percentile(values_ms, 95), 2),
+        "max_ms": round(max(values_ms), 2) if values_ms else 0.0,
+    }
+
+def print_table(title: str, rows: List[dict]):
+    print(f"\n📊 {title}")
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(str(c)), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  " + "  ".join(str(c).ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  " + "  ".join(str(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+def check(condition: bool, message: str) -> bool:
+    """Request က ပြောထားတဲ့ Behaviour ကို စစ်မယ် (မမှန်ရင် finish() မှာ Exit 1)"""
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        _failures.append(message)
+    return condition
+
+def finish():
+    if _failures:
+        print(f"\n❌ {len(_failures)} check(s) failed.")
+        sys.exit(1)
+    print("\n✅ All checks passed.")
+
+class LoopLagProbe:
+    """
+    async with LoopLagProbe() as probe: ...
+    interval တိုင်း နိုးဖို့ Sleep ပြီး တကယ်နိုးတဲ့အချိန် ဘယ်လောက်နောက်ကျလဲ (Event Loop Block ဖြစ်တာ) ကို တိုင်းမယ်
+    """
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags_ms: List[float] = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags_ms.append(max(loop.time() - expected, 0.0) * 1000)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.lags_ms) if self.lags_ms else 0.0
+
+    @property
+    def p95_ms(self) -> float:
+        return percentile(self.lags_ms, 95)
+
+class FixtureServer:
+    """
+    Local HTTP Fixture (Keep-alive HTTP/1.1) - Thread တစ်ခုမှာ Run မယ်
+    handler(method, path, headers, body) -> (status, headers_dict, body_bytes)
+    TCP Connection အသစ် / Request အရေအတွက်ကို ရေတွက်ထားမယ်
+    """
+    def __init__(self, handler: Callable):
+        fixture = self
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with fixture._lock:
+                    fixture.connections += 1
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                with fixture._lock:
+                    fixture.requests += 1
+                status, headers, payload = handler(self.command, self.path, self.headers, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_HEAD = _serve
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self):
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+def use_temp_storage(prefix: str) -> str:
+    """
+    memory/ ထဲက Singleton တွေ (SQLite / LanceDB / Embedding Cache / Page Cache) Repo ထဲက DB တွေကို မထိအောင်
+    Temp Directory ဆီ ပြောင်းမယ် - memory.* / core.page_cache ကို Import မလုပ်ခင် ခေါ်ရမယ်
+    """
+    from config import Config
+    workdir = tempfile.mkdtemp(prefix=f"jarvis-bench-{prefix}-")
+    Config.MEMORY_DB_PATH = os.path.join(workdir, "jarvis_chat.db")
+    Config.VECTOR_DB_PATH = os.path.join(workdir, "knowledge_lance")
+    Config.EMBEDDING_CACHE_PATH = os.path.join(workdir, "embedding_cache.db")
+    Config.PAGE_CACHE_PATH = os.path.join(workdir, "page_cache.db")
+    return workdir
+
+def elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
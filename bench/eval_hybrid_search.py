@@ -0,0 +1,155 @@
+"""
+user-018: Label တပ်ထားတဲ့ Knowledge / Query Set ပေါ်မှာ Vector-only Search (အဟောင်း) နဲ့ hybrid_search (Full-text + Vector RRF)
+ရဲ့ Recall@k, MRR နဲ့ Latency ကို Offline တိုင်းမယ် (Error Code / Package Name လို Exact Token Query နဲ့ Paraphrase Query ခွဲပြမယ်)
+Sentence-Transformer မရှိရင် Word + Character Trigram ကို Hash လုပ်တဲ့ Lexical Embedder နဲ့ Pipeline ကိုပဲ စစ်မယ်
+    python -m bench.eval_hybrid_search [k]
+"""
+import sys
+import time
+import shutil
+import hashlib
+from datetime import datetime
+
+from bench.common import check, elapsed_ms, finish, print_table, summarize, use_temp_storage
+
+WORKDIR = use_temp_storage("hybrid")
+from memory import vector_storage as storage_module  # noqa: E402
+
+# (id, category, task_or_query, solution, code_snippet)
+KNOWLEDGE = [
+    ("nginx-502", "Mistake", "nginx returns 502 Bad Gateway after deploy", "upstream uvicorn was not running; restart the service before reloading nginx", "sudo systemctl restart jarvis && sudo nginx -s reload"),
+    ("pep668", "Mistake", "pip install fails on the server", "Debian marks the system python as externally-managed-environment (PEP 668); install inside a venv", "python3 -m venv .venv && .venv/bin/pip install -r requirements.txt"),
+    ("sqlite-locked", "Mistake", "database is locked error from the memory store", "two writers raced; enable WAL and route writes through one connection", "PRAGMA journal_mode=WAL;"),
+    ("tg-429", "Mistake", "telegram bot stops replying under load", "Telegram answered 429 Too Many Requests; honour retry_after before editing the message again", ""),
+    ("git-nonff", "Mistake", "git push was rejected", "the remote had new commits (non-fast-forward); pull with rebase first", "git pull --rebase origin main && git push"),
+    ("playwright-deps", "Mistake", "headless browser fails to launch", "chromium is missing system libraries", "playwright install-deps chromium"),
+    ("disk-full", "Mistake", "writes fail with No space left on device", "/var/log filled the disk; vacuum the journal", "journalctl --vacuum-size=200M"),
+    ("oom-kill", "Mistake", "background job disappears without a traceback", "the kernel OOM killer ended it (exit code 137); lower the batch size", "dmesg | grep -i 'killed process'"),
+    ("cors", "Mistake", "browser blocks calls from the dashboard", "the API did not send Access-Control-Allow-Origin; add CORSMiddleware", ""),
+    ("ssl-expired", "Mistake", "https requests fail with CERTIFICATE_VERIFY_FAILED", "the Let's Encrypt certificate expired; renew it", "sudo certbot renew"),
+    ("venv", "Skill", "create an isolated python environment", "use the standard venv module and activate it", "python3 -m venv .venv && source .venv/bin/activate"),
+    ("systemd-unit", "Skill", "run the bot as a service that restarts on crash", "write a systemd unit with Restart=always", "[Service]\nExecStart=/opt/jarvis/.venv/bin/python main.py\nRestart=always"),
+    ("cron-backup", "Skill", "back up the memory database every night", "schedule sqlite3 .backup from cron at 3am", "0 3 * * * sqlite3 memory/jarvis_memory.db '.backup /backup/jarvis.db'"),
+    ("port-in-use", "Skill", "find which process is using a port", "ss lists listening sockets with the owning pid", "ss -ltnp | grep :8000"),
+    ("tail-logs", "Skill", "follow the service logs live", "journalctl can follow one unit", "journalctl -u jarvis -f"),
+    ("docker-prune", "Skill", "free disk space used by old containers and images", "prune stopped containers, dangling images and build cache", "docker system prune -af"),
+    ("ffmpeg-audio", "Skill", "convert a voice note to wav for transcription", "ffmpeg can resample ogg/opus to 16 kHz mono wav", "ffmpeg -i voice.ogg -ar 16000 -ac 1 voice.wav"),
+    ("uvicorn-workers", "Skill", "serve the api with more than one process", "start uvicorn with several workers behind nginx", "uvicorn main:app --workers 4 --host 127.0.0.1"),
+    ("env-file", "Fact", "where the API keys are configured", "keys are read from the .env file at startup via python-dotenv", ""),
+    ("timezone", "Fact", "which timezone the scheduler uses", "reminders are scheduled in Asia/Yangon", ""),
+    ("model-name", "Fact", "which embedding model the knowledge base uses", "all-MiniLM-L6-v2 with 384 dimensional vectors", ""),
+    ("owner", "Fact", "who is allowed to run shell commands", "only the owner's telegram id in ADMIN_USER_ID may use shell_exec", ""),
+    ("backup-dir", "Fact", "where nightly backups are stored", "backups go to /backup on the second disk", ""),
+    ("lance-path", "Fact", "where the vector knowledge table lives on disk", "memory/knowledge_lance holds the LanceDB table", ""),
+]
+
+# (query, relevant ids, kind) - "exact" က Error Code / Flag / Package Name ပါတဲ့ Query, "paraphrase" က အဓိပ္ပာယ်တူ စကားပြောင်း
+QUERIES = [
+    ("502", {"nginx-502"}, "exact"),
+    ("externally-managed-environment", {"pep668"}, "exact"),
+    ("error 429 from telegram", {"tg-429"}, "exact"),
+    ("CERTIFICATE_VERIFY_FAILED", {"ssl-expired"}, "exact"),
+    ("exit code 137", {"oom-kill"}, "exact"),
+    ("non-fast-forward", {"git-nonff"}, "exact"),
+    ("journalctl --vacuum-size", {"disk-full"}, "exact"),
+    ("install-deps chromium", {"playwright-deps"}, "exact"),
+    ("CORSMiddleware", {"cors"}, "exact"),
+    ("Restart=always", {"systemd-unit"}, "exact"),
+    ("ss -ltnp", {"port-in-use"}, "exact"),
+    ("docker system prune", {"docker-prune"}, "exact"),
+    ("website shows bad gateway after I deployed", {"nginx-502"}, "paraphrase"),
+    ("cannot install python packages with pip on the server", {"pep668", "venv"}, "paraphrase"),
+    ("the sqlite store says it is locked", {"sqlite-locked"}, "paraphrase"),
+    ("how do I keep the bot running after a crash", {"systemd-unit"}, "paraphrase"),
+    ("nightly backup of the memory database", {"cron-backup", "backup-dir"}, "paraphrase"),
+    ("which process is listening on port 8000", {"port-in-use"}, "paraphrase"),
+    ("disk is full and writes fail", {"disk-full", "docker-prune"}, "paraphrase"),
+    ("turn a telegram voice note into wav", {"ffmpeg-audio"}, "paraphrase"),
+    ("where are the api keys configured", {"env-file"}, "paraphrase"),
+    ("what embedding model does the knowledge base use", {"model-name"}, "paraphrase"),
+]
+
+def lexical_embed(texts: list) -> list:
+    """Word + Character Trigram တွေကို 384 Dim ထဲ Hash လုပ်ပြီး Normalize (Model မရှိတဲ့ Environment အတွက်ပဲ)"""
+    vectors = []
+    for text in texts:
+        vector = [0.0] * storage_module.VectorStorage.VECTOR_DIM
+        lowered = text.lower()
+        features = lowered.split() + [lowered[i:i + 3] for i in range(len(lowered) - 2)]
+        for feature in features:
+            digest = hashlib.md5(feature.encode()).digest()
+            vector[int.from_bytes(digest[:4], "little") % len(vector)] += 1.0 if digest[4] & 1 else -1.0
+        norm = sum(v * v for v in vector) ** 0.5 or 1.0
+        vectors.append([v / norm for v in vector])
+    return vectors
+
+def load_embedder(storage):
+    try:
+        storage_module.embed_fn.compute_source_embeddings(["warm the model up"])
+        return storage_module.embed_fn.compute_source_embeddings, "sentence-transformers"
+    except Exception as e:
+        print(f"⚠️ Embedding model unavailable ({e}) - using a hashed lexical embedder.")
+        storage._embed = lexical_embed
+        return lexical_embed, "hashed lexical"
+
+def seed(storage, embed):
+    timestamp = datetime.now().isoformat()
+    vectors = embed([task for _, _, task, _, _ in KNOWLEDGE])
+    storage.table.add([
+        {"id": doc_id, "category": category, "task_or_query": task, "solution": solution,
+         "code_snippet": code, "timestamp": timestamp, "vector": vector}
+        for (doc_id, category, task, solution, code), vector in zip(KNOWLEDGE, vectors)
+    ])
+    storage.ensure_indexes()
+
+def evaluate(search, k: int) -> dict:
+    """Query Kind အလိုက် Recall@1 / Recall@k / MRR နဲ့ Latency"""
+    per_kind = {}
+    for query, relevant, kind in QUERIES:
+        started = time.perf_counter()
+        ranked = [res["id"] for res in search(query, k)][:k]
+        latency = elapsed_ms(started)
+        first_hit = next((rank for rank, doc_id in enumerate(ranked, 1) if doc_id in relevant), None)
+        stats = per_kind.setdefault(kind, {"latencies": [], "hit@1": 0, f"hit@{k}": 0, "rr": 0.0, "n": 0})
+        stats["latencies"].append(latency)
+        stats["n"] += 1
+        stats["hit@1"] += first_hit == 1
+        stats[f"hit@{k}"] += first_hit is not None
+        stats["rr"] += 1 / first_hit if first_hit else 0.0
+    per_kind["all"] = {
+        key: sum((s[key] for s in per_kind.values()), [] if key == "latencies" else 0)
+        for key in ("latencies", "hit@1", f"hit@{k}", "rr", "n")
+    }
+    return {kind: {"recall@1": round(s["hit@1"] / s["n"], 3), f"recall@{k}": round(s[f"hit@{k}"] / s["n"], 3),
+                   "mrr": round(s["rr"] / s["n"], 3), **summarize(s["latencies"])}
+            for kind, s in per_kind.items()}
+
+def main(k: int):
+    storage = storage_module.VectorStorage()
+    if not storage._ensure_table():
+        print("⚠️ lancedb unavailable - nothing to evaluate.")
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+        return
+    embed, source = load_embedder(storage)
+    seed(storage, embed)
+
+    def vector_only(query, limit):
+        return storage._vector_search(storage._embed([query])[0], limit)
+
+    results = {"vector only": evaluate(vector_only, k), "hybrid (RRF)": evaluate(storage.hybrid_search, k)}
+    rows = [{"path": path, "queries": kind, **metrics}
+            for path, by_kind in results.items() for kind, metrics in sorted(by_kind.items())]
+    print_table(f"Knowledge retrieval on {len(QUERIES)} labeled queries ({source} embeddings, "
+                f"FTS columns: {storage._index_state.get('fts', [])})", rows)
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    vector, hybrid = results["vector only"], results["hybrid (RRF)"]
+    check(hybrid["exact"][f"recall@{k}"] > vector["exact"][f"recall@{k}"],
+          f"hybrid finds more exact-token queries ({hybrid['exact'][f'recall@{k}']} vs {vector['exact'][f'recall@{k}']})")
+    check(hybrid["paraphrase"][f"recall@{k}"] >= vector["paraphrase"][f"recall@{k}"],
+          f"hybrid keeps paraphrase recall ({hybrid['paraphrase'][f'recall@{k}']} vs {vector['paraphrase'][f'recall@{k}']})")
+    check(hybrid["all"]["mrr"] >= vector["all"]["mrr"], f"overall MRR does not regress ({hybrid['all']['mrr']} vs {vector['all']['mrr']})")
+    finish()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -1,6 +1,5 @@
 import os
 from dotenv import load_dotenv
-from itertools import cycle
 import pytz
 # .env ဖိုင်ထဲက အချက်အလက်တွေကို ဆွဲယူခြင်း
 load_dotenv()
@@ -31,15 +30,42 @@ class Config:
         # ကော်မာ (,) ခံထားတဲ့ Key တွေကို ခွဲထုတ်ပြီး စာရင်းလုပ်မယ်
         API_KEYS = [k.strip() for k in _keys_str.split(",") if k.strip()]
     
-    # Key တွေကို အလှည့်ကျ ယူသုံးဖို့ Cycle လုပ်ထားမယ်
-    _key_cycle = cycle(API_KEYS) if API_KEYS else None
+    # Key တစ်ခုချင်းစီရဲ့ Rate Limit (core/key_scheduler.py က သုံးမယ်)
+    KEY_RPM_LIMIT = int(os.getenv("GEMINI_KEY_RPM", 10))          # Key တစ်ခု တစ်မိနစ် Request အရေအတွက်
+    KEY_COOLDOWN_SECONDS = float(os.getenv("GEMINI_KEY_COOLDOWN", 15))  # 429 ရရင် အခြေခံ နားချိန်
+    KEY_MAX_COOLDOWN = float(os.getenv("GEMINI_KEY_MAX_COOLDOWN", 300))
+    KEY_MAX_WAIT = float(os.getenv("GEMINI_KEY_MAX_WAIT", 60))    # Key အားလုံး နားနေရင် အများဆုံးစောင့်မယ့်အချိန်
 
     @classmethod
     def get_next_api_key(cls):
-        """Next available API key ကို ထုတ်ပေးမယ့် Function"""
-        if not cls._key_cycle:
-            raise ValueError("❌ No API Keys available! Check your .env file.")
-        return next(cls._key_cycle)
+        """Next available API key ကို ထုတ်ပေးမယ့် Function (Rate-Limit Aware Scheduler မှတဆင့်)"""
+        from core.key_scheduler import key_scheduler
+        return key_scheduler.pick_nowait()
+
+    # Role အလိုက် System Instruction + Tool Declarations ကို Gemini Context Cache ထဲ သိမ်းမယ်
+    CONTEXT_CACHE_ENABLED = os.getenv("CONTEXT_CACHE_ENABLED", "true").lower() == "true"
+    CONTEXT_CACHE_TTL = int(os.getenv("CONTEXT_CACHE_TTL", 3600))            # စက္ကန့်
+    CONTEXT_CACHE_REFRESH_MARGIN = int(os.getenv("CONTEXT_CACHE_REFRESH_MARGIN", 300))  # TTL မကုန်ခင် ကြိုတိုးမယ့်အချိန်
+
+    # ReAct Loop ရဲ့ Prompt Budget (core/context_budget.py)
+    MAX_PROMPT_TOKENS = int(os.getenv("MAX_PROMPT_TOKENS", 60000))               # Request တစ်ခုရဲ့ Token Ceiling
+    CONTEXT_KEEP_RECENT_TOOL_OUTPUTS = int(os.getenv("CONTEXT_KEEP_RECENT_TOOL_OUTPUTS", 2))  # မူရင်းအတိုင်း ထားမယ့် Output အရေအတွက်
+    TOOL_OUTPUT_EXCERPT_CHARS = int(os.getenv("TOOL_OUTPUT_EXCERPT_CHARS", 1500))  # Output အဟောင်းရဲ့ Head/Tail အရှည်
+
+    # Final Answer ကို Telegram ဆီ Streaming နဲ့ တဖြည်းဖြည်း ပို့မယ်
+    STREAM_RESPONSES = os.getenv("STREAM_RESPONSES", "true").lower() == "true"
+    STREAM_EDIT_INTERVAL = float(os.getenv("STREAM_EDIT_INTERVAL", 1.5))  # Telegram Edit Rate Limit မထိအောင် (စက္ကန့်)
+    STREAM_MIN_CHARS = int(os.getenv("STREAM_MIN_CHARS", 40))              # ဒီလောက်ရမှ ပထမ Message ကို ပို့မယ်
+
+    # Role အလိုက် Agent တွေကို ကြိုဆောက်ပြီး ပြန်သုံးမယ့် Pool (core/agent_pool.py)
+    AGENT_POOL_MAX_IDLE = int(os.getenv("AGENT_POOL_MAX_IDLE", 2))  # Role တစ်ခုမှာ အားနေတဲ့ Agent အများဆုံး
+    AGENT_POOL_WARM_ROLES = [r.strip() for r in os.getenv("AGENT_POOL_WARM_ROLES", "ceo,sysadmin,researcher,web_surfer").split(",") if r.strip()]
+
+    # Server တက်ပြီးတာနဲ့ Agent Pool / Embedding Model ကို Background မှာ ကြိုနှိုးထားမယ် (false = ပထမဆုံး သုံးမှ Load)
+    WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+
+    # Tool Registry ကို Dirty မဖြစ်ရင်တောင် ဘယ်နှစ်စက္ကန့်တစ်ခါ ပြန်စစ်မလဲ (0 = manage_file ရေးမှပဲ စစ်မယ်)
+    TOOL_RESCAN_INTERVAL = float(os.getenv("TOOL_RESCAN_INTERVAL", 60))
 
     # --- 📡 Connectivity ---
     TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
@@ -49,13 +75,106 @@ class Config:
     # --- 💾 Memory Paths ---
     # Chat History သိမ်းမယ့် SQLite DB
     MEMORY_DB_PATH = os.path.join("memory", "jarvis_chat.db")
+    # SQLite Connection Pool / Pragma များ (memory/sql_storage.py)
+    SQL_READER_POOL_SIZE = int(os.getenv("SQL_READER_POOL_SIZE", 3))  # Reader Connection အရေအတွက်
+    SQL_CACHE_SIZE_KB = int(os.getenv("SQL_CACHE_SIZE_KB", 8192))  # Connection တစ်ခုချင်းစီရဲ့ Page Cache (KiB)
+    SQL_MMAP_SIZE = int(os.getenv("SQL_MMAP_SIZE", 64 * 1024 * 1024))  # Memory-mapped I/O (Bytes)
+    # Chat Message / Task Insert တွေကို Buffer ပြီး Transaction တစ်ခုတည်းနဲ့ ရေးမယ် (Write-behind)
+    WRITE_BUFFER_MAX_ROWS = int(os.getenv("WRITE_BUFFER_MAX_ROWS", 50))
+    WRITE_BUFFER_FLUSH_INTERVAL = float(os.getenv("WRITE_BUFFER_FLUSH_INTERVAL", 1.0))  # စက္ကန့်
+    WRITE_BUFFER_MAX_BACKOFF = float(os.getenv("WRITE_BUFFER_MAX_BACKOFF", 30.0))  # Flush ဆက်တိုက် ကျရှုံးရင် ပြန်ကြိုးစားမယ့် အများဆုံးကြားကာလ
+    # MemoryController Async API ရဲ့ Thread Pool များ (SQL နဲ့ Vector/Embedding ကို ခွဲထားမယ်)
+    MEMORY_SQL_WORKERS = int(os.getenv("MEMORY_SQL_WORKERS", 4))
+    MEMORY_VECTOR_WORKERS = int(os.getenv("MEMORY_VECTOR_WORKERS", 1))  # Embedding Model က CPU ကိုပဲ သုံးလို့ 1 ခု
+    # Chat History Retention (tasks/maintenance.py) - ဒီထက်ဟောင်း/များရင် Archive Table ထဲ ချုံ့ပြီး ရွှေ့မယ်
+    CHAT_RETENTION_DAYS = float(os.getenv("CHAT_RETENTION_DAYS", 30))
+    CHAT_RETENTION_MAX_ROWS = int(os.getenv("CHAT_RETENTION_MAX_ROWS", 5000))  # User တစ်ယောက်ချင်းစီ
+    MEMORY_MAINTENANCE_CRON = os.getenv("MEMORY_MAINTENANCE_CRON", "30 3 * * *")  # နေ့တိုင်း မနက် ၃:၃၀
+    SQL_AUTO_VACUUM_CONVERT = os.getenv("SQL_AUTO_VACUUM_CONVERT", "true").lower() == "true"  # DB အဟောင်းကို Maintenance မှာ INCREMENTAL ပြောင်းမယ် (VACUUM တစ်ကြိမ် - Disk ၂ ဆ လို)
     # Knowledge Base သိမ်းမယ့် Vector DB
     VECTOR_DB_PATH = os.path.join("memory", "knowledge_lance")
+    EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+    # Knowledge Table ဒီလောက်ကျော်မှ ANN (IVF_PQ) Index ဆောက်မယ်၊ Index လုပ်ပြီးချိန်ထက် GROWTH ဆ များလာရင် ပြန်ဆောက်မယ်
+    VECTOR_INDEX_MIN_ROWS = int(os.getenv("VECTOR_INDEX_MIN_ROWS", 5000))
+    VECTOR_INDEX_REBUILD_GROWTH = float(os.getenv("VECTOR_INDEX_REBUILD_GROWTH", 2.0))
+    VECTOR_SEARCH_NPROBES = int(os.getenv("VECTOR_SEARCH_NPROBES", 20))      # ANN Search မှာ စစ်မယ့် Partition အရေအတွက်
+    # Hybrid Retrieval (Full-text + Vector) ကို Reciprocal Rank Fusion နဲ့ ပေါင်းမယ်
+    HYBRID_VECTOR_WEIGHT = float(os.getenv("HYBRID_VECTOR_WEIGHT", 1.0))
+    HYBRID_FTS_WEIGHTS = {  # Column အလိုက် Full-text Weight (Error Code / Package Name တွေက code_snippet, solution ထဲမှာ ရှိတတ်)
+        "task_or_query": float(os.getenv("HYBRID_FTS_WEIGHT_TASK", 1.0)),
+        "solution": float(os.getenv("HYBRID_FTS_WEIGHT_SOLUTION", 0.7)),
+        "code_snippet": float(os.getenv("HYBRID_FTS_WEIGHT_CODE", 0.5)),
+    }
+    HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", 60))
+    HYBRID_MAX_DISTANCE = float(os.getenv("HYBRID_MAX_DISTANCE", 1.2))              # Full-text မထိရင် Vector တစ်ခုတည်းနဲ့ လက်ခံမယ့် Distance
+    HYBRID_SHORT_QUERY_MAX_DISTANCE = float(os.getenv("HYBRID_SHORT_QUERY_MAX_DISTANCE", 1.0))  # စကားလုံး ၂ လုံးအောက် Query
+    # Knowledge Save မှာ Category တူပြီး ဒီ Distance (Squared L2) အောက်ဆိုရင် Near-duplicate အဖြစ် သတ်မှတ်မယ်
+    KNOWLEDGE_DEDUP_DISTANCE = float(os.getenv("KNOWLEDGE_DEDUP_DISTANCE", 0.1))  # 0 = ပိတ်မယ် (≈ cosine 0.95)
+    KNOWLEDGE_DEDUP_POLICY = os.getenv("KNOWLEDGE_DEDUP_POLICY", "update")         # skip / update / merge
+    KNOWLEDGE_DEDUP_SCAN_BATCH = int(os.getenv("KNOWLEDGE_DEDUP_SCAN_BATCH", 2000))  # Offline Dedup မှာ တစ်ခါဖတ်မယ့် Row (Vector မပါ)
+    KNOWLEDGE_MERGE_MAX_CHARS = int(os.getenv("KNOWLEDGE_MERGE_MAX_CHARS", 4000))
+    KNOWLEDGE_DEDUP_ON_MAINTENANCE = os.getenv("KNOWLEDGE_DEDUP_ON_MAINTENANCE", "true").lower() == "true"
+    # Knowledge Save တွေကို Buffer ပြီး Batch အလိုက် ထည့်မယ် (Lance Fragment အသေးလေးတွေ မပွားအောင်)
+    VECTOR_INSERT_BATCH_SIZE = int(os.getenv("VECTOR_INSERT_BATCH_SIZE", 16))
+    VECTOR_INSERT_FLUSH_INTERVAL = float(os.getenv("VECTOR_INSERT_FLUSH_INTERVAL", 5.0))  # စက္ကန့်
+    VECTOR_INSERT_MAX_ATTEMPTS = int(os.getenv("VECTOR_INSERT_MAX_ATTEMPTS", 3))  # ဒီအကြိမ်ထက် ပိုကျရှုံးတဲ့ Item ကို Log ထုတ်ပြီး ပစ်မယ်
+    VECTOR_VERSION_RETENTION_DAYS = int(os.getenv("VECTOR_VERSION_RETENTION_DAYS", 7))  # ဒီထက်ဟောင်းတဲ့ Table Version တွေကို ရှင်းမယ်
+    KNOWLEDGE_MAINTENANCE_CRON = os.getenv("KNOWLEDGE_MAINTENANCE_CRON", "0 4 * * *")  # နေ့တိုင်း မနက် ၄:၀၀
+    VECTOR_SEARCH_REFINE_FACTOR = int(os.getenv("VECTOR_SEARCH_REFINE_FACTOR", 5))  # PQ Distance ကို မူရင်း Vector နဲ့ ပြန်စစ်မယ်
+    # Knowledge Search/Save အတွက် Embedding Cache (memory/embedding_cache.py)
+    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 2048))            # In-memory LRU Entry အရေအတွက်
+    EMBEDDING_CACHE_DISK = os.getenv("EMBEDDING_CACHE_DISK", "true").lower() == "true"
+    EMBEDDING_CACHE_PATH = os.path.join("memory", "embedding_cache.db")
+    EMBEDDING_CACHE_MAX_DISK_ROWS = int(os.getenv("EMBEDDING_CACHE_MAX_DISK_ROWS", 50000))
+
+    # --- 💻 Shell Settings (tools/system/shell.py) ---
+    SHELL_TIMEOUT = float(os.getenv("SHELL_TIMEOUT", 60))                 # Command တစ်ခုရဲ့ အများဆုံးကြာချိန် (စက္ကန့်)
+    SHELL_KILL_GRACE = float(os.getenv("SHELL_KILL_GRACE", 2.0))          # SIGTERM ပြီး ဒီလောက်စောင့်၊ မသေသေးရင် SIGKILL
+    SHELL_OUTPUT_HEAD_CHARS = int(os.getenv("SHELL_OUTPUT_HEAD_CHARS", 4000))  # Stream တစ်ခုချင်းစီရဲ့ အစပိုင်း
+    SHELL_OUTPUT_TAIL_CHARS = int(os.getenv("SHELL_OUTPUT_TAIL_CHARS", 6000))  # Stream တစ်ခုချင်းစီရဲ့ နောက်ဆုံးပိုင်း (Ring Buffer)
+    SHELL_PROGRESS_INTERVAL = float(os.getenv("SHELL_PROGRESS_INTERVAL", 5.0))  # Telegram Status ကို ဘယ်နှစ်စက္ကန့်ခြား Update မလဲ
+    # Agent Run တစ်ခုလုံး Bash Session တစ်ခုတည်း သုံးမယ် (cd / venv / export တွေ Step ကြား မပျောက်အောင်)
+    SHELL_PERSISTENT_SESSION = os.getenv("SHELL_PERSISTENT_SESSION", "false").lower() == "true"
+    # Sandbox (core/sandbox.py) - Command တစ်ခုက Bot / Chromium ကို Swap / OOM ထဲ မတွန်းပို့အောင် (0 = မကန့်သတ်)
+    SHELL_LIMIT_CPU_SECONDS = int(os.getenv("SHELL_LIMIT_CPU_SECONDS", 120))   # Process တစ်ခုချင်းစီရဲ့ CPU Time
+    SHELL_LIMIT_MEMORY_MB = int(os.getenv("SHELL_LIMIT_MEMORY_MB", 1024))      # rlimit: Data Segment (Heap) / cgroup: memory.max
+    SHELL_LIMIT_ADDRESS_SPACE_MB = int(os.getenv("SHELL_LIMIT_ADDRESS_SPACE_MB", 0))  # RLIMIT_AS (0 = ပိတ်) - JVM / Go / Node က Virtual Memory အများကြီး Reserve လုပ်လို့ ပျက်တတ်
+    SHELL_LIMIT_OPEN_FILES = int(os.getenv("SHELL_LIMIT_OPEN_FILES", 1024))
+    SHELL_LIMIT_PROCESSES = int(os.getenv("SHELL_LIMIT_PROCESSES", 0))         # rlimit NPROC က User တစ်ယောက်လုံး (Bot Thread တွေပါ) ကို ရေတွက်လို့ cgroup နဲ့ပဲ သုံးသင့်
+    SHELL_NICE = int(os.getenv("SHELL_NICE", 10))                              # Bot ထက် CPU Priority နိမ့်အောင်
+    SHELL_IONICE_CLASS = os.getenv("SHELL_IONICE_CLASS", "best-effort")        # best-effort / idle / none
+    SHELL_IONICE_LEVEL = int(os.getenv("SHELL_IONICE_LEVEL", 7))               # best-effort 0 (မြင့်) - 7 (နိမ့်)
+    SHELL_CGROUP_ROOT = os.getenv("SHELL_CGROUP_ROOT", "")                     # ဥပမာ /sys/fs/cgroup/jarvis (Bot User ကို Delegate လုပ်ထားရမယ်)
+    SHELL_CGROUP_CPU_PERCENT = int(os.getenv("SHELL_CGROUP_CPU_PERCENT", 0))   # cgroup cpu.max (100 = Core တစ်ခုစာ)
+    SHELL_SAMPLE_INTERVAL = float(os.getenv("SHELL_SAMPLE_INTERVAL", 0.5))     # Peak RSS / CPU Sample ယူမယ့် ကြားကာလ
+    SHELL_REPORT_RESOURCES = os.getenv("SHELL_REPORT_RESOURCES", "true").lower() == "true"  # Agent ဆီ ပြန်ပြောမလား
 
     # --- 🦊 Browser / Search Settings ---
     # RAM 2GB VPS ဖြစ်လို့ Headless (မျက်နှာပြင်မပေါ်) ပဲ run မယ်
     HEADLESS_BROWSER = True
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    # Web Tool တွေ မျှသုံးမယ့် Async HTTP Client (core/http_pool.py)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 20))
+    HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", 10))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))   # စက္ကန့်
+    HTTP_PER_HOST_LIMIT = int(os.getenv("HTTP_PER_HOST_LIMIT", 4))           # Host တစ်ခုကို ပြိုင်တူ Request အများဆုံး
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10.0))
+    SCRAPER_MAX_BYTES = int(os.getenv("SCRAPER_MAX_BYTES", 2 * 1024 * 1024))  # ဒီထက်ကျော်ရင် Download ကို ဖြတ်မယ်
+    SCRAPER_MAX_CHARS = int(os.getenv("SCRAPER_MAX_CHARS", 10000))           # Agent ဆီ ပြန်ပို့မယ့် Markdown အရှည်
+    # read_page_content ရဲ့ On-disk Page Cache (core/page_cache.py)
+    PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true"
+    PAGE_CACHE_PATH = os.path.join("memory", "page_cache.db")
+    PAGE_CACHE_MAX_MB = int(os.getenv("PAGE_CACHE_MAX_MB", 100))              # zlib ချုံ့ပြီးသား Size
+    PAGE_CACHE_DEFAULT_TTL = float(os.getenv("PAGE_CACHE_DEFAULT_TTL", 3600))  # ဒီအတွင်း Network မထိဘူး၊ ကျော်ရင် Conditional GET
+    # Domain အလိုက် TTL (စက္ကန့်) - "domain=ttl,domain=ttl" (Subdomain တွေက Parent Domain ရဲ့ TTL ကို ယူမယ်)
+    PAGE_CACHE_DOMAIN_TTLS = {
+        domain.strip().lower(): float(ttl)
+        for domain, _, ttl in (
+            item.partition("=") for item in os.getenv(
+                "PAGE_CACHE_DOMAIN_TTLS", "news.google.com=600,reddit.com=600,docs.python.org=604800"
+            ).split(",") if "=" in item
+        )
+    }
 
     # --- ⚙️ Server Config ---
     HOST = os.getenv("HOST", "0.0.0.0")
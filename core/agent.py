@@ -4,24 +4,30 @@ import traceback
 import asyncio
 import uuid
 from typing import Dict, Any
+from google.genai import types
 
 # Core Modules
 from core.brain import JarvisBrain
 from core.reflector import JarvisReflector
 from core.registry import tool_registry
+from core.context_budget import ContextBudget
+from core.prompts.context_manager import context_manager
+from tools.base import tool_status_callback, tool_run_resources, close_run_resources
 from config import Config    
 
 # Logging Setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("JARVIS_AGENT")
 
+TOOL_LOOP_INSTRUCTION = "⚠️ CRITICAL INSTRUCTION: If the user's requested task is completely fulfilled, DO NOT call any more tools. Reply directly with the final text answer to the user in Burmese to conclude the task."
+
 class JarvisAgent:
     def __init__(self, role: str = "ceo"):
         """Jarvis Agent - The Executive Manager"""
         self.role = role
         logger.info(f"🤖 Initializing Agent [{self.role.upper()}]...")
         
-        # Agent အသစ်နိုးလာတိုင်း Tool အသစ်တွေ ရှိမရှိ အမြဲစစ်မယ် (Auto Reload Magic)
+        # Agent အသစ်နိုးလာတိုင်း Tool အသစ်တွေ ရှိမရှိ စစ်မယ် (Auto Reload Magic - ပြောင်းထားတာမရှိရင် Disk ကို မထိဘူး)
         tool_registry.reload_custom_tools()
         
         # Brain ဆီကို Role အတိအကျ ပို့ပေးမယ်
@@ -30,20 +36,52 @@ class JarvisAgent:
 
         logger.info(f"✅ Agent Online: {Config.BOT_NAME} v{Config.VERSION}")
 
+    def reset(self, reload_tools: bool = True):
+        """
+        Agent Pool က Checkout/Release လုပ်တိုင်း ခေါ်မယ် - ယခင် Run ရဲ့ State မကျန်အောင် ရှင်းမယ်
+        Tool Rescan ကို Checkout မှာပဲ လုပ်မယ် (Release မှာ reload_tools=False)
+        """
+        if reload_tools:
+            tool_registry.reload_custom_tools()
+        self.brain.reset_system_instruction()
+
     # 🔥 FIX: context_memory နဲ့ Status Update ကို လက်ခံအောင် ပြင်လိုက်ပြီ
-    async def chat(self, user_input: str, user_id: int = 0, chat_history: list = [], context_memory: str = "", send_status=None) -> str:
-        """The Main Loop (ReAct Architecture)"""
+    async def chat(self, user_input: str, user_id: int = 0, chat_history: list = [], context_memory: str = "", send_status=None, on_stream=None) -> str:
+        """The Main Loop (ReAct Architecture)
+        on_stream ပေးထားရင် Final Answer ကို Model ထုတ်နေရင်းနဲ့ တဖြည်းဖြည်း ပို့ပေးမယ် (Streaming Mode)
+        """
+        # ဒီ Run အတွင်း Tool တွေ မျှသုံးမယ့် Resource (Persistent Shell စသည်) - Run ပြီးတာနဲ့ ရှင်းမယ်
+        resources = {}
+        token = tool_run_resources.set(resources)
+        try:
+            return await self._react_loop(user_input, user_id, chat_history, context_memory, send_status, on_stream)
+        finally:
+            tool_run_resources.reset(token)
+            await close_run_resources(resources)
+
+    async def _react_loop(self, user_input: str, user_id: int, chat_history: list, context_memory: str, send_status, on_stream) -> str:
         logger.info(f"📩 User ({user_id}): {user_input}")
 
-        current_task_context = user_input
+        # Role-tagged Turns (History -> Context + User Input) ကနေ စမယ်၊ နောက်ပိုင်း Model/Tool Turn တွေကို နောက်ကပဲ ဆက်ဖြည့်မယ်
+        # User Profile ပါတဲ့ System Context ကို Conversation တစ်ခုမှာ တစ်ခါပဲ ယူမယ်
+        dynamic_context = await context_manager.aget_current_context()
+        contents = self.brain.build_contents(user_input, chat_history, context_memory, dynamic_context=dynamic_context)
+        # Tool Loop Instruction ကို Turn တိုင်း ထပ်မထည့်တော့ဘဲ လက်ရှိ User Turn မှာ တစ်ခါပဲ ထည့်မယ်
+        contents[-1].parts.append(types.Part(text=TOOL_LOOP_INSTRUCTION))
+        prefix_len = len(contents)
+        budget = ContextBudget()
         max_loops = 15 # Tool အများဆုံး 15 ခါ ဆက်တိုက်သုံးခွင့်ပေးမယ်
         loop_count = 0
 
         while loop_count < max_loops:
             loop_count += 1
             try:
+                # --- BUDGET --- (Tool Output အဟောင်းတွေကို ချုံ့ပြီး Token Ceiling အတွင်း ထိန်းမယ်)
+                prefix_len = budget.enforce(contents, prefix_len)
+                budget.report(contents, prefix_len, loop_count, self.role)
+
                 # --- THINK ---
-                response = await asyncio.to_thread(self.brain.think, current_task_context, chat_history, context_memory)
+                response = await self.brain.think(contents, on_text=on_stream)
 
                 # 🔥 FIX: Brain က API Object အစား စာသား (String) ပြန်ပို့လိုက်ရင် Crash မဖြစ်အောင် ကာကွယ်မယ်
                 if isinstance(response, str):
@@ -54,71 +92,44 @@ class JarvisAgent:
                         # Tool တွေသုံးနေရင်း ကြားထဲ Error တက်ရင် ဆက်မလုပ်တော့ဘဲ ရပ်မယ်
                         return f"အလုပ်လုပ်ဆောင်နေစဉ် အခက်အခဲဖြစ်သွားပါသည်။ (Error: {response})"
 
-                function_call = None
+                function_calls = []
+                model_parts = []
                 # 🔥 FIX: hasattr သုံးပြီး candidates ရှိမှသာ ဆက်အလုပ်လုပ်အောင် ကာကွယ်မယ်
                 if hasattr(response, 'candidates') and response.candidates and response.candidates[0].content.parts:
-                    for part in response.candidates[0].content.parts:
-                        if part.function_call:
-                            function_call = part.function_call
-                            break
+                    model_parts = list(response.candidates[0].content.parts)
+                    # Turn တစ်ခုထဲမှာ Model တောင်းထားတဲ့ Function Call အားလုံးကို စုမယ် (ပထမတစ်ခုတည်းမဟုတ်တော့)
+                    function_calls = [part.function_call for part in model_parts if part.function_call]
 
                 # --- CASE A: Direct Text Response (Tool သုံးစရာ မလိုတော့ရင် အဖြေထုတ်ပေးမယ်) ---
-                if not function_call:
+                if not function_calls:
                     return self._extract_text(response)
 
                 # --- CASE B: Tool Execution (Tool ဆက်သုံးမယ်) ---
-                tool_name = function_call.name
-                tool_args = dict(function_call.args)
-                logger.info(f"🛠️ Loop {loop_count}: Brain requires tool: {tool_name} | Args: {tool_args}")
-                
+                # Model ရဲ့ Tool Call Turn ကို (Thought Signature တွေပါ) မူရင်းအတိုင်း Conversation ထဲ ထည့်မယ်
+                contents.append(types.Content(role="model", parts=model_parts))
+
+                logger.info(f"🛠️ Loop {loop_count}: Brain requires {len(function_calls)} tool(s): {[fc.name for fc in function_calls]}")
+
                 # 📡 Telegram Status Update (Professional English, No Emojis)
                 if send_status:
-                    if tool_name == "search_web":
-                        query = tool_args.get("query", "data")
-                        await send_status(f"Searching web for: {query}...")
-                    elif tool_name == "manage_schedule":
-                        action = tool_args.get("action", "")
-                        task = tool_args.get("task_prompt", "task")
-                        if action == "add":
-                            await send_status(f"Scheduling task: {task}...")
-                        else:
-                            await send_status("Managing scheduled tasks...")
-                    elif tool_name == "read_page_content":
-                        await send_status("Extracting page content...")
-                    elif tool_name == "shell_exec":
-                        await send_status("Executing system command...")
-                    elif tool_name == "manage_knowledge":
-                        await send_status("Accessing deep memory...")
-                    elif tool_name == "manage_task":
-                        await send_status("Managing task queue...")
-                    elif tool_name == "check_resource":
-                        await send_status("Running system diagnostics...")
+                    if len(function_calls) == 1:
+                        await send_status(self._status_message(function_calls[0].name, dict(function_calls[0].args or {})))
                     else:
-                        await send_status("Processing request...")
-
-                # Tool ကို Run မယ်
-                tool_result = await self._execute_tool(tool_name, tool_args)
-                
-                # 🔥 ပြင်ဆင်ချက်: Output အလွတ်ဖြစ်နေရင် အောင်မြင်ကြောင်း AI ကို သေချာပြောပြရန်
-                if not tool_result or str(tool_result).strip() == "":
-                    tool_result = "[Success] Command executed silently with no errors."
-                
-                # --- SELF-CORRECTION LOOP (For Shell) ---
-                if tool_name == "shell_exec" and self._is_error(tool_result):
-                    logger.warning(f"⚠️ Error detected. Activating Reflector...")
-                    fix_command = self.reflector.reflect_and_fix(
-                        task=current_task_context,
-                        failed_command=tool_args.get("command"),
-                        error_log=tool_result
-                    )
-                    if fix_command:
-                        if send_status:
-                            await send_status("🚑 Error တက်သွားသဖြင့် အလိုအလျောက် ပြုပြင်နေပါသည်...")
-                        tool_result = await self._execute_tool("shell_exec", {"command": fix_command})
-                        tool_result += f"\n\n(✨ SYSTEM NOTE: Auto-fixed via Reflector Protocol.)"
-
-                # Tool ရဲ့ အဖြေကို Context ထဲ ပြန်ထည့်ပြီး နောက်တစ်ပတ် ပြန်စဉ်းစားခိုင်းမယ် (The Loop)
-                current_task_context += f"\n\n[SYSTEM: Tool '{tool_name}' executed. Output:\n{tool_result}]\n\n⚠️ CRITICAL INSTRUCTION: If the user's requested task is completely fulfilled, DO NOT call any more tools. Reply directly with the final text answer to the user in Burmese to conclude the task."
+                        await send_status(f"Running {len(function_calls)} tools in parallel...")
+
+                # Independent Call တွေကို ပြိုင်တူ Run မယ် (Timeout / Error Isolation / Unsafe Tool Lock တွေကို Registry က ကိုင်တွယ်မယ်)
+                tool_results = await asyncio.gather(
+                    *[self._run_function_call(fc, user_input, send_status) for fc in function_calls]
+                )
+
+                # Tool အဖြေ အားလုံးကို FunctionResponse Turn တစ်ခုတည်းအဖြစ် ပြန်ထည့်ပြီး နောက်တစ်ပတ် ပြန်စဉ်းစားခိုင်းမယ် (The Loop)
+                response_parts = [
+                    types.Part(function_response=types.FunctionResponse(
+                        id=fc.id, name=fc.name, response={"output": str(result)}
+                    ))
+                    for fc, result in zip(function_calls, tool_results)
+                ]
+                contents.append(types.Content(role="user", parts=response_parts))
 
             except Exception as e:
                 logger.error(f"❌ Critical Error in Loop: {e}")
@@ -126,6 +137,60 @@ class JarvisAgent:
                 
         return "ခိုင်းစေထားသော အလုပ်မှာ အဆင့်များလွန်းသဖြင့် ရပ်နားလိုက်ပါသည်။"
 
+    async def _run_function_call(self, function_call, user_input: str, send_status=None) -> str:
+        """Function Call တစ်ခုကို Run ပြီး (Shell Error ဆိုရင် Reflector နဲ့ ပြင်ပြီး) Result ပြန်ပေးမယ်"""
+        tool_name = function_call.name
+        tool_args = dict(function_call.args or {})
+        logger.info(f"🔧 Tool: {tool_name} | Args: {tool_args}")
+
+        # gather() က Call တစ်ခုချင်းစီကို Task သီးသန့် (Context Copy) နဲ့ Run လို့ ဒီမှာ Set လုပ်တာ တခြား Call ကို မထိဘူး
+        tool_status_callback.set(send_status)
+
+        # Tool ကို Run မယ်
+        tool_result = await self._execute_tool(tool_name, tool_args)
+
+        # 🔥 ပြင်ဆင်ချက်: Output အလွတ်ဖြစ်နေရင် အောင်မြင်ကြောင်း AI ကို သေချာပြောပြရန်
+        if not tool_result or str(tool_result).strip() == "":
+            tool_result = "[Success] Command executed silently with no errors."
+
+        # --- SELF-CORRECTION LOOP (For Shell) ---
+        if tool_name == "shell_exec" and self._is_error(tool_result):
+            logger.warning(f"⚠️ Error detected. Activating Reflector...")
+            fix_command = await self.reflector.reflect_and_fix(
+                task=user_input,
+                failed_command=tool_args.get("command"),
+                error_log=tool_result
+            )
+            if fix_command:
+                if send_status:
+                    await send_status("🚑 Error တက်သွားသဖြင့် အလိုအလျောက် ပြုပြင်နေပါသည်...")
+                tool_result = await self._execute_tool("shell_exec", {"command": fix_command})
+                tool_result += f"\n\n(✨ SYSTEM NOTE: Auto-fixed via Reflector Protocol.)"
+
+        return tool_result
+
+    def _status_message(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
+        if tool_name == "search_web":
+            query = tool_args.get("query", "data")
+            return f"Searching web for: {query}..."
+        elif tool_name == "manage_schedule":
+            action = tool_args.get("action", "")
+            task = tool_args.get("task_prompt", "task")
+            if action == "add":
+                return f"Scheduling task: {task}..."
+            return "Managing scheduled tasks..."
+        elif tool_name == "read_page_content":
+            return "Extracting page content..."
+        elif tool_name == "shell_exec":
+            return "Executing system command..."
+        elif tool_name == "manage_knowledge":
+            return "Accessing deep memory..."
+        elif tool_name == "manage_task":
+            return "Managing task queue..."
+        elif tool_name == "check_resource":
+            return "Running system diagnostics..."
+        return "Processing request..."
+
     def _is_error(self, result: str) -> bool:
         error_signals = ["STDERR", "Error:", "Traceback", "Exception", "TIMEOUT ALERT", "SAFETY ALERT", "command not found"]
         return any(signal in result for signal in error_signals)
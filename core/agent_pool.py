@@ -0,0 +1,97 @@
+import time
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List
+from config import Config
+from core.agent import JarvisAgent
+
+logger = logging.getLogger("JARVIS_AGENT_POOL")
+
+class AgentPool:
+    """
+    Role အလိုက် JarvisAgent တွေကို ကြိုဆောက်ထားပြီး ပြန်သုံးပေးမယ့် Pool.
+    Agent ဆောက်တိုင်း Tool Reload, system.md ဖတ်တာ, Declaration ပြန်ဆောက်တာ, Reflector ဆောက်တာတွေ ဖြစ်လို့
+    delegate_task / SE Team / QA / Scheduled Task တွေက Agent အသစ်မဆောက်တော့ဘဲ ဒီကနေ ငှားသုံးမယ်။
+    Checkout တစ်ခုချင်းစီမှာ Conversation State က သီးသန့်ဖြစ်ပြီး (chat() ထဲမှာပဲ ရှိလို့)
+    Role Prompt Override ကိုလည်း ပြန်ထည့်တိုင်း Reset လုပ်မယ်။
+    """
+    def __init__(self, max_idle_per_role: int):
+        self.max_idle_per_role = max_idle_per_role
+        self._idle: Dict[str, List[JarvisAgent]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "acquire_ms_total": 0.0, "acquires": 0}
+
+    async def _checkout(self, role: str) -> JarvisAgent:
+        started = time.perf_counter()
+        with self._lock:
+            agent = self._idle[role].pop() if self._idle[role] else None
+
+        if agent is None:
+            # Tool Reload / system.md ဖတ်တာ / Reflector ဆောက်တာတွေက Event Loop ကို မပိတ်အောင် Thread ထဲမှာ ဆောက်မယ်
+            # (Constructor က Tool ကို Rescan ပြီးသားမို့ reset() ထပ်မခေါ်ဘူး)
+            agent = await asyncio.to_thread(JarvisAgent, role)
+            hit = False
+        else:
+            agent.reset()
+            hit = True
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats["hits" if hit else "misses"] += 1
+            self._stats["acquires"] += 1
+            self._stats["acquire_ms_total"] += elapsed_ms
+        logger.info(f"📦 Agent [{role.upper()}] acquired in {elapsed_ms:.1f}ms")
+        return agent
+
+    def _release(self, agent: JarvisAgent):
+        # Tool Rescan ကို နောက် Checkout မှာ တစ်ခါပဲ လုပ်မယ်
+        agent.reset(reload_tools=False)
+        with self._lock:
+            if len(self._idle[agent.role]) < self.max_idle_per_role:
+                self._idle[agent.role].append(agent)
+
+    @asynccontextmanager
+    async def acquire(self, role: str = "ceo", system_instruction: str = None):
+        """
+        async with agent_pool.acquire("planner", system_instruction=...) as agent:
+            await agent.chat(...)
+        """
+        agent = await self._checkout(role)
+        if system_instruction:
+            agent.brain.system_instruction = system_instruction
+        try:
+            yield agent
+        finally:
+            self._release(agent)
+
+    def warm(self, roles: List[str], per_role: int = 1):
+        """Startup မှာ Role တစ်ခုချင်းစီအတွက် Agent တွေကို ကြိုဆောက်ထားမယ်"""
+        for role in roles:
+            with self._lock:
+                missing = min(per_role, self.max_idle_per_role) - len(self._idle[role])
+            for _ in range(max(missing, 0)):
+                agent = JarvisAgent(role=role)
+                with self._lock:
+                    self._idle[role].append(agent)
+        logger.info(f"🔥 Agent Pool warmed: {self.idle_counts()}")
+
+    def idle_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {role: len(agents) for role, agents in self._idle.items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        acquires = stats["acquires"] or 1
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "avg_acquire_ms": round(stats["acquire_ms_total"] / acquires, 2),
+            "idle": self.idle_counts(),
+        }
+
+# Singleton Instance
+agent_pool = AgentPool(max_idle_per_role=Config.AGENT_POOL_MAX_IDLE)
@@ -1,16 +1,37 @@
 import os
-import time
+import asyncio
 import logging
-from google import genai
+from typing import List
 from google.genai import types
 from config import Config
 from core.registry import tool_registry
+from core.client_pool import client_pool
+from core.key_scheduler import key_scheduler
+from core.context_cache import context_cache
 from core.prompts.context_manager import context_manager
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("JARVIS_BRAIN")
 
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), 'prompts')
+_role_prompt_cache = {}  # path -> (mtime, text)
+
+def load_role_prompt(role: str):
+    """core/prompts/<role>.md ကို mtime ပြောင်းမှပဲ Disk ကနေ ပြန်ဖတ်မယ် (ဖိုင်မရှိရင် None)"""
+    path = os.path.join(PROMPTS_DIR, f"{role}.md")
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _role_prompt_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    _role_prompt_cache[path] = (mtime, text)
+    return text
+
 class JarvisBrain:
     def __init__(self, role: str = "ceo"):
         """
@@ -24,19 +45,62 @@ class JarvisBrain:
             
         self.role = role
         # system.md ဖိုင်ထဲကနေ Personality ကို လှမ်းဖတ်မယ်
-        prompt_path = os.path.join(os.path.dirname(__file__), 'prompts', 'system.md')
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            self.system_instruction = f.read()
+        self._prompt_path = os.path.join(PROMPTS_DIR, 'system.md')
+        self._prompt_mtime = None
+        self._loaded_prompt = None
+        self._refresh_system_prompt(force=True)
         
         # Registry ကနေ Role နဲ့ ကိုက်ညီတာကိုပဲ အလိုလို ခွဲယူမယ်
+        self._tools_generation = None
+        self._refresh_tools()
+
+    def _refresh_tools(self):
+        """Registry Generation ပြောင်းမှပဲ Role ရဲ့ Declaration တွေကို ပြန်ယူမယ် (Registry ဘက်မှာ Memoize လုပ်ထားပြီးသား)"""
+        if self._tools_generation == tool_registry.generation:
+            return
         self.tools_config = [
             types.Tool(
                 function_declarations=tool_registry.get_declarations_for_role(self.role)
             )
         ]
+        self._tools_generation = tool_registry.generation
+
+    def _refresh_system_prompt(self, force: bool = False):
+        """system.md ပြင်လိုက်ရင် (mtime ပြောင်းရင်) ပြန်ဖတ်မယ် - Tool တွေက Override လုပ်ထားရင်တော့ မထိဘူး"""
+        try:
+            mtime = os.path.getmtime(self._prompt_path)
+        except OSError:
+            return
+        if not force and (mtime == self._prompt_mtime or self.system_instruction != self._loaded_prompt):
+            return
+        with open(self._prompt_path, 'r', encoding='utf-8') as f:
+            self.system_instruction = f.read()
+        self._loaded_prompt = self.system_instruction
+        self._prompt_mtime = mtime
+
+    def reset_system_instruction(self):
+        """Pool ထဲ ပြန်ထည့်တဲ့အခါ Tool တွေ Override လုပ်ထားတဲ့ Role Prompt ကို မူလ system.md ဆီ ပြန်ပြောင်းမယ်"""
+        self.system_instruction = self._loaded_prompt
+        self._refresh_system_prompt()
 
-    def _get_client(self):
-        """Round-Robin Key Rotation: Get a client with the next available key"""
+    async def _build_config(self, api_key: str):
+        """Cached Context ရရင် System Instruction + Tools ကို ထပ်မပို့တော့ဘဲ Cache Name ကိုပဲ ပို့မယ်"""
+        cached_name = await context_cache.get_cached_content(
+            api_key, self.role, self.model_name, self.system_instruction, self.tools_config
+        )
+        if cached_name:
+            return cached_name, types.GenerateContentConfig(
+                cached_content=cached_name,
+                temperature=0.7,
+            )
+        return None, types.GenerateContentConfig(
+            system_instruction=self.system_instruction,
+            tools=self.tools_config,
+            temperature=0.7, # Creative but focused
+        )
+
+    def _get_client(self, api_key: str):
+        """Key Scheduler ရွေးပေးလိုက်တဲ့ Key အတွက် Pooled Async Client ကို ယူမယ်"""
         
         # 🚀 FIX: Orbit Proxy က နားလည်အောင် Authorization Header ကို အတင်းတပ်ပေးလိုက်ခြင်း
         #if self.role in ["sysadmin", "planner"] and hasattr(Config, "ORBIT_API_KEY"):
@@ -53,63 +117,177 @@ class JarvisBrain:
             #)
             
         # ကျန်တဲ့ Agent (ဥပမာ- CEO) တွေကတော့ မူလ .env ထဲက Key အဟောင်းတွေကိုပဲ လှည့်သုံးမယ်
-        api_key = Config.get_next_api_key()
         logger.info(f"Using Standard API Key ending in: ...{api_key[-4:]}")
-        return genai.Client(api_key=api_key)
+        # Key တစ်ခုကို Client တစ်ခုပဲ ထားပြီး Connection Pool ကို ပြန်သုံးမယ်
+        return client_pool.get_async_client(api_key)
 
-    def think(self, user_input, chat_history=[], context_memory=""):
+    @staticmethod
+    def _normalize_turn(turn):
+        """History Item တစ်ခုကို (role, text) အဖြစ် ပြောင်းမယ် (dict / tuple / "Sir: ..." string အကုန်လက်ခံ)"""
+        if isinstance(turn, dict):
+            role, text = turn.get("role", "user"), turn.get("content", "")
+        elif isinstance(turn, (tuple, list)) and len(turn) == 2:
+            role, text = turn
+        else:
+            text = str(turn)
+            role = "user" if text.startswith("Sir:") else "model"
+        return ("user" if role == "user" else "model"), str(text)
+
+    @staticmethod
+    def _append_turn(contents: List[types.Content], role: str, parts: List[types.Part]):
+        """Role တူတဲ့ Turn တွေ ဆက်တိုက်ဖြစ်နေရင် တစ်ခုတည်းအဖြစ် ပေါင်းမယ်"""
+        if contents and contents[-1].role == role:
+            contents[-1].parts.extend(parts)
+        else:
+            contents.append(types.Content(role=role, parts=parts))
+
+    def build_contents(self, user_input: str, chat_history: list = None, context_memory: str = "",
+                       dynamic_context: str = None) -> List[types.Content]:
         """
-        The Main Thinking Process with Automatic Retry & Key Rotation
+        Role-tagged Content Turns များ တည်ဆောက်ခြင်း။
+        History -> (Context + User Input) အစီအစဉ်နဲ့ ထားပြီး ReAct Loop မှာ နောက်ကနေပဲ ဆက်ဖြည့်မယ်။
+        ဒါကြောင့် Prompt ရဲ့ ရှေ့ပိုင်း (Prefix) က Iteration တိုင်း Byte အတိအကျ တူနေမယ် (Cache ဖြစ်အောင်)။
+        """
+        contents: List[types.Content] = []
+        for turn in chat_history or []:
+            role, text = self._normalize_turn(turn)
+            if text.strip():
+                self._append_turn(contents, role, [types.Part(text=text)])
+
+        # ပွဲစား (Context Manager) ဆီကနေ အချိန်နဲ့ မှတ်ဉာဏ်တွေကို Request တစ်ခုမှာ တစ်ခါပဲ ယူမယ်
+        # (Async ခေါ်သူက ကြိုယူပြီး ပေးထားရင် DB ကို ထပ်မဖတ်တော့ဘူး)
+        if dynamic_context is None:
+            dynamic_context = context_manager.get_current_context()
+        context_block = dynamic_context
+        if context_memory:
+            context_block += f"\n\nContext from Memory:\n{context_memory}"
+
+        self._append_turn(contents, "user", [types.Part(text=context_block), types.Part(text=user_input)])
+        return contents
+
+    @staticmethod
+    def _merge_stream_part(parts: List[types.Part], part: types.Part):
+        """Stream Chunk တွေက Text အပိုင်းအစတွေကို Part တစ်ခုတည်းအဖြစ် ပြန်ဆက်မယ် (Function Call တွေကိုတော့ မူရင်းအတိုင်းထားမယ်)"""
+        last = parts[-1] if parts else None
+        if (part.text is not None and not part.function_call and last is not None
+                and last.text is not None and not last.function_call and bool(last.thought) == bool(part.thought)):
+            parts[-1] = types.Part(
+                text=last.text + part.text,
+                thought=last.thought,
+                thought_signature=part.thought_signature or last.thought_signature,
+            )
+        else:
+            parts.append(part)
+
+    async def _generate_streaming(self, client, contents: List[types.Content], config, on_text):
+        """
+        generate_content_stream ကို သုံးပြီး Final Answer Text ကို ရသလောက် on_text ဆီ ချက်ချင်းပို့မယ်။
+        Function Call တစ်ခုခု တွေ့တာနဲ့ Text မပို့တော့ဘဲ (Tool Turn ဖြစ်လို့) ကျန်တဲ့ Call တွေကိုပဲ စုမယ်၊
+        အဲ့ဒီမတိုင်ခင် Text ပို့ပြီးသားဆိုရင် on_text("") နဲ့ ပြထားတာကို ရှင်းခိုင်းမယ်။
+        ပြီးရင် Agent က နားလည်တဲ့ GenerateContentResponse ပုံစံ တစ်ခုတည်းအဖြစ် ပြန်ပေါင်းပေးမယ်။
+        """
+        parts: List[types.Part] = []
+        streamed_text = ""
+        is_tool_turn = False
+        usage = None
+
+        stream = await client.models.generate_content_stream(
+            model=self.model_name,
+            contents=contents,
+            config=config
+        )
+        async for chunk in stream:
+            if chunk.usage_metadata:
+                usage = chunk.usage_metadata
+            if not chunk.candidates or not chunk.candidates[0].content or not chunk.candidates[0].content.parts:
+                continue
+            for part in chunk.candidates[0].content.parts:
+                self._merge_stream_part(parts, part)
+                if part.function_call:
+                    if streamed_text and not is_tool_turn:
+                        # Call မတိုင်ခင် ပြောခဲ့တဲ့ Text က Final Answer မဟုတ်လို့ ပြထားတာကို ဖျက်ခိုင်းမယ်
+                        await on_text("")
+                    is_tool_turn = True
+                elif part.text and not part.thought and not is_tool_turn:
+                    streamed_text += part.text
+                    await on_text(streamed_text)
+
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=parts))],
+            usage_metadata=usage,
+        )
+
+    async def think(self, contents: List[types.Content], on_text=None):
+        """
+        The Main Thinking Process with Automatic Retry & Rate-Limit Aware Key Scheduling
+        (contents = build_contents() နဲ့ စပြီး Agent က Model/Tool Turn တွေ ဆက်ဖြည့်ထားတဲ့ Conversation)
+        on_text ပေးထားရင် Streaming Mode နဲ့ Final Answer ကို တဖြည်းဖြည်း ပို့ပေးမယ်
         """
         max_retries = 5  # Key 5 ခုရှိလို့ ၅ ခါ retry မယ်
         attempt = 0
+        self._refresh_system_prompt()
+        self._refresh_tools()
 
         while attempt < max_retries:
+            api_key = None
+            cached_name = None
             try:
-                client = self._get_client()
-                
-                # ပွဲစား (Context Manager) ဆီကနေ အချိန်နဲ့ မှတ်ဉာဏ်တွေကို ယူမယ်
-                dynamic_context = context_manager.get_current_context()
-
-                # Context ပေါင်းစပ်ခြင်း
-                full_prompt = f"""
-                {dynamic_context}
-                
-                Context from Memory:
-                {context_memory}
-                
-                Chat History:
-                {chat_history}
-                
-                User Input:
-                {user_input}
-                """
+                # ကျန်းမာပြီး Load အနည်းဆုံး Key ကို Scheduler ဆီက တောင်းမယ်
+                api_key = await key_scheduler.acquire()
+                client = self._get_client(api_key)
+                cached_name, config = await self._build_config(api_key)
 
                 # Gemini 2.5 Call
-                response = client.models.generate_content(
-                    model=self.model_name,
-                    contents=full_prompt,
-                    config=types.GenerateContentConfig(
-                        system_instruction=self.system_instruction,
-                        tools=self.tools_config,
-                        temperature=0.7, # Creative but focused
+                if on_text:
+                    response = await self._generate_streaming(client, contents, config, on_text)
+                else:
+                    response = await client.models.generate_content(
+                        model=self.model_name,
+                        contents=contents,
+                        config=config
                     )
-                )
                 
+                key_scheduler.report_success(api_key)
+                usage = getattr(response, "usage_metadata", None)
+                if usage:
+                    cached_tokens = usage.cached_content_token_count or 0
+                    prompt_tokens = usage.prompt_token_count or 0
+                    logger.info(
+                        f"📏 [{self.role.upper()}] Prompt tokens: {prompt_tokens} "
+                        f"(cached: {cached_tokens}, uncached: {prompt_tokens - cached_tokens}) | Turns: {len(contents)}"
+                    )
                 return response
 
             except Exception as e:
                 logger.error(f"API Error with key attempt {attempt+1}: {e}")
-                
-                # 429 means Rate Limit - Rotate Key immediately
-                if "429" in str(e) or "quota" in str(e).lower():
-                    logger.warning("Rate Limit hit! Rotating to next API Key...")
-                    attempt += 1
-                    time.sleep(1) # ခဏစောင့်ပြီး နောက် Key ပြောင်း
+                attempt += 1
+                if api_key is None:
+                    # Key မရှိတာ (သို့) Key အားလုံး Cooldown ဖြစ်နေတာ - Retry လုပ်လည်း အကျိုးမရှိ
+                    return f"Error: {e}"
+
+                if cached_name and "cache" in str(e).lower():
+                    # Cache က Server ဘက်မှာ Expire/ပျက်သွားရင် နောက်တစ်ပတ်မှာ အသစ်ပြန်ဆောက်မယ် (Key ရဲ့ အပြစ်မဟုတ်)
+                    context_cache.invalidate(api_key, self.role, self.model_name)
+                    continue
+
+                rate_limited, retry_after, retryable = key_scheduler.classify_error(e)
+                if not retryable:
+                    # 400 INVALID_ARGUMENT / Safety Block စတာတွေက Key ပြောင်း Retry လုပ်လည်း အတူတူပဲ -
+                    # ကျန်းမာတဲ့ Key တွေကို Cooldown မချဘဲ ချက်ချင်း ပြန်မယ်
+                    logger.warning(f"Non-retryable API error, not retrying: {e}")
+                    return f"Error: {e}"
+                key_scheduler.report_failure(api_key, rate_limited=rate_limited, retry_after=retry_after)
+
+                if rate_limited:
+                    # 429 ရတဲ့ Key က Cooldown ထဲရောက်သွားပြီ၊ နောက်တစ်ပတ်မှာ ကျန်းမာတဲ့ Key ကို ချက်ချင်း ရွေးမယ်
+                    logger.warning("Rate Limit hit! Key put on cooldown, switching to a healthy key...")
                 else:
-                    # တခြား Error ဆိုရင်လည်း Retry မယ် (Network error ဖြစ်နိုင်လို့)
-                    logger.warning(f"Unexpected error. Rotating key just in case. Error: {e}")
-                    attempt += 1
-                    time.sleep(2)
+                    # တခြား Error ဆိုရင်လည်း Retry မယ် (Network error ဖြစ်နိုင်လို့) - Backoff + Jitter နဲ့
+                    delay = key_scheduler.backoff_delay(attempt)
+                    logger.warning(f"Unexpected error. Retrying in {delay:.1f}s. Error: {e}")
+                    await asyncio.sleep(delay)
+            finally:
+                if api_key:
+                    key_scheduler.release(api_key)
 
         return "Error: All API Keys failed. Please check your quota or connection."
\ No newline at end of file
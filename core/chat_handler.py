@@ -1,34 +1,41 @@
 import logging
-from core.agent import JarvisAgent
-from memory.memory_controller import memory_controller
+from core.agent_pool import agent_pool
+from memory.memory_controller import memory_controller, profile_run_stats
 
 logger = logging.getLogger("CHAT_HANDLER")
-agent = None
 
-async def process_user_message(user_id: int, user_text: str, status_callback=None) -> str:
+async def process_user_message(user_id: int, user_text: str, status_callback=None, stream_callback=None) -> str:
     """Telegram ကလာတဲ့ စာကို AI ဆီပို့ပြီး အဖြေပြန်ထုတ်ပေးမယ့် Main Logic"""
-    global agent
-    if agent is None:
-        agent = JarvisAgent()
-
     try:
-        # 1. Profile (Long-term) + History (Short-term) ကို ဆွဲထုတ်မယ်
-        profile_data = memory_controller.get_all_user_facts(user_id)
-        short_term_history = memory_controller.get_recent_chat(user_id, limit=10)
-        full_context = f"{profile_data}\n\n--- CHAT HISTORY ---\n"
+        # 1. History (Short-term) ကို ဆွဲထုတ်မယ်
+        # (Profile ကို Agent ရဲ့ System Context ထဲမှာ Cache ကနေ တစ်ခါပဲ ထည့်ပြီးသားမို့ context_memory ထဲ ထပ်မထည့်တော့ဘူး)
+        short_term_history = await memory_controller.aget_recent_turns(user_id, limit=10)
+        # Process-wide Snapshot ခြားနားချက်က ပြိုင်တူ Conversation တွေနဲ့ ရောမှာမို့ ဒီ Run ရဲ့ Counter ကို သီးသန့်ယူမယ်
+        run_stats = {"hits": 0, "queries": 0}
+        token = profile_run_stats.set(run_stats)
 
-        # 2. Agent ကို မေးမယ်
-        response = await agent.chat(
-            user_input=user_text, 
-            user_id=user_id, 
-            chat_history=short_term_history, 
-            context_memory=full_context,
-            send_status=status_callback
-        )
+        # 2. Agent ကို မေးမယ် (Pool ထဲက CEO Agent ကို ငှားသုံးမယ်၊ ပြိုင်တူ Message တွေလည်း State မရောဘူး)
+        try:
+            async with agent_pool.acquire("ceo") as agent:
+                response = await agent.chat(
+                    user_input=user_text, 
+                    user_id=user_id, 
+                    chat_history=short_term_history, 
+                    context_memory="",
+                    send_status=status_callback,
+                    on_stream=stream_callback
+                )
+        finally:
+            profile_run_stats.reset(token)
 
         # 3. Memory ထဲ ပြန်သိမ်းမယ်
-        memory_controller.add_chat_message(user_id, "user", user_text)
-        memory_controller.add_chat_message(user_id, "model", response)
+        await memory_controller.aadd_chat_message(user_id, "user", user_text)
+        await memory_controller.aadd_chat_message(user_id, "model", response)
+
+        logger.info(
+            f"👤 Profile cache: {run_stats['hits']} query saved, {run_stats['queries']} DB read this conversation "
+            f"(total saved: {memory_controller.profile_stats()['hits']})"
+        )
 
         return response
         
@@ -0,0 +1,52 @@
+import logging
+import threading
+from typing import Dict
+from google import genai
+
+logger = logging.getLogger("JARVIS_CLIENT_POOL")
+
+class GeminiClientPool:
+    """
+    API Key တစ်ခုချင်းစီအတွက် genai.Client တစ်ခုတည်းကိုပဲ ဆောက်ပြီး ပြန်သုံးပေးမယ့် Pool.
+    Call တိုင်း Client အသစ်ဆောက်ရင် TLS Handshake အသစ်ဖြစ်လို့ HTTP Connection Pool ကို အမြဲထိန်းထားမယ်။
+    (CEO, Sub-Agents, Reflector, VisualTool အားလုံး ဒီ Pool ကိုပဲ မျှသုံးမယ်)
+    """
+    def __init__(self):
+        self._clients: Dict[str, genai.Client] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, api_key: str) -> genai.Client:
+        """Key အတွက် Long-lived Client ကို ပြန်ပေးမယ် (မရှိသေးရင် တစ်ခါပဲ ဆောက်မယ်)"""
+        client = self._clients.get(api_key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(api_key)
+                if client is None:
+                    client = genai.Client(api_key=api_key)
+                    self._clients[api_key] = client
+                    logger.info(f"🔗 New pooled client for key ending in: ...{api_key[-4:]}")
+        return client
+
+    def get_async_client(self, api_key: str):
+        """SDK ရဲ့ Async Surface (client.aio) ကို ပြန်ပေးမယ်"""
+        return self.get_client(api_key).aio
+
+    async def close(self):
+        """Shutdown လုပ်တဲ့အခါ Connection အားလုံးကို ပိတ်မယ်"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.aio.aclose()
+            except Exception as e:
+                logger.debug(f"Async client close skipped: {e}")
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Sync client close skipped: {e}")
+        logger.info(f"🔌 Closed {len(clients)} pooled Gemini client(s).")
+
+# Singleton Instance (Process တစ်ခုလုံး ဒီ Pool တစ်ခုတည်းကိုပဲ သုံးမယ်)
+client_pool = GeminiClientPool()
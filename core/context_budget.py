@@ -0,0 +1,131 @@
+import json
+import logging
+from typing import Dict, List
+from google.genai import types
+from config import Config
+
+logger = logging.getLogger("JARVIS_CONTEXT_BUDGET")
+
+class ContextBudget:
+    """
+    ReAct Loop ရဲ့ Prompt Size ကို Token Budget အတွင်း ထိန်းပေးမယ့် Manager.
+    - Segment (History/Context, Model Turns, Tool Outputs) အလိုက် Token ရေတွက်မယ်
+    - Ceiling ကျော်မှသာ နောက်ဆုံး Tool Output အနည်းငယ်ကိုပဲ မူရင်းအတိုင်းထားပြီး အဟောင်းတွေကို Head/Tail Excerpt အဖြစ် တစ်ခါတည်း ချုံ့မယ်
+      (Turn တိုင်း ချုံ့ရင် History က Byte မတည်ငြိမ်တော့ဘဲ Context Cache / Implicit Prefix Cache (user-003) ပျက်မယ်)
+    - Per-request Token Ceiling ကျော်ရင် ပိုပြီး ချုံ့မယ်၊ နောက်ဆုံးမှ History အဟောင်းကို ဖြုတ်မယ်
+    """
+    COMPACTED_MARK = "compacted"
+
+    def __init__(self, max_tokens: int = None, keep_recent: int = None, excerpt_chars: int = None):
+        self.max_tokens = max_tokens or Config.MAX_PROMPT_TOKENS
+        self.keep_recent = Config.CONTEXT_KEEP_RECENT_TOOL_OUTPUTS if keep_recent is None else keep_recent
+        self.excerpt_chars = excerpt_chars or Config.TOOL_OUTPUT_EXCERPT_CHARS
+
+    # ==========================================
+    # Token ရေတွက်ခြင်း
+    # ==========================================
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """API မခေါ်ဘဲ ခန့်မှန်းမယ် (UTF-8 Byte ၄ ခု ≈ Token ၁ ခု - မြန်မာစာအတွက်လည်း အနီးစပ်ဆုံး)"""
+        if not text:
+            return 0
+        return len(text.encode("utf-8")) // 4 + 1
+
+    def count_part(self, part: types.Part) -> int:
+        if part.text:
+            return self.estimate_tokens(part.text)
+        if part.function_call:
+            return self.estimate_tokens(json.dumps(dict(part.function_call.args or {}), ensure_ascii=False)) + 5
+        if part.function_response:
+            return self.estimate_tokens(json.dumps(part.function_response.response or {}, ensure_ascii=False)) + 5
+        return 0
+
+    def measure(self, contents: List[types.Content], prefix_len: int) -> Dict[str, int]:
+        """Segment အလိုက် Token အရေအတွက်"""
+        report = {"context": 0, "model": 0, "tool_outputs": 0}
+        for index, content in enumerate(contents):
+            for part in content.parts or []:
+                tokens = self.count_part(part)
+                if index < prefix_len:
+                    report["context"] += tokens
+                elif part.function_response:
+                    report["tool_outputs"] += tokens
+                else:
+                    report["model"] += tokens
+        report["total"] = sum(report.values())
+        return report
+
+    # ==========================================
+    # ချုံ့ခြင်း (Compaction)
+    # ==========================================
+    def _excerpt(self, text: str, limit: int) -> str:
+        """ရှေ့ပိုင်းနဲ့ နောက်ပိုင်းကိုပဲ ချန်ထားမယ် (Error တွေက အများအားဖြင့် နောက်ဆုံးမှာ ရှိလို့)"""
+        if len(text) <= limit * 2:
+            return text
+        omitted = len(text) - limit * 2
+        return f"{text[:limit]}\n...[{omitted} chars omitted from older tool output]...\n{text[-limit:]}"
+
+    def _compact_part(self, part: types.Part, limit: int) -> types.Part:
+        response = part.function_response
+        payload = dict(response.response or {})
+        # ဒီ Limit (သို့) ပိုသေးတဲ့ Limit နဲ့ ချုံ့ပြီးသားဆိုရင် ထပ်မလုပ်တော့ဘူး
+        if payload.get(self.COMPACTED_MARK) and payload[self.COMPACTED_MARK] <= limit:
+            return part
+        output = str(payload.get("output", ""))
+        excerpt = self._excerpt(output, limit)
+        if excerpt == output:
+            return part
+        payload["output"] = excerpt
+        payload[self.COMPACTED_MARK] = limit
+        return types.Part(function_response=types.FunctionResponse(
+            id=response.id, name=response.name, response=payload
+        ))
+
+    def _tool_output_slots(self, contents: List[types.Content], prefix_len: int) -> list:
+        slots = []
+        for c_index in range(prefix_len, len(contents)):
+            for p_index, part in enumerate(contents[c_index].parts or []):
+                if part.function_response:
+                    slots.append((c_index, p_index))
+        return slots
+
+    def enforce(self, contents: List[types.Content], prefix_len: int) -> int:
+        """
+        contents ကို နေရာမှာတင် ချုံ့မယ်။ History ဖြုတ်ရရင် ကျန်တဲ့ prefix_len အသစ်ကို ပြန်ပေးမယ်။
+        Budget အတွင်းဆိုရင် ဘာမှ မပြင်ဘူး - ပြီးသွားတဲ့ Turn တွေ Byte မပြောင်းမှ Prefix Cache ဆက်ထိမယ်၊
+        ကျော်မှ Tool Output အဟောင်းအားလုံးကို Batch တစ်ခုတည်းနဲ့ ချုံ့တာမို့ နောက်တစ်ခါ ကျော်တဲ့အထိ Prefix က ပြန်တည်ငြိမ်မယ်
+        """
+        if self.measure(contents, prefix_len)["total"] <= self.max_tokens:
+            return prefix_len
+        slots = self._tool_output_slots(contents, prefix_len)
+
+        # 1. နောက်ဆုံး keep_recent ခုမှလွဲရင် Tool Output အဟောင်းတွေကို Excerpt အဖြစ် ချုံ့မယ်
+        older = slots[:-self.keep_recent] if self.keep_recent else slots
+        for c_index, p_index in older:
+            contents[c_index].parts[p_index] = self._compact_part(contents[c_index].parts[p_index], self.excerpt_chars)
+
+        # 2. Ceiling ကျော်နေသေးရင် Output အားလုံးကို တဖြည်းဖြည်း ပိုချုံ့မယ်
+        limit = self.excerpt_chars
+        while self.measure(contents, prefix_len)["total"] > self.max_tokens and limit > 200 and slots:
+            limit //= 2
+            for c_index, p_index in slots:
+                contents[c_index].parts[p_index] = self._compact_part(contents[c_index].parts[p_index], limit)
+
+        # 3. ဒါတောင် မလုံလောက်ရင် History Turn အဟောင်းတွေကို ဖြုတ်မယ် (လက်ရှိ User Turn ကိုတော့ မထိ)
+        while self.measure(contents, prefix_len)["total"] > self.max_tokens and prefix_len > 1:
+            contents.pop(0)
+            prefix_len -= 1
+            # Conversation က User Turn နဲ့ပဲ စရမယ်
+            while prefix_len > 1 and contents[0].role != "user":
+                contents.pop(0)
+                prefix_len -= 1
+
+        return prefix_len
+
+    def report(self, contents: List[types.Content], prefix_len: int, loop_count: int, role: str = ""):
+        sizes = self.measure(contents, prefix_len)
+        logger.info(
+            f"📐 [{role.upper()}] Loop {loop_count} prompt ≈ {sizes['total']} tokens "
+            f"(context: {sizes['context']}, model: {sizes['model']}, tool outputs: {sizes['tool_outputs']}) / budget {self.max_tokens}"
+        )
+        return sizes
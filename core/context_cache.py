@@ -0,0 +1,169 @@
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+from google.genai import types
+from config import Config
+from core.client_pool import client_pool
+
+logger = logging.getLogger("JARVIS_CONTEXT_CACHE")
+
+class _CacheEntry:
+    def __init__(self, name: str, prompt_hash: str, decl_hash: str, expires_at: float):
+        self.name = name
+        self.prompt_hash = prompt_hash
+        self.decl_hash = decl_hash
+        self.expires_at = expires_at
+
+class ContextCacheManager:
+    """
+    Role တစ်ခုချင်းစီရဲ့ System Instruction + Tool Declarations ကို Gemini Cached Content အဖြစ် သိမ်းထားမယ့် Manager.
+    - Key: (api_key, role, model) -> Cache ကို (prompt hash, declaration hash) နဲ့ တွဲမှတ်ထားမယ်
+    - TTL မကုန်ခင် ကြိုပြီး သက်တမ်းတိုးမယ်
+    - Prompt ဖိုင် (သို့) Tool Registry ပြောင်းသွားရင် Cache အဟောင်းကို ဖျက်ပြီး အသစ်ပြန်ဆောက်မယ်
+    (Cached Content က API Key ရဲ့ Project အောက်မှာပဲ ရှိလို့ Key အလိုက်လည်း ခွဲထားရမယ်)
+    """
+    def __init__(self, ttl_seconds: int, refresh_margin: int):
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin = refresh_margin
+        self._entries: Dict[Tuple[str, str, str], _CacheEntry] = {}
+        # Slot -> [Lock, စောင့်နေ/ကိုင်ထားတဲ့ Caller အရေအတွက်] (သုံးသူမရှိ + Entry မရှိရင် ဖယ်မယ်)
+        self._locks: Dict[Tuple[str, str, str], list] = {}
+        # Server ဘက်မှာ ပျက်သွားတယ်လို့ invalidate() လုပ်ထားတဲ့ Entry - Slot ပြန်ဆောက်တဲ့အခါ Server ကပါ ဖျက်မယ်
+        self._orphans: Dict[Tuple[str, str, str], _CacheEntry] = {}
+        # Token နည်းလွန်းလို့ Cache လုပ်မရတဲ့ (model, prompt, decl) တွေကို ခဏမှတ်ထားမယ်
+        self._unsupported: Dict[Tuple[str, str, str], float] = {}
+
+    @staticmethod
+    def fingerprint(system_instruction: str, tools: List[types.Tool]) -> Tuple[str, str]:
+        prompt_hash = hashlib.sha256((system_instruction or "").encode("utf-8")).hexdigest()[:16]
+        decl_dump = json.dumps(
+            [tool.model_dump(mode="json", exclude_none=True) for tool in tools or []],
+            sort_keys=True, ensure_ascii=False
+        )
+        decl_hash = hashlib.sha256(decl_dump.encode("utf-8")).hexdigest()[:16]
+        return prompt_hash, decl_hash
+
+    @staticmethod
+    def _is_unsupported_error(error: Exception) -> bool:
+        """Token နည်းလွန်းလို့ (INVALID_ARGUMENT / 400) Cache မလုပ်နိုင်တာလား - 429 / 5xx / Network Error ဆို နောက် Call မှာ ပြန်ကြိုးစားမယ်"""
+        text = str(error)
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        return code == 400 or "INVALID_ARGUMENT" in text or ("token" in text.lower() and "minimum" in text.lower())
+
+    async def get_cached_content(self, api_key: str, role: str, model: str,
+                                 system_instruction: str, tools: List[types.Tool]) -> Optional[str]:
+        """သုံးလို့ရတဲ့ Cached Content Name ကို ပြန်ပေးမယ် (Cache မလုပ်နိုင်ရင် None)"""
+        if not Config.CONTEXT_CACHE_ENABLED:
+            return None
+
+        prompt_hash, decl_hash = self.fingerprint(system_instruction, tools)
+        slot = (api_key, role, model)
+        holder = self._locks.setdefault(slot, [asyncio.Lock(), 0])
+        holder[1] += 1
+        try:
+            async with holder[0]:
+                return await self._get_or_create(slot, role, model, system_instruction, tools, prompt_hash, decl_hash)
+        finally:
+            holder[1] -= 1
+            if holder[1] == 0 and slot not in self._entries and slot not in self._orphans:
+                self._locks.pop(slot, None)
+
+    async def _get_or_create(self, slot, role: str, model: str, system_instruction: str,
+                             tools: List[types.Tool], prompt_hash: str, decl_hash: str) -> Optional[str]:
+        """Slot Lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်"""
+        client = client_pool.get_async_client(slot[0])
+        now = time.time()
+        entry = self._entries.get(slot)
+
+        # 0. invalidate() လုပ်ထားတဲ့ Cache အဟောင်းကို Server ဘက်ကပါ ဖျက်မယ် (TTL ကုန်တဲ့အထိ Storage ကုန်ကျစရိတ် မကျအောင်)
+        orphan = self._orphans.pop(slot, None)
+        if orphan is not None:
+            await self._delete(client, orphan)
+
+        # 1. Prompt / Tool Declaration ပြောင်းသွားရင် Cache အဟောင်းကို ဖျက်မယ်
+        if entry and (entry.prompt_hash, entry.decl_hash) != (prompt_hash, decl_hash):
+            logger.info(f"♻️ [{role.upper()}] Prompt or tools changed. Rebuilding context cache...")
+            await self._delete(client, entry)
+            entry = None
+            self._entries.pop(slot, None)
+
+        # 2. TTL ကုန်ခါနီးရင် ကြိုပြီး သက်တမ်းတိုးမယ်
+        if entry and entry.expires_at - now < self.refresh_margin:
+            try:
+                await client.caches.update(
+                    name=entry.name,
+                    config=types.UpdateCachedContentConfig(ttl=f"{self.ttl_seconds}s")
+                )
+                entry.expires_at = now + self.ttl_seconds
+                logger.info(f"⏱️ [{role.upper()}] Context cache TTL refreshed.")
+            except Exception as e:
+                logger.warning(f"Context cache refresh failed, recreating: {e}")
+                await self._delete(client, entry)  # Server မှာ ကျန်နေရင် Orphan မဖြစ်အောင်
+                entry = None
+                self._entries.pop(slot, None)
+
+        if entry:
+            return entry.name
+
+        # 3. Cache အသစ် ဆောက်မယ် (အရင်က မဖြစ်နိုင်ခဲ့ရင် ခဏကျော်မယ်)
+        unsupported_key = (model, prompt_hash, decl_hash)
+        if self._unsupported.get(unsupported_key, 0) > now:
+            return None
+
+        try:
+            cached = await client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    display_name=f"jarvis-{role}-{prompt_hash[:8]}-{decl_hash[:8]}",
+                    system_instruction=system_instruction,
+                    tools=tools,
+                    ttl=f"{self.ttl_seconds}s",
+                )
+            )
+            self._entries[slot] = _CacheEntry(cached.name, prompt_hash, decl_hash, now + self.ttl_seconds)
+            logger.info(f"🗄️ [{role.upper()}] Context cache created: {cached.name}")
+            return cached.name
+        except Exception as e:
+            if not self._is_unsupported_error(e):
+                # 429 / 5xx / Network Error က ယာယီဖြစ်လို့ မမှတ်ထားဘဲ နောက် Call မှာ ပြန်ဆောက်ကြည့်မယ်
+                logger.warning(f"[{role.upper()}] Context cache create failed, will retry on the next call: {e}")
+                return None
+            # Token နည်းလွန်းတာ (Minimum Token Count) စသဖြင့် မရရင် Uncached နဲ့ပဲ ဆက်သွားမယ်
+            logger.warning(f"[{role.upper()}] Context cache unsupported for this prompt, using uncached prompt: {e}")
+            self._unsupported = {key: until for key, until in self._unsupported.items() if until > now}
+            self._unsupported[unsupported_key] = now + self.ttl_seconds
+            return None
+
+    def invalidate(self, api_key: str, role: str, model: str):
+        """
+        Server ဘက်က Cache ပျက်/ပျောက်သွားရင် (ဥပမာ - Expire) Local Entry ကို ဖယ်မယ်
+        Server မှာ ကျန်နေသေးရင် Orphan မဖြစ်အောင် Slot ပြန်ဆောက်တဲ့အခါ (သို့) close() မှာ ဖျက်မယ်
+        """
+        slot = (api_key, role, model)
+        entry = self._entries.pop(slot, None)
+        if entry is not None:
+            self._orphans[slot] = entry
+
+    async def _delete(self, client, entry: _CacheEntry):
+        try:
+            await client.caches.delete(name=entry.name)
+        except Exception as e:
+            logger.debug(f"Context cache delete skipped: {e}")
+
+    async def close(self):
+        """Shutdown လုပ်တဲ့အခါ Storage ကုန်ကျစရိတ် မဖြစ်အောင် Cache တွေကို ဖျက်မယ်"""
+        entries = list(self._entries.items()) + list(self._orphans.items())
+        self._entries.clear()
+        self._orphans.clear()
+        self._locks.clear()
+        for (api_key, _, _), entry in entries:
+            await self._delete(client_pool.get_async_client(api_key), entry)
+
+# Singleton Instance
+context_cache = ContextCacheManager(
+    ttl_seconds=Config.CONTEXT_CACHE_TTL,
+    refresh_margin=Config.CONTEXT_CACHE_REFRESH_MARGIN,
+)
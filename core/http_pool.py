@@ -0,0 +1,135 @@
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from config import Config
+
+logger = logging.getLogger("JARVIS_HTTP_POOL")
+
+class FetchResult:
+    """Stream လုပ်ပြီး ဖတ်ထားတဲ့ Response (Body က max_bytes ထက် မပိုဘူး)"""
+    def __init__(self, url: str, status: int, headers: dict, content: bytes, encoding: str, truncated: bool):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.truncated = truncated
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding, errors="replace")
+        except LookupError:  # Server က မသိတဲ့ Charset ပြောရင်
+            return self.content.decode("utf-8", errors="replace")
+
+class HttpPool:
+    """
+    Web Tool တွေ (read_page_content စသည်) မျှသုံးမယ့် Long-lived httpx.AsyncClient.
+    - Keep-alive Connection Pool + HTTP/2 (h2 ရှိရင်) - URL တိုင်း TCP/TLS Handshake အသစ် မလုပ်တော့ဘူး
+    - gzip / brotli Decode ကို httpx က လုပ်ပေးမယ် (brotli Package ရှိရင် Accept-Encoding မှာ br ပါမယ်)
+    - Host တစ်ခုချင်းစီကို Semaphore နဲ့ ပြိုင်တူ Request ကန့်သတ်မယ်
+    - Body ကို Stream နဲ့ ဖတ်ပြီး max_bytes ရောက်တာနဲ့ ဖြတ်မယ် (MB လိုက် Page တွေ RAM ထဲ အကုန် မတင်တော့ဘူး)
+    """
+    def __init__(self):
+        self._client = None
+        self._loop = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "errors": 0, "truncated": 0, "bytes": 0, "latency_ms_total": 0.0}
+
+    def _get_client(self):
+        """Client ကို ပထမဆုံး Request မှာမှ ဆောက်မယ် (Event Loop ပြောင်းသွားရင် အသစ်ပြန်ဆောက်မယ်)"""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return self._client
+
+        import httpx
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            follow_redirects=True,
+            timeout=httpx.Timeout(Config.HTTP_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            headers={"User-Agent": Config.USER_AGENT},
+        )
+        self._loop = loop
+        self._host_limits = {}
+        logger.info(f"🔗 Shared HTTP client ready (http2={http2})")
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(Config.HTTP_PER_HOST_LIMIT)
+        return semaphore
+
+    async def fetch(self, url: str, max_bytes: int, headers: Optional[dict] = None) -> FetchResult:
+        """GET Request ကို Stream နဲ့ ဖတ်မယ်၊ 304 မဟုတ်တဲ့ 2xx ပြင်ပ Status ဆိုရင် httpx.HTTPStatusError တက်မယ်"""
+        client = self._get_client()
+        started = time.perf_counter()
+        try:
+            async with self._host_limit(url):
+                async with client.stream("GET", url, headers=headers) as response:
+                    # 304 Not Modified က Conditional GET (Page Cache) အတွက် Error မဟုတ်ဘူး
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                    chunks, size, truncated = [], 0, False
+                    async for chunk in response.aiter_bytes():
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= max_bytes:
+                            truncated = True
+                            break  # Context ထွက်တာနဲ့ Connection ကို ပိတ်ပြီး ကျန်တာ မ Download တော့ဘူး
+                    content = b"".join(chunks)[:max_bytes]
+                    result = FetchResult(str(response.url), response.status_code, dict(response.headers),
+                                         content, response.encoding, truncated)
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += len(content)
+            self._stats["truncated"] += int(truncated)
+            self._stats["latency_ms_total"] += (time.perf_counter() - started) * 1000
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self._stats["requests"] or 1
+            return {
+                "requests": self._stats["requests"],
+                "errors": self._stats["errors"],
+                "truncated": self._stats["truncated"],
+                "bytes": self._stats["bytes"],
+                "avg_latency_ms": round(self._stats["latency_ms_total"] / requests, 1),
+                "hosts": len(self._host_limits),
+            }
+
+    async def close(self):
+        """Shutdown မှာ Keep-alive Connection တွေကို ပိတ်မယ်"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+            logger.info("🔌 Shared HTTP client closed.")
+
+# Singleton Instance
+http_pool = HttpPool()
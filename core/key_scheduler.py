@@ -0,0 +1,226 @@
+import re
+import time
+import random
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from config import Config
+
+logger = logging.getLogger("JARVIS_KEY_SCHEDULER")
+
+class _KeyState:
+    """Key တစ်ခုချင်းစီရဲ့ Health, Quota (Token Bucket) နဲ့ Counter များ"""
+    def __init__(self, key: str, rpm: int):
+        self.key = key
+        self.capacity = float(max(rpm, 1))
+        self.tokens = self.capacity
+        self.refill_rate = self.capacity / 60.0  # တစ်စက္ကန့်ကို ပြန်ဖြည့်မယ့် Token
+        self.updated_at = time.monotonic()
+        self.cooldown_until = 0.0
+        self.consecutive_failures = 0
+        self.in_flight = 0
+        # --- Counters ---
+        self.requests = 0
+        self.successes = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    def refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        """ဒီ Key ပြန်သုံးလို့ရဖို့ ဘယ်လောက်စောင့်ရမလဲ"""
+        wait = max(0.0, self.cooldown_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.refill_rate)
+        return wait
+
+class KeyScheduler:
+    """
+    Rate-Limit ကို သိတဲ့ API Key Scheduler (itertools.cycle အစား)
+    - Key တစ်ခုချင်းစီကို Token Bucket နဲ့ Quota ထိန်းမယ်
+    - 429 ပြန်လာရင် Retry-After (သို့) Exponential Backoff + Jitter နဲ့ Cooldown ချမယ်
+    - ကျန်းမာတဲ့ Key တွေထဲက အလုပ်အနည်းဆုံး Key ကို ရွေးပေးမယ်
+    """
+    def __init__(self, keys: List[str], rpm: int, base_cooldown: float, max_cooldown: float):
+        self._states: Dict[str, _KeyState] = {k: _KeyState(k, rpm) for k in keys}
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+
+    # ==========================================
+    # Key ရွေးခြင်း
+    # ==========================================
+    def _try_pick(self, track: bool = True) -> Tuple[Optional[str], float]:
+        """အသုံးပြုလို့ရတဲ့ Key ကို ရွေးမယ်၊ မရှိရင် စောင့်ရမယ့်အချိန်ကို ပြန်ပေးမယ်"""
+        if not self._states:
+            raise ValueError("❌ No API Keys available! Check your .env file.")
+
+        with self._lock:
+            now = time.monotonic()
+            ready = []
+            shortest_wait = float("inf")
+            for state in self._states.values():
+                state.refill(now)
+                wait = state.wait_time(now)
+                if wait <= 0:
+                    ready.append(state)
+                else:
+                    shortest_wait = min(shortest_wait, wait)
+
+            if not ready:
+                return None, shortest_wait
+
+            # Load အနည်းဆုံး -> Token အများဆုံး -> သုံးထားတာ အနည်းဆုံး Key ကို ရွေးမယ်
+            best = min(ready, key=lambda s: (s.in_flight, -s.tokens, s.requests))
+            best.tokens -= 1
+            best.requests += 1
+            if track:
+                best.in_flight += 1
+            return best.key, 0.0
+
+    async def acquire(self, max_wait: float = None) -> str:
+        """ကျန်းမာတဲ့ Key ရတဲ့အထိ (Event Loop ကို မပိတ်ဘဲ) စောင့်ပြီး ယူမယ်"""
+        max_wait = Config.KEY_MAX_WAIT if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        while True:
+            key, wait = self._try_pick()
+            if key:
+                return key
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError("All API keys are cooling down (rate limited).")
+            logger.warning(f"⏳ All keys busy/cooling. Waiting {min(wait, remaining):.1f}s...")
+            await asyncio.sleep(min(wait, remaining))
+
+    def pick_nowait(self) -> str:
+        """
+        Sync ခေါ်သူတွေအတွက် - မစောင့်ဘဲ အမြန်ဆုံး ပြန်သုံးလို့ရမယ့် Key ကို ပေးမယ်
+        (In-flight မမှတ်ဘူး၊ ရလဒ်ကို report_outcome() နဲ့ ပြန်ပြောရမယ် - မပြောရင် 429 ရနေတဲ့ Key ကို ဆက်ပေးနေမယ်)
+        """
+        key, _ = self._try_pick(track=False)
+        if key:
+            return key
+        with self._lock:
+            now = time.monotonic()
+            best = min(self._states.values(), key=lambda s: s.wait_time(now))
+            best.requests += 1
+            return best.key
+
+    def release(self, key: str):
+        with self._lock:
+            state = self._states.get(key)
+            if state and state.in_flight > 0:
+                state.in_flight -= 1
+
+    # ==========================================
+    # ရလဒ် မှတ်တမ်းတင်ခြင်း
+    # ==========================================
+    def report_success(self, key: str):
+        with self._lock:
+            state = self._states.get(key)
+            if state:
+                state.successes += 1
+                state.consecutive_failures = 0
+
+    def report_failure(self, key: str, rate_limited: bool = False, retry_after: float = None):
+        with self._lock:
+            state = self._states.get(key)
+            if not state:
+                return
+            state.errors += 1
+            state.consecutive_failures += 1
+            if rate_limited:
+                state.rate_limited += 1
+                state.tokens = 0.0
+                cooldown = retry_after if retry_after else self.backoff_delay(state.consecutive_failures, self.base_cooldown, self.max_cooldown)
+            elif state.consecutive_failures >= 2:
+                # Network Error တွေ ဆက်တိုက်တက်နေရင်လည်း ခဏနားခိုင်းမယ်
+                cooldown = self.backoff_delay(state.consecutive_failures - 1, 1.0, self.max_cooldown)
+            else:
+                cooldown = 0.0
+            state.cooldown_until = max(state.cooldown_until, time.monotonic() + cooldown)
+            if cooldown:
+                logger.warning(f"🧊 Key ...{key[-4:]} cooling down for {cooldown:.1f}s (rate_limited={rate_limited})")
+
+    @staticmethod
+    def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+        """Exponential Backoff with Full Jitter"""
+        return random.uniform(base / 2, min(cap, base * (2 ** max(attempt - 1, 0))))
+
+    @staticmethod
+    def classify_error(error: Exception) -> Tuple[bool, Optional[float], bool]:
+        """
+        Error ကို (rate_limited, retry_after စက္ကန့်, retryable) အဖြစ် ခွဲထုတ်မယ်
+        408 / 429 မဟုတ်တဲ့ 4xx (INVALID_ARGUMENT, Safety Block, Permission စသည်) က Key ပြောင်းလည်း အတူတူပဲမို့ retryable=False
+        """
+        text = str(error)
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        if not isinstance(code, int):
+            # google-genai ရဲ့ Error က "400 INVALID_ARGUMENT. {...}" ပုံစံနဲ့ စတယ်
+            match = re.match(r"\s*(\d{3})\b", text)
+            code = int(match.group(1)) if match else None
+        rate_limited = code == 429 or "429" in text or "quota" in text.lower() or "RESOURCE_EXHAUSTED" in text
+        retryable = rate_limited or code is None or not (400 <= code < 500) or code == 408
+
+        retry_after = None
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            try:
+                value = headers.get("retry-after") or headers.get("Retry-After")
+                if value:
+                    retry_after = float(value)
+            except (TypeError, ValueError):
+                pass
+        if retry_after is None:
+            # Gemini က RetryInfo ထဲမှာ "retryDelay": "23s" လို့ ပြန်ပို့တတ်တယ်
+            match = re.search(r"retry[_ ]?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", text, re.IGNORECASE)
+            if match:
+                retry_after = float(match.group(1))
+        return rate_limited, retry_after, retryable
+
+    def report_outcome(self, key: str, error: Exception = None):
+        """
+        Retry Loop မရှိတဲ့ pick_nowait() ခေါ်သူတွေ (Reflector, browser_visual) အတွက် - Call ရလဒ်ကို Scheduler ဆီ ပြန်ပြောမယ်
+        (429 ဆို Cooldown ချမယ်၊ Retry မရတဲ့ 4xx ဆို Key ရဲ့ အပြစ်မဟုတ်လို့ မမှတ်ဘူး)
+        """
+        if error is None:
+            self.report_success(key)
+            return
+        rate_limited, retry_after, retryable = self.classify_error(error)
+        if retryable:
+            self.report_failure(key, rate_limited=rate_limited, retry_after=retry_after)
+
+    # ==========================================
+    # Stats
+    # ==========================================
+    def stats(self) -> Dict[str, dict]:
+        """Key တစ်ခုချင်းစီရဲ့ Usage / Error Counter များ"""
+        with self._lock:
+            now = time.monotonic()
+            report = {}
+            for state in self._states.values():
+                state.refill(now)
+                report[f"...{state.key[-4:]}"] = {
+                    "requests": state.requests,
+                    "successes": state.successes,
+                    "errors": state.errors,
+                    "rate_limited": state.rate_limited,
+                    "in_flight": state.in_flight,
+                    "tokens_left": round(state.tokens, 2),
+                    "cooldown_remaining": round(max(0.0, state.cooldown_until - now), 1),
+                }
+            return report
+
+# Singleton Instance
+key_scheduler = KeyScheduler(
+    keys=Config.API_KEYS,
+    rpm=Config.KEY_RPM_LIMIT,
+    base_cooldown=Config.KEY_COOLDOWN_SECONDS,
+    max_cooldown=Config.KEY_MAX_COOLDOWN,
+)
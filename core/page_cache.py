@@ -0,0 +1,222 @@
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from config import Config
+
+logger = logging.getLogger("JARVIS_PAGE_CACHE")
+
+class PageCache:
+    """
+    read_page_content အတွက် On-disk Page Cache (SQLite).
+    - pages: URL -> Content Hash + ETag / Last-Modified + Fetch/Access အချိန်
+    - blobs: Content Hash (SHA-256) -> zlib ချုံ့ထားတဲ့ HTML + Markdown (URL မတူပေမယ့် Content တူရင် တစ်ခါပဲ သိမ်း/Parse မယ်)
+    - Domain အလိုက် TTL အတွင်းဆို Network ကော BeautifulSoup/html2text ကော မထိဘူး၊ TTL ကျော်ရင် Conditional GET နဲ့ ပြန်စစ်မယ်
+    - Blob Size စုစုပေါင်း max_bytes ကျော်ရင် အကြာဆုံး မသုံးရသေးတဲ့ Page တွေကို ဖယ်မယ် (LRU)
+    """
+    def __init__(self, path: Optional[str], max_bytes: int, default_ttl: float, domain_ttls: Dict[str, float]):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.domain_ttls = domain_ttls
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "parse_reused": 0, "bytes_saved": 0}
+        self._db = None
+        if path:
+            self._open(path)
+
+    def _open(self, path: str):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript('''
+                CREATE TABLE IF NOT EXISTS blobs (
+                    hash TEXT PRIMARY KEY,
+                    html BLOB,
+                    markdown BLOB,
+                    raw_size INTEGER,
+                    size INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    hash TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL,
+                    accessed_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages (accessed_at);
+                CREATE INDEX IF NOT EXISTS idx_pages_hash ON pages (hash);
+            ''')
+            self._db.commit()
+        except Exception as e:
+            logger.error(f"❌ Page Cache Error (disabled): {e}")
+            self._db = None
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        """Host (သို့) Parent Domain အလိုက် TTL (news.example.com က example.com ရဲ့ TTL ကို ယူမယ်)"""
+        host = urlsplit(url).hostname or ""
+        while host:
+            if host in self.domain_ttls:
+                return self.domain_ttls[host]
+            host = host.partition(".")[2]
+        return self.default_ttl
+
+    # ==========================================
+    # Lookup
+    # ==========================================
+    def lookup(self, url: str) -> Optional[dict]:
+        """Cache ထဲက Page (fresh = TTL မကျော်သေး) - မရှိရင် None"""
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT p.etag, p.last_modified, p.fetched_at, b.markdown, b.raw_size "
+                "FROM pages p JOIN blobs b ON b.hash = p.hash WHERE p.url = ?", (url,)
+            ).fetchone()
+            if not row:
+                return None
+            etag, last_modified, fetched_at, markdown, raw_size = row
+            fresh = time.time() - fetched_at < self.ttl_for(url)
+            if fresh:
+                self._db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+                self._db.commit()
+                self._stats["hits"] += 1
+                self._stats["bytes_saved"] += raw_size
+        return {
+            "markdown": zlib.decompress(markdown).decode("utf-8"),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": fresh,
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """Stale Entry အတွက် If-None-Match / If-Modified-Since Header"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, url: str, headers: dict):
+        """Server က 304 Not Modified ပြန်ရင် - TTL ကို ပြန်စမယ်၊ Body မ Download ရလို့ Bytes Saved ထဲ ထည့်မယ်"""
+        if self._db is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (now, now, headers.get("etag"), headers.get("last-modified"), url)
+            )
+            self._db.commit()
+            row = self._db.execute(
+                "SELECT b.raw_size FROM pages p JOIN blobs b ON b.hash = p.hash WHERE p.url = ?", (url,)
+            ).fetchone()
+            self._stats["revalidated"] += 1
+            self._stats["bytes_saved"] += row[0] if row else 0
+
+    def markdown_for(self, digest: str) -> Optional[str]:
+        """Content တူတာ Parse ပြီးသားရှိရင် (URL မတူလည်း) Markdown ကို ပြန်သုံးမယ်"""
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT markdown FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if row:
+                self._stats["parse_reused"] += 1
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    # ==========================================
+    # Store / Evict
+    # ==========================================
+    def store(self, url: str, content: bytes, markdown: str, headers: dict, digest: Optional[str] = None):
+        with self._lock:
+            self._stats["misses"] += 1
+        if self._db is None or "no-store" in headers.get("cache-control", "").lower():
+            return
+        digest = digest or self.content_hash(content)
+        now = time.time()
+        html_blob = zlib.compress(content, 6)
+        markdown_blob = zlib.compress(markdown.encode("utf-8"), 6)
+        if len(html_blob) + len(markdown_blob) > self.max_bytes:
+            return  # Cache တစ်ခုလုံးထက် ကြီးတဲ့ Page ကြောင့် တခြား Page တွေ အကုန် မပျောက်အောင်
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO blobs (hash, html, markdown, raw_size, size) VALUES (?, ?, ?, ?, ?)",
+                    (digest, html_blob, markdown_blob, len(content), len(html_blob) + len(markdown_blob))
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (url, hash, etag, last_modified, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, digest, headers.get("etag"), headers.get("last-modified"), now, now)
+                )
+                self._evict(keep_url=url)
+                self._db.commit()
+        except Exception as e:
+            logger.debug(f"Page cache write skipped: {e}")
+
+    def _evict(self, keep_url: str):
+        """Blob Size စုစုပေါင်း max_bytes အောက် ရောက်တဲ့အထိ LRU Page တွေကို ဖယ်မယ် (Lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်)"""
+        # URL ပြောင်းသွားလို့ ဘယ် Page ကမှ မသုံးတော့တဲ့ Blob တွေကို အရင်ဖယ်မယ်
+        self._db.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT hash FROM pages)")
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        evicted = 0
+        while total > self.max_bytes:
+            oldest = self._db.execute(
+                "SELECT url FROM pages WHERE url != ? ORDER BY accessed_at ASC LIMIT 20", (keep_url,)
+            ).fetchall()
+            if not oldest:
+                break
+            self._db.executemany("DELETE FROM pages WHERE url = ?", oldest)
+            self._db.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT hash FROM pages)")
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            evicted += len(oldest)
+        if evicted:
+            logger.info(f"🧹 Page cache evicted {evicted} page(s) ({total} bytes left)")
+
+    # ==========================================
+    # Stats
+    # ==========================================
+    def stats(self) -> dict:
+        with self._lock:
+            entries, disk_bytes = 0, 0
+            if self._db is not None:
+                entries = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+                disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            served = self._stats["hits"] + self._stats["revalidated"]
+            total = served + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(served / total, 3) if total else 0.0,
+                "entries": entries,
+                "disk_bytes": disk_bytes,
+                "enabled": self._db is not None,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+# Singleton Instance
+page_cache = PageCache(
+    path=Config.PAGE_CACHE_PATH if Config.PAGE_CACHE_ENABLED else None,
+    max_bytes=Config.PAGE_CACHE_MAX_MB * 1024 * 1024,
+    default_ttl=Config.PAGE_CACHE_DEFAULT_TTL,
+    domain_ttls=Config.PAGE_CACHE_DOMAIN_TTLS,
+)
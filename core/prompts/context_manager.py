@@ -7,23 +7,12 @@ logger = logging.getLogger("JARVIS_CONTEXT")
 
 class ContextManager:
     @staticmethod
-    def get_current_context() -> str:
-        """အချိန်နှင့် User ရဲ့ မှတ်ဉာဏ်တွေကို စုစည်းပေးခြင်း"""
-        
-        # 1. လက်ရှိ မြန်မာစံတော်ချိန်ကို ယူမယ်
+    def _format_context(profile_str: str) -> str:
+        # လက်ရှိ မြန်မာစံတော်ချိန်ကို ယူမယ်
         current_time = datetime.datetime.now(Config.TIMEZONE)
         time_str = current_time.strftime("%Y-%m-%d %I:%M %p (%A)")
-        
-        # 2. Database (Long-term Memory) ထဲက User Profile ကို သွားဆွဲထုတ်မယ် (ဒီနေရာကို ပြင်ထားပါတယ်)
-        profile_str = "- No specific user facts saved yet."
-        try:
-            fetched_profile = memory_controller.get_all_user_facts(Config.ALLOWED_USER_ID)
-            if fetched_profile:
-                profile_str = fetched_profile
-        except Exception as e:
-            logger.error(f"Error loading user profile: {e}")
 
-        # 3. Jarvis နားလည်မယ့် Context စာသားအဖြစ် ပြောင်းမယ်
+        # Jarvis နားလည်မယ့် Context စာသားအဖြစ် ပြောင်းမယ်
         context = f"""
 [SYSTEM CONTEXT - DO NOT IGNORE]
 🕒 Current Time: {time_str}
@@ -33,5 +22,31 @@ class ContextManager:
 """
         return context.strip()
 
+    @staticmethod
+    def get_current_context() -> str:
+        """အချိန်နှင့် User ရဲ့ မှတ်ဉာဏ်တွေကို စုစည်းပေးခြင်း"""
+        # Database (Long-term Memory) ထဲက User Profile ကို သွားဆွဲထုတ်မယ် (Memory Controller က Cache လုပ်ထားတယ်)
+        # fact_tool က ALLOWED_USER_ID အောက်မှာ သိမ်းလို့ Sub-Agent (user_id=999999) တွေကပါ Owner Profile ကို ဒီ Key နဲ့ပဲ ဖတ်ရမယ်
+        profile_str = "- No specific user facts saved yet."
+        try:
+            fetched_profile = memory_controller.get_all_user_facts(Config.ALLOWED_USER_ID)
+            if fetched_profile:
+                profile_str = fetched_profile
+        except Exception as e:
+            logger.error(f"Error loading user profile: {e}")
+        return ContextManager._format_context(profile_str)
+
+    @staticmethod
+    async def aget_current_context() -> str:
+        """get_current_context ရဲ့ Async Version (Profile ကို SQL Thread Pool ကနေ ဖတ်မယ်)"""
+        profile_str = "- No specific user facts saved yet."
+        try:
+            fetched_profile = await memory_controller.aget_all_user_facts(Config.ALLOWED_USER_ID)
+            if fetched_profile:
+                profile_str = fetched_profile
+        except Exception as e:
+            logger.error(f"Error loading user profile: {e}")
+        return ContextManager._format_context(profile_str)
+
 # တခြားနေရာကနေ အလွယ်တကူ လှမ်းခေါ်လို့ရအောင် instance ဆောက်ပေးထားမယ်
 context_manager = ContextManager()
\ No newline at end of file
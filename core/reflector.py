@@ -1,7 +1,8 @@
 import logging
-from google import genai
 from google.genai import types
 from config import Config
+from core.client_pool import client_pool
+from core.key_scheduler import key_scheduler
 
 logger = logging.getLogger("JARVIS_REFLECTOR")
 
@@ -12,10 +13,8 @@ class JarvisReflector:
         Uses a Thinking Model to fix code or command errors.
         """
         self.model = Config.SMART_MODEL_NAME
-        self.api_key = Config.get_next_api_key() # Key Rotation သုံးမယ်
-        self.client = genai.Client(api_key=self.api_key)
 
-    def reflect_and_fix(self, task: str, failed_command: str, error_log: str) -> str:
+    async def reflect_and_fix(self, task: str, failed_command: str, error_log: str) -> str:
         """
         Analyze the error and propose a FIXED command.
         """
@@ -43,13 +42,21 @@ class JarvisReflector:
         """
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.2, # တိကျရမယ်၊ လျှောက်မရွှီးရဘူး
+            # Key Rotation သုံးပြီး Pool ထဲက Client ကိုပဲ ပြန်သုံးမယ်
+            api_key = Config.get_next_api_key()
+            client = client_pool.get_async_client(api_key)
+            try:
+                response = await client.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.2, # တိကျရမယ်၊ လျှောက်မရွှီးရဘူး
+                    )
                 )
-            )
+            except Exception as e:
+                key_scheduler.report_outcome(api_key, e)  # 429 ဆို Scheduler က ဒီ Key ကို ခဏနားခိုင်းမယ်
+                raise
+            key_scheduler.report_outcome(api_key)
             
             fixed_command = response.text.strip().replace("`", "")
             logger.info(f"💡 Reflector proposed fix: {fixed_command}")
@@ -1,31 +1,84 @@
 import os
+import sys
+import time
+import asyncio
+import hashlib
 import importlib
 import inspect
 import logging
-from typing import Dict, List
+import threading
+from typing import Dict, List, Tuple
 from google.genai import types
 
 from tools.base import BaseTool
+from config import Config
 
 logger = logging.getLogger("TOOL_REGISTRY")
 
 class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        self._exclusive_lock = None  # concurrency_safe = False Tool တွေကို တစ်ခုပြီးမှ တစ်ခု Run ဖို့
+        # --- Incremental Reload State ---
+        self._manifest: Dict[str, Tuple[float, str]] = {}   # file path -> (mtime, sha1)
+        self._module_tools: Dict[str, List[str]] = {}       # module name -> tool names
+        self._decl_cache: Dict[str, Tuple[int, List[types.FunctionDeclaration]]] = {}  # role -> (generation, declarations)
+        self.generation = 0   # Tool တစ်ခုခု ပြောင်းတိုင်း တိုးမယ် (Declaration Cache ကို Invalidate လုပ်ဖို့)
+        self._dirty = False
+        self._last_scan = 0.0
+        self._scan_lock = threading.RLock()
         self._discover_and_load_tools("tools")
-        self.reload_custom_tools() # Tool အသစ်တွေကိုပါ ဆွဲသွင်းမယ်
+        self.reload_custom_tools(force=True) # Tool အသစ်တွေကိုပါ ဆွဲသွင်းမယ်
 
-    def reload_custom_tools(self):
-        """Agent က Tool အသစ်ရေးပြီးတိုင်း Auto Update လုပ်ပေးမည့်စနစ်"""
-        if os.path.exists("custom_skills"):
-            self._discover_and_load_tools("custom_skills")
+    def mark_dirty(self):
+        """tools/ (သို့) custom_skills/ ထဲ ဖိုင်ရေးလိုက်ရင် ခေါ်ပါ - နောက် Reload မှာ ပြန်စစ်မယ်"""
+        self._dirty = True
 
-    def _discover_and_load_tools(self, package_name: str = "tools"):
+    def reload_custom_tools(self, force: bool = False) -> bool:
+        """
+        Agent က Tool အသစ်ရေးပြီးတိုင်း Auto Update လုပ်ပေးမည့်စနစ်။
+        Dirty ဖြစ်မှ (သို့) TOOL_RESCAN_INTERVAL ကျော်မှပဲ Filesystem ကို စစ်မယ်၊ ပြောင်းတဲ့ Module ကိုပဲ Reload လုပ်မယ်။
+        """
+        interval = Config.TOOL_RESCAN_INTERVAL
+        interval_due = interval > 0 and time.monotonic() - self._last_scan >= interval
+        if not (force or self._dirty or interval_due):
+            return False
+
+        with self._scan_lock:
+            self._dirty = False
+            self._last_scan = time.monotonic()
+            changed = self._discover_and_load_tools("tools")
+            if os.path.exists("custom_skills"):
+                changed = self._discover_and_load_tools("custom_skills") or changed
+            return changed
+
+    def _register_module_tools(self, module, module_name: str):
+        """Module ထဲမှာ တကယ် Define လုပ်ထားတဲ့ BaseTool subclass တွေကိုပဲ Register လုပ်မယ်"""
+        self._unregister_module(module_name)
+        names = []
+        # ထို Module ထဲမှာ BaseTool ကို inherit လုပ်ထားတဲ့ Class တွေကို ရှာမယ်
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseTool) and obj is not BaseTool and obj.__module__ == module.__name__:
+                tool_instance = obj() # Class ကို အသက်သွင်းမယ်
+                self._tools[tool_instance.name] = tool_instance
+                names.append(tool_instance.name)
+                logger.info(f"🔌 Tool တွဲချိတ်ပြီးပါပြီ: {tool_instance.name} (from {module_name})")
+        self._module_tools[module_name] = names
+
+    def _unregister_module(self, module_name: str):
+        for tool_name in self._module_tools.pop(module_name, []):
+            self._tools.pop(tool_name, None)
+
+    def _discover_and_load_tools(self, package_name: str = "tools") -> bool:
         """
         tools/ folder အောက်က .py ဖိုင်မှန်သမျှကို အလိုအလျောက် လိုက်ရှာပြီး 
         BaseTool subclass တွေကို Register လုပ်ပေးမယ့် စနစ်။
+        Manifest (path, mtime, hash) နဲ့ တိုက်စစ်ပြီး အသစ်/ပြောင်းထားတဲ့ Module ကိုပဲ Import/Reload လုပ်မယ်၊
+        ဖျက်လိုက်တဲ့ ဖိုင်ရဲ့ Tool တွေကို ဖြုတ်မယ်။ တစ်ခုခုပြောင်းရင် True ပြန်ပေးမယ်။
         """
         package_dir = os.path.join(os.getcwd(), package_name)
+        seen = set()
+        changed = False
         
         # 1. tools/ အောက်က folder တွေ၊ ဖိုင်တွေကို လိုက်မွှေမယ်
         for root, dirs, files in os.walk(package_dir):
@@ -34,25 +87,58 @@ class ToolRegistry:
                 
             for file in files:
                 if file.endswith(".py") and file != "__init__.py" and file != "base.py":
+                    path = os.path.join(root, file)
+                    seen.add(path)
                     # ဖိုင်လမ်းကြောင်းကို Python Module နာမည်ပြောင်းမယ် (ဥပမာ: tools.system.shell)
-                    module_rel_path = os.path.relpath(os.path.join(root, file), os.getcwd())
+                    module_rel_path = os.path.relpath(path, os.getcwd())
                     module_name = module_rel_path.replace(os.path.sep, ".")[:-3]
-                    
+
                     try:
-                        # Module ကို Dynamic လှမ်းခေါ်မယ်
-                        module = importlib.import_module(module_name)
-                        
-                        # ထို Module ထဲမှာ BaseTool ကို inherit လုပ်ထားတဲ့ Class တွေကို ရှာမယ်
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            if issubclass(obj, BaseTool) and obj is not BaseTool:
-                                tool_instance = obj() # Class ကို အသက်သွင်းမယ်
-                                self._tools[tool_instance.name] = tool_instance
-                                logger.info(f"🔌 Tool တွဲချိတ်ပြီးပါပြီ: {tool_instance.name} (from {module_name})")
+                        mtime = os.path.getmtime(path)
+                        previous = self._manifest.get(path)
+                        if previous and previous[0] == mtime:
+                            continue  # မပြောင်းဘူး
+                        with open(path, "rb") as f:
+                            digest = hashlib.sha1(f.read()).hexdigest()
+                        if previous and previous[1] == digest:
+                            self._manifest[path] = (mtime, digest)  # Touch ပဲလုပ်ထားတာ၊ Content မပြောင်း
+                            continue
+                        self._manifest[path] = (mtime, digest)
+                    except OSError as e:
+                        logger.error(f"❌ '{path}' ကို ဖတ်မရပါ: {e}")
+                        continue
+
+                    try:
+                        # Module ကို Dynamic လှမ်းခေါ်မယ် (ရှိပြီးသားဆိုရင် Reload)
+                        if previous and module_name in sys.modules:
+                            module = importlib.reload(sys.modules[module_name])
+                            logger.info(f"♻️ Reloaded changed tool module: {module_name}")
+                        else:
+                            module = importlib.import_module(module_name)
+                        self._register_module_tools(module, module_name)
+                        changed = True
                     except Exception as e:
                         logger.error(f"❌ '{module_name}' ကို ခေါ်ယူရာတွင် အမှားဖြစ်နေသည်: {e}")
 
+        # 2. ဖျက်လိုက်တဲ့ ဖိုင်တွေရဲ့ Tool တွေကို Registry ကနေ ဖြုတ်မယ်
+        for path in [p for p in self._manifest if p.startswith(package_dir + os.sep) and p not in seen]:
+            self._manifest.pop(path)
+            module_name = os.path.relpath(path, os.getcwd()).replace(os.path.sep, ".")[:-3]
+            self._unregister_module(module_name)
+            sys.modules.pop(module_name, None)
+            logger.info(f"🗑️ Tool module removed: {module_name}")
+            changed = True
+
+        if changed:
+            self.generation += 1
+        return changed
+
     def get_declarations_for_role(self, role: str) -> List[types.FunctionDeclaration]:
-        """Role အလိုက် သင့်တော်တဲ့ Tool များကိုသာ ရွေးထုတ်ပေးမည့် Auto-Router"""
+        """Role အလိုက် သင့်တော်တဲ့ Tool များကိုသာ ရွေးထုတ်ပေးမည့် Auto-Router (Generation မပြောင်းမချင်း Memoize လုပ်ထားမယ်)"""
+        cached = self._decl_cache.get(role)
+        if cached and cached[0] == self.generation:
+            return cached[1]
+
         declarations = []
         for tool in self._tools.values():
             assigned_role = getattr(tool, "owner_role", "all")
@@ -77,7 +163,8 @@ class ToolRegistry:
             # ကိုယ့် Role နဲ့ ကိုက်ညီရင် (သို့) အကုန်သုံးလို့ရတဲ့ Tool ဆိုရင် ခေါင်းထဲထည့်ပေးမယ်
             if assigned_role == "all" or assigned_role == role:
                 declarations.append(tool.get_declaration())
-                
+
+        self._decl_cache[role] = (self.generation, declarations)
         return declarations
 
     async def execute_tool(self, tool_name: str, **kwargs) -> str:
@@ -88,10 +175,21 @@ class ToolRegistry:
         if tool_name not in self._tools:
             return f"Error: Tool '{tool_name}' ကို Registry တွင် ရှာမတွေ့ပါ။"
         
+        tool = self._tools[tool_name]
+        timeout = getattr(tool, "timeout", None)
         try:
-            tool = self._tools[tool_name]
-            # Tool ရဲ့ execute function ကို kwargs တွေ ထည့်ပြီး run မယ်
-            return await tool.execute(**kwargs)
+            # Tool ရဲ့ execute function ကို kwargs တွေ ထည့်ပြီး run မယ် (Tool တစ်ခုချင်းစီမှာ ကိုယ်ပိုင် Timeout ရှိမယ်)
+            if getattr(tool, "concurrency_safe", True):
+                return await asyncio.wait_for(tool.execute(**kwargs), timeout)
+
+            # Shared Resource သုံးတဲ့ Tool တွေကို ပြိုင်တူ မ Run ရအောင် Lock ခံမယ်
+            if self._exclusive_lock is None:
+                self._exclusive_lock = asyncio.Lock()
+            async with self._exclusive_lock:
+                return await asyncio.wait_for(tool.execute(**kwargs), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Tool '{tool_name}' timed out after {timeout}s")
+            return f"Tool Timeout ({tool_name}): No result within {timeout} seconds."
         except Exception as e:
             logger.error(f"Tool '{tool_name}' အလုပ်လုပ်ရာတွင် Error တက်သွားသည်: {e}")
             return f"Tool Execution Error ({tool_name}): {str(e)}"
@@ -0,0 +1,259 @@
+import os
+import re
+import time
+import uuid
+import shlex
+import tempfile
+import asyncio
+import logging
+import threading
+from typing import Optional
+from config import Config
+
+logger = logging.getLogger("JARVIS_SANDBOX")
+
+try:
+    import resource
+except ImportError:  # Linux မဟုတ်ရင် rlimit မရှိ
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+IONICE_CLASSES = ("best-effort", "idle")  # realtime ကို Root Process မှာတောင် မပေးဘူး
+_TIMES_FIELD = re.compile(r"(\d+)m(\d+(?:[.,]\d+)?)s")
+
+class ResourceMonitor:
+    """
+    Shell Process Tree (Shell + Child/Grandchild) ရဲ့ RSS / CPU Time ကို psutil နဲ့ Sample ယူမယ်။
+    - CPU = Command ပြီးရင် Shell ရဲ့ `times` Builtin (Wait ပြီးသား Children ရဲ့ rusage) နဲ့ အတိအကျ ယူမယ်
+      (Sample နဲ့ဆို ခဏပဲ Run တဲ့ Command က Sample မမိခင် ပြီးသွားလို့ ~0 ပဲ ပြနေတာ)
+    - Timeout / exit ကြောင့် `times` မရရင် Live Process တွေရဲ့ Sample (အမြင့်ဆုံး) နဲ့ ခန့်မှန်းမယ်
+    - Baseline ကို Command မစခင် ယူထားလို့ Persistent Session မှာလည်း Command တစ်ခုချင်းစီရဲ့ တန်ဖိုးကိုပဲ ရမယ်
+    """
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.peak_rss = 0
+        self._baseline_cpu = None
+        self._max_cpu = 0.0
+        self._rusage_cpu = None
+        self._started = time.monotonic()
+        self.wall_seconds = 0.0
+        self.times_path = os.path.join(tempfile.gettempdir(), f"jarvis-times-{uuid.uuid4().hex}")
+
+    def wrap(self, line: str) -> str:
+        """
+        Shell Script Line ကို `times` နှစ်ခါကြား ညှပ်မယ် (Command ရဲ့ Exit Code ကို $__jarvis_rc မှာ ထားပေးမယ်)
+        Output ကို File ထဲ ရေးလို့ Command ရဲ့ stdout/stderr နဲ့ မရောဘူး
+        """
+        path = shlex.quote(self.times_path)
+        return f"times > {path} 2>/dev/null\n{line}\n__jarvis_rc=$?\ntimes >> {path} 2>/dev/null\n"
+
+    def _read_times(self) -> Optional[float]:
+        """`times` ရဲ့ Children Line (before / after) ကို နုတ်ပြီး Command ရဲ့ CPU (user + sys) ကို ပြန်ပေးမယ်"""
+        try:
+            with open(self.times_path) as f:
+                lines = [line for line in f.read().splitlines() if line.strip()]
+            os.unlink(self.times_path)
+        except OSError:
+            return None
+        if len(lines) != 4:
+            return None  # Command က Shell ကို exit လုပ်သွားလို့ After မရ
+        def children(line):
+            return sum(int(m) * 60 + float(sec.replace(",", ".")) for m, sec in _TIMES_FIELD.findall(line))
+        return max(children(lines[3]) - children(lines[1]), 0.0)
+
+    def sample(self):
+        if psutil is None:
+            return
+        try:
+            root = psutil.Process(self.pid)
+            procs = [root] + root.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return
+        rss, cpu = 0, 0.0
+        for proc in procs:
+            try:
+                with proc.oneshot():
+                    rss += proc.memory_info().rss
+                    times = proc.cpu_times()
+                    cpu += times.user + times.system + times.children_user + times.children_system
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        if self._baseline_cpu is None:
+            self._baseline_cpu = cpu
+        self._max_cpu = max(self._max_cpu, cpu)
+        # Session Shell ကိုယ်တိုင်ရဲ့ RSS ပါ ပါနေမယ် (ဘယ်လောက် RAM ဖိထားလဲ ဆိုတာပဲ သိချင်တာမို့ ရတယ်)
+        self.peak_rss = max(self.peak_rss, rss)
+
+    async def run(self, interval: float):
+        """Command Run နေသမျှ Background မှာ Sample ယူမယ် (Cancel လုပ်မှ ရပ်မယ်)"""
+        while True:
+            self.sample()
+            await asyncio.sleep(interval)
+
+    def finish(self, cgroup_peak: Optional[int] = None):
+        self.wall_seconds = time.monotonic() - self._started
+        self._rusage_cpu = self._read_times()
+        if cgroup_peak:
+            self.peak_rss = cgroup_peak  # cgroup v2 memory.peak က Sample မလွတ်တဲ့ တကယ့် Peak
+
+    @property
+    def cpu_seconds(self) -> float:
+        if self._rusage_cpu is not None:
+            return self._rusage_cpu
+        if self._baseline_cpu is None:
+            return 0.0
+        return max(self._max_cpu - self._baseline_cpu, 0.0)
+
+    def summary(self) -> str:
+        if psutil is None and not self.peak_rss:
+            cpu = f"CPU ~{self._rusage_cpu:.2f}s | " if self._rusage_cpu is not None else ""
+            return f"[Resources] {cpu}wall {self.wall_seconds:.2f}s (psutil not installed)"
+        return (f"[Resources] peak RSS ~{self.peak_rss / (1024 * 1024):.1f} MB | "
+                f"CPU ~{self.cpu_seconds:.2f}s | wall {self.wall_seconds:.2f}s")
+
+class ShellSandbox:
+    """
+    shell_exec Command တွေကို 2GB VPS ပေါ်မှာ Bot / Chromium ကို မထိခိုက်အောင် ကန့်သတ်ပေးမယ့်စနစ်။
+    - rlimit: CPU Time, Data Segment, Open Files, Process Count (prlimit နဲ့ Process စတာနဲ့ ချက်ချင်း)
+    - nice / ionice: Interactive Bot ထက် Priority နိမ့်အောင်
+    - cgroup v2 (Optional): SHELL_CGROUP_ROOT ပေးထားရင် Command တစ်ခုချင်းစီကို Child cgroup ထဲ ထည့်မယ်
+    - Command တစ်ခုချင်းစီရဲ့ Peak RSS / CPU Time ကို Metrics အဖြစ် မှတ်မယ်
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"commands": 0, "timeouts": 0, "cpu_seconds_total": 0.0, "wall_seconds_total": 0.0,
+                       "max_peak_rss_mb": 0.0, "last": None}
+
+    # ==========================================
+    # 🔒 Limits
+    # ==========================================
+    def confine(self, pid: int) -> Optional[str]:
+        """
+        Shell Process စပြီး Command မရေးခင် ခေါ်ရမယ် (နောက်က Fork မယ့် Child တွေက Inherit လုပ်မယ်)
+        cgroup ထဲ ထည့်နိုင်ရင် cgroup Path ကို ပြန်ပေးမယ်
+        """
+        cgroup = self._attach_cgroup(pid)
+        self._apply_rlimits(pid, use_cgroup=cgroup is not None)
+        self._apply_priority(pid)
+        return cgroup
+
+    def _apply_rlimits(self, pid: int, use_cgroup: bool):
+        if resource is None or not hasattr(resource, "prlimit"):
+            return
+        limits = [
+            (resource.RLIMIT_CPU, Config.SHELL_LIMIT_CPU_SECONDS),
+            (resource.RLIMIT_NOFILE, Config.SHELL_LIMIT_OPEN_FILES),
+        ]
+        # cgroup ရှိရင် Memory / Process ကို cgroup က (RSS / Group အလိုက်) ပိုမှန်မှန် ကန့်သတ်ပေးမယ်
+        # cgroup မရှိရင် RLIMIT_DATA (Heap + Private Anonymous Mapping) ကိုသုံးမယ် - RLIMIT_AS က Reserve ပဲလုပ်ထားတဲ့
+        # Virtual Memory ကိုပါ ရေတွက်လို့ JVM / Go / Node တွေ RAM မသုံးခင်ကတည်းက စမရဘဲ ပျက်တတ်တယ်
+        if not use_cgroup:
+            limits.append((resource.RLIMIT_DATA, Config.SHELL_LIMIT_MEMORY_MB * 1024 * 1024))
+            limits.append((resource.RLIMIT_NPROC, Config.SHELL_LIMIT_PROCESSES))
+        limits.append((resource.RLIMIT_AS, Config.SHELL_LIMIT_ADDRESS_SPACE_MB * 1024 * 1024))
+        for kind, value in limits:
+            if value <= 0:
+                continue
+            try:
+                _, hard = resource.prlimit(pid, kind)
+                if hard != resource.RLIM_INFINITY:
+                    value = min(value, hard)
+                # CPU ဆိုရင် Soft မှာ SIGXCPU (Error Message ထွက်) ပြီး Hard မှာမှ SIGKILL
+                new_hard = value + 5 if kind == resource.RLIMIT_CPU and hard == resource.RLIM_INFINITY else value
+                resource.prlimit(pid, kind, (value, new_hard))
+            except (OSError, ValueError) as e:
+                logger.debug(f"rlimit {kind} skipped: {e}")
+
+    def _apply_priority(self, pid: int):
+        try:
+            if Config.SHELL_NICE:
+                os.setpriority(os.PRIO_PROCESS, pid, Config.SHELL_NICE)
+        except OSError as e:
+            logger.debug(f"nice skipped: {e}")
+        io_class = Config.SHELL_IONICE_CLASS
+        if io_class not in IONICE_CLASSES or psutil is None or not hasattr(psutil, "IOPRIO_CLASS_BE"):
+            return
+        try:
+            if io_class == "idle":
+                psutil.Process(pid).ionice(psutil.IOPRIO_CLASS_IDLE)
+            else:
+                psutil.Process(pid).ionice(psutil.IOPRIO_CLASS_BE, Config.SHELL_IONICE_LEVEL)
+        except (psutil.Error, OSError, ValueError) as e:
+            logger.debug(f"ionice skipped: {e}")
+
+    def _attach_cgroup(self, pid: int) -> Optional[str]:
+        root = Config.SHELL_CGROUP_ROOT
+        if not root:
+            return None
+        path = os.path.join(root, f"shell-{pid}")
+        settings = {
+            "memory.max": Config.SHELL_LIMIT_MEMORY_MB * 1024 * 1024,
+            "pids.max": Config.SHELL_LIMIT_PROCESSES,
+            "cpu.max": f"{Config.SHELL_CGROUP_CPU_PERCENT * 1000} 100000" if Config.SHELL_CGROUP_CPU_PERCENT > 0 else 0,
+        }
+        try:
+            os.makedirs(path, exist_ok=True)
+            for name, value in settings.items():
+                if value:
+                    self._write(os.path.join(path, name), value)
+            self._write(os.path.join(path, "cgroup.procs"), pid)
+            return path
+        except OSError as e:
+            logger.warning(f"⚠️ cgroup attach failed ({e}); falling back to rlimits.")
+            self.release_cgroup(path)
+            return None
+
+    def release_cgroup(self, path: Optional[str]) -> Optional[int]:
+        """Command ပြီးရင် cgroup ကို ဖျက်မယ်၊ memory.peak ရှိရင် ပြန်ပေးမယ်"""
+        if not path:
+            return None
+        peak = None
+        try:
+            with open(os.path.join(path, "memory.peak")) as f:
+                peak = int(f.read().strip())
+        except (OSError, ValueError):
+            pass
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+        return peak
+
+    @staticmethod
+    def _write(path: str, value):
+        with open(path, "w") as f:
+            f.write(str(value))
+
+    # ==========================================
+    # 📊 Metrics
+    # ==========================================
+    def record(self, monitor: ResourceMonitor, timed_out: bool):
+        peak_mb = round(monitor.peak_rss / (1024 * 1024), 1)
+        with self._lock:
+            self._stats["commands"] += 1
+            self._stats["timeouts"] += int(timed_out)
+            self._stats["cpu_seconds_total"] += monitor.cpu_seconds
+            self._stats["wall_seconds_total"] += monitor.wall_seconds
+            self._stats["max_peak_rss_mb"] = max(self._stats["max_peak_rss_mb"], peak_mb)
+            self._stats["last"] = {
+                "peak_rss_mb": peak_mb,
+                "cpu_seconds": round(monitor.cpu_seconds, 2),
+                "wall_seconds": round(monitor.wall_seconds, 2),
+                "timed_out": timed_out,
+            }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "cpu_seconds_total": round(self._stats["cpu_seconds_total"], 2),
+                "wall_seconds_total": round(self._stats["wall_seconds_total"], 2),
+                "cgroup": bool(Config.SHELL_CGROUP_ROOT),
+            }
+
+# Singleton Instance
+shell_sandbox = ShellSandbox()
@@ -6,6 +6,10 @@ import os
 from config import Config
 import pytz
 from tasks.executor import run_scheduled_task 
+from tasks.maintenance import (
+    run_memory_maintenance, run_knowledge_maintenance,
+    MAINTENANCE_JOB_ID, KNOWLEDGE_MAINTENANCE_JOB_ID,
+)
 from apscheduler.triggers.date import DateTrigger
 from datetime import datetime
 
@@ -23,6 +27,27 @@ class JarvisScheduler:
         if not self.scheduler.running:
             self.scheduler.start()
             logger.info("⏰ Scheduler Started with Database Persistence.")
+            self._register_maintenance()
+
+    def _register_maintenance(self):
+        """System Job တွေကို ID အသေနဲ့ ထည့်မယ် (Restart တိုင်း ထပ်မပွားအောင် replace_existing)"""
+        system_jobs = [
+            # Chat Archive + Vacuum
+            (run_memory_maintenance, MAINTENANCE_JOB_ID, Config.MEMORY_MAINTENANCE_CRON),
+            # Knowledge Table Compaction + Version Cleanup + Reindex
+            (run_knowledge_maintenance, KNOWLEDGE_MAINTENANCE_JOB_ID, Config.KNOWLEDGE_MAINTENANCE_CRON),
+        ]
+        for func, job_id, cron_str in system_jobs:
+            try:
+                mi, h, d, m, dow = cron_str.split()
+                self.scheduler.add_job(
+                    func,
+                    trigger=CronTrigger(minute=mi, hour=h, day=d, month=m, day_of_week=dow, timezone=Config.TIMEZONE),
+                    id=job_id,
+                    replace_existing=True
+                )
+            except Exception as e:
+                logger.error(f"Maintenance Schedule Error ({job_id}): {e}")
 
     def shutdown(self):
         if self.scheduler.running:
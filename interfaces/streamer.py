@@ -0,0 +1,94 @@
+import time
+import asyncio
+import logging
+from config import Config
+
+logger = logging.getLogger("TELEGRAM_STREAMER")
+
+class TelegramStreamer:
+    """
+    Model ထုတ်နေတဲ့ Text ကို Telegram Message တစ်ခုထဲမှာ တဖြည်းဖြည်း Edit လုပ်ပြီး ပြပေးမယ့် Class.
+    Edit တွေကို စုပြီး (Coalesce) STREAM_EDIT_INTERVAL တစ်ခါပဲ ပို့လို့ Telegram Rate Limit မထိဘူး။
+    """
+    PREVIEW_LIMIT = 4000  # Telegram Message Length Limit (4096) အောက်မှာ ထားမယ်
+
+    def __init__(self, bot, chat_id: int):
+        self.bot = bot
+        self.chat_id = chat_id
+        self.message = None
+        self._latest = ""
+        self._shown = ""
+        self._last_edit = 0.0
+        self._pending = None
+        self._lock = asyncio.Lock()
+
+    async def update(self, text: str):
+        """
+        Agent ဆီက Stream Callback - နောက်ဆုံးရ Text ကိုပဲ မှတ်ထားပြီး အချိန်တန်မှ Edit မယ်
+        Text အလွတ် ("") ရရင် ဒီ Turn က Tool Call Turn ဖြစ်သွားလို့ ပြထားတာကို ဖျက်မယ် (Brain ရဲ့ Contract)
+        """
+        if not text:
+            await self.reset()
+            return
+        self._latest = text
+        if self.message is None and len(text) < Config.STREAM_MIN_CHARS:
+            return
+        wait = Config.STREAM_EDIT_INTERVAL - (time.monotonic() - self._last_edit)
+        if wait <= 0:
+            await self._flush()
+        elif self._pending is None or self._pending.done():
+            self._pending = asyncio.create_task(self._delayed_flush(wait))
+
+    async def _delayed_flush(self, wait: float):
+        await asyncio.sleep(wait)
+        await self._flush()
+
+    async def _flush(self):
+        async with self._lock:
+            text = self._latest[:self.PREVIEW_LIMIT]
+            if not text or text == self._shown:
+                return
+            try:
+                if self.message is None:
+                    self.message = await self.bot.send_message(chat_id=self.chat_id, text=text)
+                else:
+                    await self.message.edit_text(text=text)
+                self._shown = text
+            except Exception as e:
+                # "Message is not modified" / Flood Control စတာတွေကို ကျော်မယ်၊ နောက် Flush မှာ ပြန်ကြိုးစားမယ်
+                logger.debug(f"Stream edit skipped: {e}")
+            self._last_edit = time.monotonic()
+
+    async def reset(self):
+        """Tool Call မတိုင်ခင် Model ပြောခဲ့တဲ့ Text ကို Chat ထဲ မကျန်အောင် Preview Message ကို ဖျက်ပြီး အစကနေ ပြန်စမယ်"""
+        if self._pending and not self._pending.done():
+            self._pending.cancel()
+        async with self._lock:
+            message, self.message = self.message, None
+            self._latest = self._shown = ""
+            if message is not None:
+                try:
+                    await message.delete()
+                except Exception as e:
+                    logger.debug(f"Stream preview delete skipped: {e}")
+
+    async def finish(self, final_text: str) -> bool:
+        """
+        Final Answer နဲ့ Message ကို အပြီးသတ် Edit မယ်၊ PREVIEW_LIMIT ထက် ရှည်ရင် ကျန်တာကို နောက် Message တွေနဲ့ ဆက်ပို့မယ်
+        (format_response ရဲ့ "Message Truncated" Suffix လို အဆုံးပိုင်း မပျောက်အောင်)။
+        Stream Message မရှိသေးရင် (သို့) Edit မအောင်မြင်ရင် False ပြန်ပေးမယ် (ခေါ်သူက Message အသစ် ပို့ရမယ်)
+        """
+        if self._pending and not self._pending.done():
+            self._pending.cancel()
+        if self.message is None:
+            return False
+        self._latest = final_text
+        await self._flush()
+        if self._shown != final_text[:self.PREVIEW_LIMIT]:
+            return False
+        for start in range(self.PREVIEW_LIMIT, len(final_text), self.PREVIEW_LIMIT):
+            try:
+                await self.bot.send_message(chat_id=self.chat_id, text=final_text[start:start + self.PREVIEW_LIMIT])
+            except Exception as e:
+                logger.warning(f"⚠️ Stream overflow message failed: {e}")
+        return True
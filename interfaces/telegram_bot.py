@@ -1,4 +1,5 @@
 import logging
+import html
 import asyncio
 from telegram import Update
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
@@ -6,6 +7,7 @@ from config import Config
 
 # Formatter နှင့် သီးသန့်ခွဲထုတ်ထားသော Chat Handler ကို လှမ်းခေါ်မည်
 from interfaces.formatter import format_response
+from interfaces.streamer import TelegramStreamer
 from memory.memory_controller import memory_controller
 from core.chat_handler import process_user_message
 
@@ -32,7 +34,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Reset Command
     if user_text.lower() == "/reset" or user_text == "မေ့လိုက်တော့":
-        msg = memory_controller.clear_chat(user_id)
+        msg = await memory_controller.aclear_chat(user_id)
         await update.message.reply_text(f"🧹 {msg}")
         return
 
@@ -41,6 +43,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Status Update Callback
     status_msg = [None]
     async def send_status_update(msg):
+        msg = html.escape(str(msg))  # Shell Output လို Text တွေမှာ <, > ပါလာနိုင်လို့
         try:
             if status_msg[0] is None:
                 status_msg[0] = await context.bot.send_message(chat_id=chat_id, text=f"⏳ <i>{msg}</i>", parse_mode="HTML")
@@ -49,11 +52,17 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         except Exception:
             pass
 
+    # Final Answer ကို တဖြည်းဖြည်း ပြပေးမယ့် Streamer (Time-to-first-token လျှော့ဖို့)
+    streamer = TelegramStreamer(context.bot, chat_id) if Config.STREAM_RESPONSES else None
+
     # --- 🚀 FIRE AND FORGET (BACKGROUND TASK) ---
     async def process_task_in_background():
         try:
             # Logic ကို chat_handler ဆီ လှမ်းလွှဲလိုက်ပြီ
-            response = await process_user_message(user_id, user_text, send_status_update)
+            response = await process_user_message(
+                user_id, user_text, send_status_update,
+                stream_callback=streamer.update if streamer else None
+            )
 
             if status_msg[0]:
                 try:
@@ -62,6 +71,9 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     pass
             
             formatted_reply = format_response(response)
+            # Stream Message ရှိပြီးသားဆိုရင် အဲ့ဒါကိုပဲ Final Answer နဲ့ Edit မယ်
+            if streamer and await streamer.finish(formatted_reply):
+                return
             await context.bot.send_message(chat_id=chat_id, text=formatted_reply)
         except Exception as e:
             logger.error(f"Task Error: {e}")
@@ -70,7 +82,14 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # ပြိုင်တူ နောက်ကွယ်မှ Run မည်
     asyncio.create_task(process_task_in_background())
 
+_polling = False
+
+def is_polling() -> bool:
+    """/ready Endpoint အတွက် - Bot က Update တွေကို လက်ခံနေပြီလား"""
+    return _polling
+
 async def run_telegram_bot():
+    global _polling
     if not Config.TELEGRAM_TOKEN:
         logger.error("❌ Telegram Token missing!")
         return
@@ -85,6 +104,7 @@ async def run_telegram_bot():
     await application.initialize()
     await application.start()
     await application.updater.start_polling()
+    _polling = True
     
     while True:
         await asyncio.sleep(3600)
\ No newline at end of file
@@ -2,18 +2,49 @@ import uvicorn
 import asyncio
 import logging
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from core.scheduler import jarvis_scheduler
+from core.client_pool import client_pool
+from core.key_scheduler import key_scheduler
+from core.context_cache import context_cache
+from core.agent_pool import agent_pool
+from core.sandbox import shell_sandbox
+from core.http_pool import http_pool
+from core.page_cache import page_cache
+from memory.sql_storage import sql_storage
+from memory.memory_controller import memory_controller
+from memory.vector_storage import vector_storage
+from core.registry import tool_registry
+from tools.browser.session import BrowserManager
 
 # Config နဲ့ Telegram Interface ကို လှမ်းခေါ်မယ်
 from config import Config
-from interfaces.telegram_bot import run_telegram_bot
+from interfaces.telegram_bot import run_telegram_bot, is_polling
 
 # Logging Setup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("JARVIS_MAIN")
 
 scheduler = jarvis_scheduler
+warmup_state = {"started": False, "finished": False}
+
+async def warm_up():
+    """
+    Server တက်ပြီးမှ Background မှာ လေးတဲ့ Subsystem တွေကို ကြိုနှိုးထားမယ်
+    (Startup ကို မစောင့်ခိုင်းတော့လို့ Bot က ချက်ချင်း စာပြန်နိုင်တယ်)
+    """
+    warmup_state["started"] = True
+    try:
+        # Role အလိုက် Agent တွေကို ကြိုဆောက်ထားမယ် (Event Loop မပိတ်အောင် Thread ထဲမှာ)
+        await asyncio.to_thread(agent_pool.warm, Config.AGENT_POOL_WARM_ROLES)
+        # LanceDB + Embedding Model
+        await memory_controller.awarm_up()
+        logger.info("🔥 Background warm-up finished.")
+    except Exception as e:
+        logger.error(f"Warm-up Error: {e}")
+    finally:
+        warmup_state["finished"] = True
 
 # --- 🚀 LIFESPAN MANAGER ---
 # Server စဖွင့်တာနဲ့ Telegram Bot ကိုပါ တွဲဖွင့်ပေးမယ့် စနစ်
@@ -27,6 +58,9 @@ async def lifespan(app: FastAPI):
     logging.getLogger("apscheduler").setLevel(logging.WARNING)
 
     scheduler.start()
+
+    if Config.WARMUP_ON_STARTUP:
+        asyncio.create_task(warm_up())
     
     # Telegram Bot ကို Background Task အနေနဲ့ Run မယ်
     # (FastAPI Server နဲ့ ပြိုင်တူ အလုပ်လုပ်စေချင်လို့)
@@ -36,6 +70,12 @@ async def lifespan(app: FastAPI):
     
     # 2. Shutdown Event (Ctrl+C နှိပ်ရင်)
     scheduler.shutdown()
+    await context_cache.close()
+    await client_pool.close()
+    await http_pool.close()
+    page_cache.close()
+    memory_controller.shutdown()
+    sql_storage.close()
     logger.info("🛑 System Shutdown Initiated...")
     logger.info("💤 Jarvis is going to sleep.")
 
@@ -56,6 +96,57 @@ async def root():
         "tools_status": "Active"
     }
 
+@app.get("/stats/keys")
+async def key_stats():
+    """API Key တစ်ခုချင်းစီရဲ့ Usage / Error / Cooldown အခြေအနေ"""
+    return key_scheduler.stats()
+
+@app.get("/stats/agents")
+async def agent_stats():
+    """Agent Pool ရဲ့ Hit/Miss နဲ့ ပျမ်းမျှ Acquire Latency"""
+    return agent_pool.stats()
+
+@app.get("/ready")
+async def readiness():
+    """Subsystem တစ်ခုချင်းစီ နိုးပြီလား (Warm) - Core တွေ မရသေးရင် 503 ပြန်မယ်"""
+    subsystems = {
+        "sql": sql_storage.is_ready(),
+        "tools": tool_registry.generation > 0,
+        "scheduler": scheduler.scheduler.running,
+        "telegram": is_polling(),
+        "agents": agent_pool.idle_counts(),
+        "vector": vector_storage.status(),
+        "browser": BrowserManager.is_running(),
+        "warmup": warmup_state,
+    }
+    ready = subsystems["sql"] and subsystems["tools"] and subsystems["telegram"]
+    return JSONResponse(status_code=200 if ready else 503, content={"ready": ready, "subsystems": subsystems})
+
+@app.get("/stats/profile")
+async def profile_stats():
+    """User Profile Cache ကြောင့် မဖတ်ရတော့တဲ့ SQLite Query အရေအတွက်"""
+    return memory_controller.profile_stats()
+
+@app.get("/stats/embeddings")
+async def embedding_stats():
+    """Knowledge Search/Save Embedding Cache ရဲ့ Hit Rate"""
+    return memory_controller.embedding_stats()
+
+@app.get("/stats/shell")
+async def shell_stats():
+    """shell_exec Command တွေရဲ့ Peak RSS / CPU Time / Timeout အရေအတွက်"""
+    return shell_sandbox.stats()
+
+@app.get("/stats/http")
+async def http_stats():
+    """Shared HTTP Client ရဲ့ Request / Byte / Truncation အရေအတွက်"""
+    return http_pool.stats()
+
+@app.get("/stats/pages")
+async def page_cache_stats():
+    """read_page_content Page Cache ရဲ့ Hit / Miss / Bytes Saved"""
+    return page_cache.stats()
+
 # --- 🔥 ENTRY POINT ---
 if __name__ == "__main__":
     # Server ကို Start လုပ်မယ်
@@ -0,0 +1,173 @@
+import os
+import re
+import time
+import array
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from config import Config
+
+logger = logging.getLogger("JARVIS_EMBEDDING_CACHE")
+
+class EmbeddingCache:
+    """
+    Sentence-Transformer Embedding တွေကို ပြန်သုံးဖို့ Cache.
+    - Key: Model Name + Normalize လုပ်ထားတဲ့ Text ရဲ့ SHA-1
+    - Layer 1: In-memory LRU (max_entries)
+    - Layer 2: SQLite Disk Cache (Restart / Scheduled Run တွေကြားမှာပါ ပြန်သုံးလို့ရအောင်) - Optional
+    """
+    def __init__(self, model_name: str, max_entries: int, disk_path: Optional[str] = None, max_disk_rows: int = 50000):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.max_disk_rows = max_disk_rows
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._disk = None
+        self._disk_writes = 0
+        if disk_path:
+            self._open_disk(disk_path)
+
+    def _open_disk(self, path: str):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute("PRAGMA synchronous=NORMAL")
+            self._disk.execute('''
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB,
+                    created_at REAL
+                )
+            ''')
+            self._disk.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_created ON embeddings (created_at)")
+            self._disk.commit()
+        except Exception as e:
+            logger.error(f"❌ Embedding Disk Cache Error (memory only): {e}")
+            self._disk = None
+
+    # ==========================================
+    # Key / Serialization
+    # ==========================================
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Unicode (NFKC) + Whitespace + Case ကို ညှိမယ် (MiniLM က Uncased ဖြစ်လို့ Lowercase လုပ်လည်း Vector မပြောင်းဘူး)"""
+        text = unicodedata.normalize("NFKC", text or "")
+        return re.sub(r"\s+", " ", text).strip().lower()
+
+    def key_for(self, text: str) -> str:
+        return hashlib.sha1(f"{self.model_name}\x00{self.normalize(text)}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _pack(vector) -> bytes:
+        return array.array("f", [float(v) for v in vector]).tobytes()
+
+    @staticmethod
+    def _unpack(blob: bytes) -> List[float]:
+        values = array.array("f")
+        values.frombytes(blob)
+        return values.tolist()
+
+    # ==========================================
+    # Lookup
+    # ==========================================
+    def _remember(self, key: str, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return vector
+            if self._disk is not None:
+                row = self._disk.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+                if row:
+                    vector = self._unpack(row[0])
+                    self._remember(key, vector)
+                    self._stats["disk_hits"] += 1
+                    return vector
+            self._stats["misses"] += 1
+            return None
+
+    def _store(self, items: List[tuple]):
+        with self._lock:
+            for key, vector in items:
+                self._remember(key, vector)
+            if self._disk is None or not items:
+                return
+            try:
+                now = time.time()
+                self._disk.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                    [(key, self._pack(vector), now) for key, vector in items]
+                )
+                self._disk_writes += len(items)
+                # Disk Cache ကို Bounded ဖြစ်အောင် ခဏခဏ အဟောင်းဆုံးတွေကို ဖယ်မယ်
+                if self._disk_writes >= 500:
+                    self._disk_writes = 0
+                    self._disk.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        "SELECT key FROM embeddings ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_rows,)
+                    )
+                self._disk.commit()
+            except Exception as e:
+                logger.debug(f"Embedding disk write skipped: {e}")
+
+    def get_many(self, texts: List[str], compute: Callable[[List[str]], list]) -> List[List[float]]:
+        """Cache ထဲမရှိတဲ့ Text တွေကိုပဲ compute() နဲ့ တစ်ခါတည်း (Batch) Embed လုပ်မယ်"""
+        keys = [self.key_for(text) for text in texts]
+        results: List[Optional[List[float]]] = [self._lookup(key) for key in keys]
+
+        # Batch ထဲမှာ Normalize ပြီး တူနေတဲ့ Text တွေကို တစ်ခါပဲ Embed မယ်
+        missing = {}
+        for index, vector in enumerate(results):
+            if vector is None:
+                missing.setdefault(keys[index], index)
+        if missing:
+            computed = compute([texts[index] for index in missing.values()])
+            fresh = {key: [float(v) for v in vector] for key, vector in zip(missing, computed)}
+            self._store(list(fresh.items()))
+            results = [vector if vector is not None else fresh[key] for key, vector in zip(keys, results)]
+        return results
+
+    def get(self, text: str, compute: Callable[[List[str]], list]) -> List[float]:
+        return self.get_many([text], compute)[0]
+
+    # ==========================================
+    # Stats
+    # ==========================================
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            total = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(hits / total, 3) if total else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_enabled": self._disk is not None,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+# Singleton Instance
+embedding_cache = EmbeddingCache(
+    model_name=Config.EMBEDDING_MODEL_NAME,
+    max_entries=Config.EMBEDDING_CACHE_SIZE,
+    disk_path=Config.EMBEDDING_CACHE_PATH if Config.EMBEDDING_CACHE_DISK else None,
+    max_disk_rows=Config.EMBEDDING_CACHE_MAX_DISK_ROWS,
+)
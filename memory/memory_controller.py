@@ -1,12 +1,21 @@
 import logging
 import asyncio
+import functools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
 
 # ရှေ့မှာရေးခဲ့တဲ့ အလွှာ (၂) ခုကို လှမ်းခေါ်မယ်
 from memory.sql_storage import sql_storage
 from memory.vector_storage import vector_storage
+from memory.embedding_cache import embedding_cache
 
 logger = logging.getLogger("JARVIS_MEMORY_CONTROLLER")
 
+# Conversation (chat() Run) တစ်ခုချင်းစီရဲ့ Profile Cache Counter ({"hits", "queries"}) - ပြိုင်တူ Run တွေ မရောအောင် Caller က Set လုပ်မယ်
+profile_run_stats: contextvars.ContextVar = contextvars.ContextVar("profile_run_stats", default=None)
+
 class MemoryController:
     """
     Agent နဲ့ Database တွေကြားက ပွဲစား (API Gateway)
@@ -15,6 +24,18 @@ class MemoryController:
     def __init__(self):
         self.sql = sql_storage
         self.vector = vector_storage
+        # Event Loop မပိတ်အောင် DB အလုပ်တွေကို သီးသန့် Thread Pool တွေမှာ Run မယ်
+        # (Embedding / Vector Query နှေးနေလည်း SQLite Chat History ကို မစောင့်ခိုင်းအောင် Pool ခွဲထားတယ်)
+        self._sql_executor = ThreadPoolExecutor(max_workers=Config.MEMORY_SQL_WORKERS, thread_name_prefix="jarvis-sql")
+        # User Profile Cache - save_user_fact လုပ်မှပဲ Invalidate လုပ်မယ် (Message တိုင်း SQLite မဖတ်တော့ဘူး)
+        self._profile_cache = {}
+        self._profile_lock = threading.Lock()
+        self._profile_stats = {"hits": 0, "queries": 0, "invalidations": 0}
+        # Invalidate တိုင်း တိုးမယ့် Version (SQL ဖတ်နေတုန်း တခြား Worker က Save လုပ်သွားရင် Stale Profile ကို Cache မလုပ်မိအောင်)
+        self._profile_versions = {}
+        self._profile_epoch = 0  # invalidate_profile() (အကုန်) အတွက်
+        self._vector_executor = ThreadPoolExecutor(max_workers=Config.MEMORY_VECTOR_WORKERS, thread_name_prefix="jarvis-vector")
+        self.vector.set_executor(self._vector_executor)
         logger.info("🧠 Memory Controller (Hybrid Core) Online.")
 
     # ==========================================
@@ -26,6 +47,10 @@ class MemoryController:
     def get_recent_chat(self, user_id: int, limit: int = 10) -> list:
         return self.sql.get_chat_history(user_id, limit)
 
+    def get_recent_turns(self, user_id: int, limit: int = 10) -> list:
+        """Role-tagged Turns ([{"role": "user"/"model", "content": ...}])"""
+        return self.sql.get_chat_turns(user_id, limit)
+
     def clear_chat(self, user_id: int) -> str:
         return self.sql.clear_history(user_id)
 
@@ -33,10 +58,58 @@ class MemoryController:
     # ၂။ Permanent Facts (User Profile) -> SQLite
     # ==========================================
     def save_user_fact(self, user_id: int, key: str, value: str) -> bool:
-        return self.sql.update_profile(user_id, key, value)
+        saved = self.sql.update_profile(user_id, key, value)
+        if saved:
+            self.invalidate_profile(user_id)
+        return saved
+
+    def _cached_profile(self, user_id: int):
+        with self._profile_lock:
+            profile = self._profile_cache.get(user_id)
+            if profile is not None:
+                self._count_profile("hits")
+            return profile
+
+    def _count_profile(self, key: str):
+        """Process-wide Counter နဲ့ လက်ရှိ Run ရဲ့ Counter ကို တိုးမယ် (_profile_lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်)"""
+        self._profile_stats[key] += 1
+        run_stats = profile_run_stats.get()
+        if run_stats is not None:
+            run_stats[key] = run_stats.get(key, 0) + 1
+
+    def _profile_version(self, user_id: int) -> tuple:
+        """Lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်"""
+        return (self._profile_epoch, self._profile_versions.get(user_id, 0))
 
     def get_all_user_facts(self, user_id: int) -> str:
-        return self.sql.get_user_profile(user_id)
+        profile = self._cached_profile(user_id)
+        if profile is not None:
+            return profile
+        with self._profile_lock:
+            version = self._profile_version(user_id)
+        profile = self.sql.get_user_profile(user_id)
+        with self._profile_lock:
+            self._count_profile("queries")
+            # ဖတ်နေတုန်း Invalidate ဖြစ်သွားရင် ဒီ Result က ဟောင်းနိုင်လို့ Cache မလုပ်ဘူး (Caller ကိုတော့ ပြန်ပေးမယ်)
+            if not profile.startswith("Error") and self._profile_version(user_id) == version:
+                self._profile_cache[user_id] = profile
+        return profile
+
+    def invalidate_profile(self, user_id: int = None):
+        """Profile ပြောင်းသွားရင် Cache ကို ဖျက်မယ် (user_id မပေးရင် အကုန်)"""
+        with self._profile_lock:
+            if user_id is None:
+                self._profile_cache.clear()
+                self._profile_epoch += 1
+            else:
+                self._profile_cache.pop(user_id, None)
+                self._profile_versions[user_id] = self._profile_versions.get(user_id, 0) + 1
+            self._profile_stats["invalidations"] += 1
+
+    def profile_stats(self) -> dict:
+        """Cache ကြောင့် မဖတ်ရတော့တဲ့ SQLite Query အရေအတွက် (hits) နဲ့ တကယ်ဖတ်ရတဲ့ အရေအတွက် (queries)"""
+        with self._profile_lock:
+            return dict(self._profile_stats)
 
     # ==========================================
     # ၃။ Ongoing Tasks (လုပ်လက်စ အလုပ်များ) -> SQLite
@@ -50,6 +123,15 @@ class MemoryController:
     def remove_task(self, task_id: int) -> bool:
         return self.sql.remove_ongoing_task(task_id)
 
+    def run_maintenance(self, max_age_days: float, max_rows_per_user: int) -> dict:
+        """Retention Policy အတိုင်း Chat အဟောင်းတွေကို Archive လုပ်ပြီး DB File ကို ချုံ့မယ်"""
+        archived = self.sql.archive_old_messages(max_age_days, max_rows_per_user)
+        # auto_vacuum=INCREMENTAL မဖြစ်သေးတဲ့ DB အဟောင်းကို Startup မှာ မဟုတ်ဘဲ ဒီမှာ တစ်ကြိမ် ပြောင်းမယ်
+        if Config.SQL_AUTO_VACUUM_CONVERT:
+            self.sql.convert_auto_vacuum()
+        freed_pages = self.sql.incremental_vacuum()
+        return {"archived": archived, "freed_pages": freed_pages}
+
     # ==========================================
     # ၄။ Advanced Knowledge & Skills -> LanceDB (Vector)
     # ==========================================
@@ -57,11 +139,94 @@ class MemoryController:
         """category: 'Fact', 'Mistake', 'Skill'"""
         return self.vector.save_knowledge(category, task, solution, code_snippet)
 
-    def search_knowledge(self, query: str, limit: int = 3) -> str:
-        return self.vector.search_knowledge(query, limit)
+    def save_knowledge_many(self, items: list) -> int:
+        """items: [{"category", "task_or_query", "solution", "code_snippet"}] - Batch တစ်ခါတည်း သိမ်းမယ်"""
+        return self.vector.save_knowledge_many(items)
+
+    def search_knowledge(self, query: str, limit: int = 3, category: str = None) -> str:
+        """category ပေးရင် ('Skill' / 'Mistake' / 'Fact') အဲ့ဒီ အမျိုးအစားထဲမှာပဲ ရှာမယ်"""
+        return self.vector.search_knowledge(query, limit, category)
 
     def delete_knowledge(self, query: str) -> bool:
-        return self.vector.delete_knowledge(query)    
+        return self.vector.delete_knowledge(query)
+
+    # ==========================================
+    # ၅။ Async API (Event Loop ထဲကနေ ခေါ်ရန်)
+    # ==========================================
+    async def _run_sql(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        # run_in_executor က ContextVar တွေကို မသယ်လို့ (profile_run_stats စသည်) Context ကို Copy ယူပြီး Run မယ်
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._sql_executor, functools.partial(context.run, fn, *args))
+
+    async def _run_vector(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._vector_executor, functools.partial(fn, *args))
+
+    async def aadd_chat_message(self, user_id: int, role: str, content: str):
+        await self._run_sql(self.add_chat_message, user_id, role, content)
+
+    async def aget_recent_chat(self, user_id: int, limit: int = 10) -> list:
+        return await self._run_sql(self.get_recent_chat, user_id, limit)
+
+    async def aget_recent_turns(self, user_id: int, limit: int = 10) -> list:
+        return await self._run_sql(self.get_recent_turns, user_id, limit)
+
+    async def aclear_chat(self, user_id: int) -> str:
+        return await self._run_sql(self.clear_chat, user_id)
+
+    async def asave_user_fact(self, user_id: int, key: str, value: str) -> bool:
+        return await self._run_sql(self.save_user_fact, user_id, key, value)
+
+    async def aget_all_user_facts(self, user_id: int) -> str:
+        # Cache ထဲမှာ ရှိရင် Thread Pool ကိုတောင် မသွားတော့ဘူး
+        profile = self._cached_profile(user_id)
+        if profile is not None:
+            return profile
+        return await self._run_sql(self.get_all_user_facts, user_id)
+
+    async def aadd_task(self, user_id: int, task_description: str) -> bool:
+        return await self._run_sql(self.add_task, user_id, task_description)
+
+    async def aget_tasks(self, user_id: int) -> str:
+        return await self._run_sql(self.get_tasks, user_id)
+
+    async def aremove_task(self, task_id: int) -> bool:
+        return await self._run_sql(self.remove_task, task_id)
+
+    async def arun_maintenance(self, max_age_days: float, max_rows_per_user: int) -> dict:
+        return await self._run_sql(self.run_maintenance, max_age_days, max_rows_per_user)
+
+    async def asave_knowledge(self, category: str, task: str, solution: str, code_snippet: str = "") -> bool:
+        return await self._run_vector(self.save_knowledge, category, task, solution, code_snippet)
+
+    async def asave_knowledge_many(self, items: list) -> int:
+        return await self._run_vector(self.save_knowledge_many, items)
+
+    async def asearch_knowledge(self, query: str, limit: int = 3, category: str = None) -> str:
+        return await self._run_vector(self.search_knowledge, query, limit, category)
+
+    async def adelete_knowledge(self, query: str) -> bool:
+        return await self._run_vector(self.delete_knowledge, query)
+
+    async def acompact_knowledge(self) -> dict:
+        """Knowledge Table ကို Compact + Version Cleanup + Reindex (Vector Thread Pool ထဲမှာ)"""
+        return await self._run_vector(self.vector.compact)
+
+    async def awarm_up(self) -> bool:
+        """LanceDB ချိတ်ပြီး Embedding Model ကို Vector Thread Pool ထဲမှာ ကြို Load လုပ်မယ်"""
+        return await self._run_vector(self.vector.warm_up)
+
+    def embedding_stats(self) -> dict:
+        """Embedding Cache ရဲ့ Hit Rate (Memory / Disk)"""
+        return embedding_cache.stats()
+
+    def shutdown(self):
+        """Shutdown မှာ Thread Pool တွေကို ပိတ်မယ် (လုပ်လက်စ Write တွေ ပြီးအောင် စောင့်မယ်)"""
+        self._vector_executor.shutdown(wait=True)
+        self.vector.flush_inserts()
+        self._sql_executor.shutdown(wait=True)
+        embedding_cache.close()
 
 # Singleton အနေနဲ့ ထုတ်ပေးထားမယ်
 memory_controller = MemoryController()
\ No newline at end of file
@@ -1,120 +1,439 @@
 import sqlite3
 import time
+import zlib
+import queue
 import logging
 import os
+import shutil
+import threading
+from contextlib import contextmanager
 from config import Config
 
 logger = logging.getLogger("JARVIS_SQL_STORAGE")
 
 class SQLStorage:
+    """
+    SQLite Layer 1 Memory.
+    Method ခေါ်တိုင်း sqlite3.connect အသစ်မဖွင့်တော့ဘဲ Long-lived Connection တွေကို ပြန်သုံးမယ်:
+    - Writer Connection တစ်ခု (Lock နဲ့ တစ်ကြိမ်မှာ Thread တစ်ခုပဲ ရေးမယ်)
+    - Reader Connection Pool (WAL Mode မှာ Writer နဲ့ ပြိုင်ပြီး ဖတ်လို့ရတယ်)
+    check_same_thread=False နဲ့ ဖွင့်ထားပြီး Connection တစ်ခုကို တစ်ချိန်မှာ Thread တစ်ခုပဲ ကိုင်လို့
+    asyncio.to_thread ရဲ့ Worker Thread တွေကနေ ခေါ်လည်း လုံခြုံတယ်။
+
+    add_message / add_ongoing_task တွေကို Write-behind Buffer ထဲ အရင်ထည့်ပြီး
+    WRITE_BUFFER_MAX_ROWS ပြည့်ရင် (သို့) WRITE_BUFFER_FLUSH_INTERVAL ကျော်ရင် Transaction တစ်ခုတည်းနဲ့ Flush လုပ်မယ်။
+    """
+    STATEMENT_CACHE_SIZE = 128
+    SCHEMA_VERSION = 1  # PRAGMA user_version နဲ့ Migration အဆင့်ကို မှတ်မယ်
+    ARCHIVE_BATCH_SIZE = 1000
+
     def __init__(self):
         self.db_path = Config.MEMORY_DB_PATH
         # DB ဖိုင် မရှိရင် အလိုအလျောက် ဆောက်ပေးရန်
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._readers = queue.Queue()
+        self._closed = False
+        # --- Write-behind Buffer ---
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending_messages = []  # (user_id, role, content, timestamp)
+        self._pending_tasks = []     # (user_id, task_description, status, timestamp)
+        self._flushing_messages = []  # Commit လုပ်နေဆဲ Batch (Reader တွေ မြင်ရအောင်)
+        self._flush_timer = None
+        self._flush_failures = 0  # ဆက်တိုက် ကျရှုံးတဲ့ Flush အရေအတွက် (Backoff အတွက်)
         self._init_db()
 
+    # ==========================================
+    # Connection Management
+    # ==========================================
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=10,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        # DB အသစ်ဆိုရင် Table မဆောက်ခင် သတ်မှတ်မှ အကျိုးသက်ရောက်မယ် (ရှိပြီးသား DB မှာတော့ convert_auto_vacuum() လိုတယ်)
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL မှာ Checkpoint ကျမှ fsync လုပ်မယ်
+        conn.execute(f"PRAGMA cache_size=-{Config.SQL_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size={Config.SQL_MMAP_SIZE}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def _write(self):
+        """Writer Connection ကို Lock နဲ့ ငှားမယ်၊ အဆင်ပြေရင် Commit / Error တက်ရင် Rollback"""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def _read(self):
+        """Reader Pool ထဲက Connection တစ်ခုကို ငှားပြီး ပြီးရင် ပြန်ထည့်မယ်"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if self._closed or self._readers.qsize() >= Config.SQL_READER_POOL_SIZE:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    def is_ready(self) -> bool:
+        return self._writer is not None and not self._closed
+
+    def close(self):
+        """Shutdown မှာ Buffer ကို Flush လုပ်ပြီး Connection အားလုံးကို ပိတ်မယ် (WAL ကို Checkpoint လုပ်ပြီးမှ)"""
+        self.flush()
+        self._closed = True
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    self._writer.close()
+                    self._writer = None
+        logger.info("💾 SQL Storage connections closed.")
+
     def _init_db(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # ၁။ Short-term Memory (စကားဝိုင်း မှတ်တမ်း)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS chat_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+            with self._write() as conn:
+                cursor = conn.cursor()
+
+                # ၁။ Short-term Memory (စကားဝိုင်း မှတ်တမ်း)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS chat_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id INTEGER,
+                        role TEXT,
+                        content TEXT,
+                        timestamp REAL
+                    )
+                ''')
+
+                # ၂။ Permanent Knowledge (Sir အကြောင်း အချက်အလက်များ)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS user_profile (
+                        user_id INTEGER,
+                        key_name TEXT,
+                        value_text TEXT,
+                        PRIMARY KEY (user_id, key_name)
+                    )
+                ''')
+
+                # ၃။ Ongoing Tasks (လက်ရှိ လုပ်လက်စ အလုပ်များကို သီးသန့်မှတ်ရန် - အသစ်)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS ongoing_tasks (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id INTEGER,
+                        task_description TEXT,
+                        status TEXT,
+                        timestamp REAL
+                    )
+                ''')
+
+                self._migrate(conn)
+
+            with self._write_lock:
+                if self._writer.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                    # VACUUM က Startup ကို ပိတ်ထားမှာမို့ ဒီမှာ မလုပ်ဘဲ Maintenance Job ကို လွှဲမယ်
+                    logger.info("🧹 SQL auto_vacuum is not INCREMENTAL yet - conversion deferred to memory maintenance.")
+
+            # Reader Pool ကို ကြိုဖွင့်ထားမယ်
+            for _ in range(Config.SQL_READER_POOL_SIZE):
+                self._readers.put(self._connect())
+            logger.info(f"✅ SQL Storage (Layer 1) Initialized. (WAL, {Config.SQL_READER_POOL_SIZE} readers)")
+        except Exception as e:
+            logger.error(f"❌ SQL DB Init Error: {e}")
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """user_version အလိုက် Schema ကို တစ်ဆင့်ချင်း Upgrade လုပ်မယ်"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 1:
+            # Index မရှိရင် get_chat_history က Table တစ်ခုလုံးကို Scan လုပ်ရတယ်
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chat_history_user_id ON chat_history (user_id, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chat_history_timestamp ON chat_history (timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ongoing_tasks_user_id ON ongoing_tasks (user_id, id)")
+            # Retention ကျော်သွားတဲ့ စကားဝိုင်းအဟောင်းတွေကို zlib နဲ့ ချုံ့ပြီး သိမ်းမယ့် Archive
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS chat_history_archive (
+                    id INTEGER PRIMARY KEY,
                     user_id INTEGER,
                     role TEXT,
-                    content TEXT,
-                    timestamp REAL
-                )
-            ''')
-            
-            # ၂။ Permanent Knowledge (Sir အကြောင်း အချက်အလက်များ)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_profile (
-                    user_id INTEGER,
-                    key_name TEXT,
-                    value_text TEXT,
-                    PRIMARY KEY (user_id, key_name)
+                    content BLOB,
+                    timestamp REAL,
+                    archived_at REAL
                 )
             ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chat_archive_user_id ON chat_history_archive (user_id, id)")
 
-            # ၃။ Ongoing Tasks (လက်ရှိ လုပ်လက်စ အလုပ်များကို သီးသန့်မှတ်ရန် - အသစ်)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS ongoing_tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    task_description TEXT,
-                    status TEXT,
-                    timestamp REAL
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
-            logger.info(f"✅ SQL Storage (Layer 1) Initialized.")
+        if version < self.SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            logger.info(f"🧱 SQL schema migrated: v{version} -> v{self.SCHEMA_VERSION}")
+
+    def convert_auto_vacuum(self) -> bool:
+        """
+        ဖျက်လိုက်တဲ့ Page တွေကို incremental_vacuum နဲ့ ပြန်လွှတ်နိုင်အောင် DB အဟောင်းကို auto_vacuum=INCREMENTAL ပြောင်းမယ်။
+        Mode ပြောင်းဖို့ VACUUM တစ်ကြိမ် လိုလို့ (File တစ်ခုလုံး ပြန်ရေး၊ Disk နေရာ ၂ ဆ) Maintenance Job ကနေပဲ ခေါ်မယ်။
+        ပြောင်းပြီးသား (သို့) ပြောင်းလိုက်ရင် True ပြန်ပေးမယ်။
+        """
+        try:
+            with self._write_lock:
+                conn = self._writer
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                    return True
+                db_size = os.path.getsize(self.db_path)
+                free = shutil.disk_usage(os.path.dirname(os.path.abspath(self.db_path))).free
+                if free < db_size * 2:
+                    logger.warning(f"⚠️ Skipping auto_vacuum conversion: {free} bytes free, need ~{db_size * 2}.")
+                    return False
+                started = time.perf_counter()
+                # VACUUM က Transaction အပြင်မှာ Run ရမယ်
+                conn.commit()
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            logger.info(f"🧹 SQL auto_vacuum switched to INCREMENTAL ({db_size} bytes, took {time.perf_counter() - started:.1f}s).")
+            return True
         except Exception as e:
-            logger.error(f"❌ SQL DB Init Error: {e}")
+            logger.error(f"Auto-vacuum Conversion Error: {e}")
+            return False
+
+    # ==========================================
+    # Write-behind Buffer
+    # ==========================================
+    def _buffer(self, kind: str, row: tuple):
+        with self._buffer_lock:
+            # Flush က List ကို လဲလှယ်သွားနိုင်လို့ Lock ထဲရောက်မှ လက်ရှိ List ကို ယူရမယ်
+            pending = self._pending_messages if kind == "message" else self._pending_tasks
+            pending.append(row)
+            size = len(self._pending_messages) + len(self._pending_tasks)
+            # DB ရေးမရဖြစ်နေတုန်း (Backoff) Message တိုင်းမှာ Flush ထပ်မကြိုးစားဘဲ Timer ကိုပဲ စောင့်မယ်
+            flush_now = size >= Config.WRITE_BUFFER_MAX_ROWS and not self._flush_failures
+            if not flush_now:
+                self._schedule_flush()
+        if flush_now:
+            self.flush()
+
+    def _schedule_flush(self):
+        """Flush Timer မရှိသေးရင် စမယ်၊ ကျရှုံးထားရင် Exponential Backoff နဲ့ (_buffer_lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်)"""
+        if self._flush_timer is not None:
+            return
+        delay = min(Config.WRITE_BUFFER_FLUSH_INTERVAL * (2 ** self._flush_failures), Config.WRITE_BUFFER_MAX_BACKOFF)
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> int:
+        """Buffer ထဲက Insert တွေကို Transaction တစ်ခုတည်းနဲ့ ရေးမယ်။ ရေးလိုက်တဲ့ Row အရေအတွက်ကို ပြန်ပေးမယ်။"""
+        with self._flush_lock:
+            with self._buffer_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                messages, self._pending_messages = self._pending_messages, []
+                tasks, self._pending_tasks = self._pending_tasks, []
+                self._flushing_messages = messages
+            if not messages and not tasks:
+                return 0
+            try:
+                with self._write() as conn:
+                    if messages:
+                        conn.executemany(
+                            "INSERT INTO chat_history (user_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                            messages
+                        )
+                    if tasks:
+                        conn.executemany(
+                            "INSERT INTO ongoing_tasks (user_id, task_description, status, timestamp) VALUES (?, ?, ?, ?)",
+                            tasks
+                        )
+                with self._buffer_lock:
+                    self._flush_failures = 0
+                return len(messages) + len(tasks)
+            except Exception as e:
+                # မရေးနိုင်ရင် Data မပျောက်အောင် Buffer ရှေ့ဆုံးကို ပြန်ထည့်ပြီး Backoff နဲ့ Timer ပြန်စမယ်
+                with self._buffer_lock:
+                    self._pending_messages[:0] = messages
+                    self._pending_tasks[:0] = tasks
+                    self._flush_failures += 1
+                    self._schedule_flush()
+                    retry_in = self._flush_timer.interval
+                logger.error(f"Flush Error: {e} (retrying in {retry_in:.1f}s)")
+                return 0
+            finally:
+                with self._buffer_lock:
+                    self._flushing_messages = []
 
     # ==========================================
     # အပိုင်း (က) - စကားဝိုင်း မှတ်တမ်း (Chat History)
     # ==========================================
     def add_message(self, user_id, role, content):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO chat_history (user_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
-                (user_id, role, content, time.time())
-            )
-            conn.commit()
-            conn.close()
+            self._buffer("message", (user_id, role, content, time.time()))
         except Exception as e:
             logger.error(f"Save Message Error: {e}")
 
+    def _recent_messages(self, user_id, limit):
+        """
+        DB ထဲက နောက်ဆုံး Turn တွေနဲ့ Flush မလုပ်ရသေးတဲ့ Buffer ထဲက Turn တွေကို ပေါင်းပေးမယ် (Read-your-writes)။
+        Buffer ကို အရင် Snapshot ယူပြီးမှ DB ကို ဖတ်လို့ ကြားထဲမှာ Commit ဖြစ်သွားရင် (role, content, timestamp) နဲ့ ထပ်နေတာကို ဖယ်မယ်။
+        """
+        with self._buffer_lock:
+            pending = [row for row in self._flushing_messages + self._pending_messages if row[0] == user_id]
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT role, content, timestamp FROM chat_history WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+                (user_id, limit)
+            ).fetchall()
+        rows.reverse()
+        if pending:
+            stored = set(rows)
+            rows += [(role, content, ts) for _, role, content, ts in pending if (role, content, ts) not in stored]
+        return [(role, content) for role, content, _ in rows[-limit:]]
+
     def get_chat_history(self, user_id, limit=10):
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT role, content FROM chat_history WHERE user_id = ? ORDER BY id DESC LIMIT ?",
-                (user_id, limit)
-            )
-            rows = cursor.fetchall()
-            conn.close()
             history = []
-            for row in reversed(rows):
-                sender = "Sir" if row["role"] == "user" else "Jarvis"
-                history.append(f"{sender}: {row['content']}")
+            for role, content in self._recent_messages(user_id, limit):
+                sender = "Sir" if role == "user" else "Jarvis"
+                history.append(f"{sender}: {content}")
             return history
         except Exception as e:
             return []
 
+    def get_chat_turns(self, user_id, limit=10):
+        """Brain ရဲ့ Content Turns အတွက် Role-tagged History ([{"role", "content"}]) ကို ပြန်ပေးမယ်"""
+        try:
+            return [{"role": role, "content": content} for role, content in self._recent_messages(user_id, limit)]
+        except Exception as e:
+            return []
+
     def clear_history(self, user_id):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM chat_history WHERE user_id = ?", (user_id,))
-            conn.commit()
-            conn.close()
+            # flush() က ကျရှုံးရင် Row တွေကို Buffer ထဲ ပြန်ထည့်ပြီး Backoff Timer နဲ့ နောက်မှ ရေးမှာမို့ သူ့ကို အားမကိုးဘဲ
+            # Flush လုပ်နေဆဲ Batch ပြီးအောင် စောင့်ပြီး ဒီ User ရဲ့ မရေးရသေးတဲ့ Row တွေကို Buffer ထဲကပါ ဖယ်မယ်
+            with self._flush_lock:
+                with self._buffer_lock:
+                    self._pending_messages = [row for row in self._pending_messages if row[0] != user_id]
+                with self._write() as conn:
+                    conn.execute("DELETE FROM chat_history WHERE user_id = ?", (user_id,))
             return "စကားဝိုင်းမှတ်တမ်းများကို ရှင်းလင်းလိုက်ပါပြီ။"
         except Exception as e:
             return "Error clearing history."
 
+    def archive_old_messages(self, max_age_days: float, max_rows_per_user: int) -> int:
+        """
+        Retention Policy: max_age_days ထက်ဟောင်းတဲ့ (သို့) User တစ်ယောက်ရဲ့ နောက်ဆုံး max_rows_per_user ထဲမပါတဲ့
+        Turn တွေကို chat_history_archive ထဲ zlib နဲ့ ချုံ့ပြီး ရွှေ့မယ်။ ရွှေ့လိုက်တဲ့ အရေအတွက်ကို ပြန်ပေးမယ်။
+        """
+        cutoff = time.time() - max_age_days * 86400
+        archived = 0
+        try:
+            self.flush()
+            with self._read() as conn:
+                user_ids = [row[0] for row in conn.execute("SELECT DISTINCT user_id FROM chat_history")]
+
+            for user_id in user_ids:
+                with self._read() as conn:
+                    # နောက်ဆုံး max_rows_per_user အတွင်း မပါတော့တဲ့ ပထမဆုံး id (မရှိရင် 0)
+                    row = conn.execute(
+                        "SELECT id FROM chat_history WHERE user_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?",
+                        (user_id, max_rows_per_user)
+                    ).fetchone()
+                overflow_id = row[0] if row else 0
+
+                while True:
+                    # Batch အလိုက် ရွှေ့မယ် (Writer Lock ကို ကြာကြာ မကိုင်ထားအောင်)
+                    with self._write() as conn:
+                        rows = conn.execute(
+                            "SELECT id, role, content, timestamp FROM chat_history "
+                            "WHERE user_id = ? AND (id <= ? OR timestamp < ?) ORDER BY id LIMIT ?",
+                            (user_id, overflow_id, cutoff, self.ARCHIVE_BATCH_SIZE)
+                        ).fetchall()
+                        if not rows:
+                            break
+                        now = time.time()
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO chat_history_archive (id, user_id, role, content, timestamp, archived_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            [(row_id, user_id, role, zlib.compress((content or "").encode("utf-8")), ts, now)
+                             for row_id, role, content, ts in rows]
+                        )
+                        conn.executemany("DELETE FROM chat_history WHERE id = ?", [(row[0],) for row in rows])
+                    archived += len(rows)
+
+            if archived:
+                logger.info(f"📦 Archived {archived} old chat turns.")
+            return archived
+        except Exception as e:
+            logger.error(f"Archive Error: {e}")
+            return archived
+
+    def get_archived_history(self, user_id, limit=50):
+        """Archive ထဲက စကားဝိုင်းအဟောင်းတွေကို ပြန်ဖြည်ပြီး ဖတ်မယ်"""
+        try:
+            with self._read() as conn:
+                rows = conn.execute(
+                    "SELECT role, content, timestamp FROM chat_history_archive WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+                    (user_id, limit)
+                ).fetchall()
+            return [
+                {"role": role, "content": zlib.decompress(content).decode("utf-8"), "timestamp": ts}
+                for role, content, ts in reversed(rows)
+            ]
+        except Exception as e:
+            logger.error(f"Archive Read Error: {e}")
+            return []
+
+    def incremental_vacuum(self, max_pages: int = 0) -> int:
+        """Free Page တွေကို File ကနေ ပြန်လွှတ်မယ် (0 = အကုန်)။ လွှတ်လိုက်တဲ့ Page အရေအတွက်ကို ပြန်ပေးမယ်။"""
+        try:
+            with self._write_lock:
+                conn = self._writer
+                conn.commit()
+                before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                # execute() က Page တစ်ခုစာပဲ Step လုပ်လို့ executescript နဲ့ အဆုံးထိ Run မယ်
+                conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                freed = before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if freed:
+                logger.info(f"🧹 Incremental vacuum released {freed} pages.")
+            return freed
+        except Exception as e:
+            logger.error(f"Vacuum Error: {e}")
+            return 0
+
     # ==========================================
     # အပိုင်း (ခ) - ထာဝရ မှတ်ဉာဏ် (Permanent Knowledge)
     # ==========================================
     def update_profile(self, user_id, key, value):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT OR REPLACE INTO user_profile (user_id, key_name, value_text) VALUES (?, ?, ?)",
-                (user_id, key, value)
-            )
-            conn.commit()
-            conn.close()
+            with self._write() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO user_profile (user_id, key_name, value_text) VALUES (?, ?, ?)",
+                    (user_id, key, value)
+                )
             return True
         except Exception as e:
             logger.error(f"Profile Update Error: {e}")
@@ -122,16 +441,15 @@ class SQLStorage:
 
     def get_user_profile(self, user_id):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT key_name, value_text FROM user_profile WHERE user_id = ?", (user_id,))
-            rows = cursor.fetchall()
-            conn.close()
-            
+            with self._read() as conn:
+                rows = conn.execute(
+                    "SELECT key_name, value_text FROM user_profile WHERE user_id = ?", (user_id,)
+                ).fetchall()
+
             profile_text = "USER PROFILE (PERMANENT KNOWLEDGE):\n"
             if not rows:
                 return profile_text + "No known facts yet."
-            
+
             for key, val in rows:
                 profile_text += f"- {key}: {val}\n"
             return profile_text
@@ -144,14 +462,7 @@ class SQLStorage:
     def add_ongoing_task(self, user_id, task_description):
         """အလုပ်တစ်ခု စလုပ်တိုင်း ဒီမှာ လာမှတ်ထားမယ်"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO ongoing_tasks (user_id, task_description, status, timestamp) VALUES (?, ?, ?, ?)",
-                (user_id, task_description, "In Progress", time.time())
-            )
-            conn.commit()
-            conn.close()
+            self._buffer("task", (user_id, task_description, "In Progress", time.time()))
             return True
         except Exception as e:
             logger.error(f"Add Task Error: {e}")
@@ -160,15 +471,17 @@ class SQLStorage:
     def get_ongoing_tasks(self, user_id):
         """လက်ရှိ ဘာအလုပ်တွေ တန်းလန်းဖြစ်နေလဲ ပြန်ဆွဲထုတ်မယ်"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, task_description, status FROM ongoing_tasks WHERE user_id = ?", (user_id,))
-            rows = cursor.fetchall()
-            conn.close()
-            
+            # Task ID တွေ ပြရမှာမို့ Buffer ထဲမှာ ကျန်နေတာရှိရင် အရင် Flush လုပ်မယ်
+            if self._pending_tasks:
+                self.flush()
+            with self._read() as conn:
+                rows = conn.execute(
+                    "SELECT id, task_description, status FROM ongoing_tasks WHERE user_id = ?", (user_id,)
+                ).fetchall()
+
             if not rows:
                 return ""
-            
+
             tasks_text = "CURRENT ONGOING TASKS:\n"
             for row_id, desc, status in rows:
                 tasks_text += f"- [Task ID: {row_id}] {desc} (Status: {status})\n"
@@ -179,13 +492,10 @@ class SQLStorage:
     def remove_ongoing_task(self, task_id):
         """အလုပ်ပြီးသွားရင် ပြန်ဖျက်မယ်"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM ongoing_tasks WHERE id = ?", (task_id,))
-            conn.commit()
-            conn.close()
+            with self._write() as conn:
+                conn.execute("DELETE FROM ongoing_tasks WHERE id = ?", (task_id,))
             return True
         except Exception:
             return False
 
-sql_storage = SQLStorage()
\ No newline at end of file
+sql_storage = SQLStorage()
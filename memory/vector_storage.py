@@ -1,51 +1,101 @@
 import os
+import re
+import json
+import math
+import zlib
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from config import Config
+from memory.embedding_cache import embedding_cache
 
 logger = logging.getLogger("JARVIS_VECTOR_STORAGE")
 
-# 1. Library များကို ခေါ်ယူခြင်း
-try:
-    import lancedb
-    from lancedb.pydantic import LanceModel, Vector
-    from lancedb.embeddings import get_registry
-except ImportError as e:
-    lancedb = None
-    print(f"❌ Library Error: lancedb မရှိပါ။ ({e})")
-
+# Library / Embedding Model တွေက Import လုပ်ရုံနဲ့ စက္ကန့်အတော်ကြာလို့ ပထမဆုံး သုံးမှပဲ Load လုပ်မယ်
+lancedb = None
 KnowledgeSchema = None
 embed_fn = None
+_load_lock = threading.Lock()
+_load_attempted = False
 
-# 2. Schema ကို ကြိုတင် ပြင်ဆင်ခြင်း
-if lancedb:
-    try:
-        embed_fn = get_registry().get("sentence-transformers").create(name="all-MiniLM-L6-v2")
-        
-        class _Schema(LanceModel):
-            id: str
-            category: str           
-            task_or_query: str = embed_fn.SourceField()  
-            solution: str           
-            code_snippet: str       
-            timestamp: str
-            # Vector Size ကို Error မတက်အောင် 384 ဟု အသေသတ်မှတ်ထားသည်
-            vector: Vector(384) = embed_fn.VectorField() 
-        KnowledgeSchema = _Schema
-    except Exception as e:
-        print(f"❌ Embedding Load Error: {e}")
+def _load_backend() -> bool:
+    """lancedb + Sentence-Transformer Schema ကို တစ်ကြိမ်ပဲ Load လုပ်မယ် (Thread-safe)"""
+    global lancedb, KnowledgeSchema, embed_fn, _load_attempted
+    with _load_lock:
+        if _load_attempted:
+            return KnowledgeSchema is not None
+
+        _load_attempted = True
+        # 1. Library များကို ခေါ်ယူခြင်း
+        try:
+            import lancedb as _lancedb
+            from lancedb.pydantic import LanceModel, Vector
+            from lancedb.embeddings import get_registry
+            lancedb = _lancedb
+        except ImportError as e:
+            print(f"❌ Library Error: lancedb မရှိပါ။ ({e})")
+            print("⚠️ Vector DB ကို ပိတ်ထားပါသည်။ (Library အခက်အခဲရှိသည်)")
+            return False
+
+        # 2. Schema ကို ပြင်ဆင်ခြင်း
+        try:
+            embed_fn = get_registry().get("sentence-transformers").create(name=Config.EMBEDDING_MODEL_NAME)
+
+            class _Schema(LanceModel):
+                id: str
+                category: str           
+                task_or_query: str = embed_fn.SourceField()  
+                solution: str           
+                code_snippet: str       
+                timestamp: str
+                # Vector Size ကို Error မတက်အောင် 384 ဟု အသေသတ်မှတ်ထားသည်
+                vector: Vector(384) = embed_fn.VectorField() 
+            KnowledgeSchema = _Schema
+        except Exception as e:
+            print(f"❌ Embedding Load Error: {e}")
+            print("⚠️ Vector DB ကို ပိတ်ထားပါသည်။ (Library အခက်အခဲရှိသည်)")
+        return KnowledgeSchema is not None
+
+KNOWLEDGE_CATEGORIES = ("Skill", "Mistake", "Fact")
+FTS_COLUMNS = ("task_or_query", "solution", "code_snippet")
+# MinHash Band တစ်ခုမှာ Hash 2 ခုစလုံး တူမှ Candidate (Common Word တစ်လုံးတည်းကြောင့် Group ကြီးမဖြစ်အောင်)၊
+# Band များလေ စကားလုံး နည်းနည်းပဲ တူတဲ့ Near-duplicate ကိုပါ မိလေ
+DEDUP_MINHASH_BANDS = 4
+DEDUP_MINHASH_ROWS = 2
+DEDUP_MAX_GROUP = 500  # ဒီထက်ကြီးတဲ့ Group ကို ကျော်မယ် (Vector အကုန် RAM ထဲ မတင်ရအောင်)
 
 # 3. Storage Class
 class VectorStorage:
+    VECTOR_DIM = 384
+
     def __init__(self):
         self.db_path = os.path.abspath(Config.VECTOR_DB_PATH)
         self.table_name = "jarvis_knowledge"
         self.table = None
-        
-        if lancedb and KnowledgeSchema:
-            self._init_db()
-        else:
-            print("⚠️ Vector DB ကို ပိတ်ထားပါသည်။ (Library အခက်အခဲရှိသည်)")
+        self.db = None
+        self.model_loaded = False
+        self._connect_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # ANN Index ဆောက်ခဲ့တုန်းက Row အရေအတွက် (Restart ပြီးလည်း သိအောင် File ထဲ မှတ်ထားမယ်)
+        self._index_state_path = os.path.join(self.db_path, "index_state.json")
+        self._index_state = self._load_index_state()
+        # --- Insert Buffer ---
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._insert_buffer = []
+        self._flush_timer = None
+        self._executor = None  # MemoryController ရဲ့ Vector Thread Pool (set_executor နဲ့ ချိတ်မယ်)
+
+    def _ensure_table(self) -> bool:
+        """Table မရှိသေးရင် (ပထမဆုံးအကြိမ် / Auto-Reconnect) ချိတ်မယ်"""
+        if self.table is not None:
+            return True
+        with self._connect_lock:
+            if self.table is not None:
+                return True
+            if not _load_backend():
+                return False
+            return self._init_db()
 
     def _init_db(self):
         try:
@@ -58,62 +108,500 @@ class VectorStorage:
             else:
                 self.table = self.db.open_table(self.table_name)
                 print(f"✅ Vector Storage Connected at: {self.db_path}")
+            self._ensure_category_index()
+            self._ensure_fts_indexes()
             return True
         except Exception as e:
             print(f"❌ Vector DB Init Error: {e}")
             return False
 
-    def save_knowledge(self, category: str, task: str, solution: str, code_snippet: str = ""):
+    # ==========================================
+    # Index Management
+    # ==========================================
+    def _load_index_state(self) -> dict:
+        try:
+            with open(self._index_state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index_state(self):
+        try:
+            os.makedirs(self.db_path, exist_ok=True)
+            with open(self._index_state_path, "w", encoding="utf-8") as f:
+                json.dump(self._index_state, f)
+        except OSError as e:
+            logger.warning(f"Index state save failed: {e}")
+
+    def _ensure_category_index(self):
+        """category Column ပေါ်မှာ Scalar Index (Bitmap - Value အမျိုးအစား နည်းလို့) ရှိနေအောင်"""
+        if self._index_state.get("category"):
+            return
+        try:
+            try:
+                self.table.create_scalar_index("category", index_type="BITMAP", replace=True)
+            except TypeError:
+                # lancedb Version အဟောင်းမှာ index_type မရှိ (BTree ပဲ ရတယ်)
+                self.table.create_scalar_index("category", replace=True)
+            self._index_state["category"] = True
+            self._save_index_state()
+            logger.info("🗂️ Scalar index on 'category' created.")
+        except Exception as e:
+            logger.warning(f"Category index skipped: {e}")
+
+    def _ensure_fts_indexes(self):
+        """Full-text (BM25) Index ကို Column တစ်ခုချင်းစီမှာ ဆောက်မယ် (Index အသစ်ဝင်လာတဲ့ Row တွေကို optimize() က Update လုပ်ပေးတယ်)"""
+        built = set(self._index_state.get("fts", []))
+        for column in FTS_COLUMNS:
+            if column in built:
+                continue
+            try:
+                self.table.create_fts_index(column, use_tantivy=False, replace=True)
+                built.add(column)
+            except Exception as e:
+                logger.warning(f"FTS index on '{column}' skipped: {e}")
+        if built != set(self._index_state.get("fts", [])):
+            self._index_state["fts"] = sorted(built)
+            self._save_index_state()
+            logger.info(f"🔤 Full-text indexes ready: {sorted(built)}")
+
+    def ensure_indexes(self, force: bool = False) -> dict:
+        """
+        Row အရေအတွက် VECTOR_INDEX_MIN_ROWS ကျော်ရင် ANN (IVF_PQ) Index ဆောက်မယ်။
+        Index ဆောက်ပြီးချိန်ကထက် VECTOR_INDEX_REBUILD_GROWTH ဆ ကြီးလာရင် ပြန်ဆောက်မယ်
+        (Index မလုပ်ရသေးတဲ့ Row အသစ်တွေကို LanceDB က Brute-force နဲ့ ပေါင်းရှာပေးတယ်)။
+        """
+        if not self._ensure_table():
+            return {"indexed": False}
+        with self._index_lock:
+            rows = self.table.count_rows()
+            indexed_rows = self._index_state.get("vector_rows", 0)
+            needs_build = rows >= Config.VECTOR_INDEX_MIN_ROWS and (
+                force or not indexed_rows or rows >= indexed_rows * Config.VECTOR_INDEX_REBUILD_GROWTH
+            )
+            if needs_build:
+                try:
+                    started = datetime.now()
+                    self.table.create_index(
+                        metric="L2",  # search_knowledge ရဲ့ Distance Threshold တွေက L2 ပေါ်မှာ အခြေခံထားလို့
+                        vector_column_name="vector",
+                        num_partitions=max(1, int(math.sqrt(rows))),
+                        num_sub_vectors=self.VECTOR_DIM // 8,
+                        replace=True,
+                    )
+                    self._index_state["vector_rows"] = rows
+                    self._save_index_state()
+                    elapsed = (datetime.now() - started).total_seconds()
+                    logger.info(f"🧭 ANN index built over {rows} rows in {elapsed:.1f}s")
+                except Exception as e:
+                    logger.error(f"❌ ANN index build failed: {e}")
+            self._ensure_category_index()
+            self._ensure_fts_indexes()
+            return {"rows": rows, "indexed_rows": self._index_state.get("vector_rows", 0)}
+
+    def _vector_search(self, vector, limit: int, category: str = None):
+        query = self.table.search(vector, vector_column_name="vector").limit(limit)
+        if self._index_state.get("vector_rows"):
+            # ANN Index ရှိရင် Recall မကျအောင် Partition ပိုစစ်ပြီး မူရင်း Vector နဲ့ ပြန်စီမယ်
+            query = query.nprobes(Config.VECTOR_SEARCH_NPROBES).refine_factor(Config.VECTOR_SEARCH_REFINE_FACTOR)
+        if category:
+            # Category ကို Vector Search မလုပ်ခင် Scalar Index နဲ့ အရင်စစ်မယ် (Prefilter)
+            query = query.where(f"category = '{category}'", prefilter=True)
+        return query.to_list()
+
+    def _fts_search(self, query: str, column: str, limit: int, category: str = None):
+        try:
+            search = self.table.search(query, query_type="fts", fts_columns=column).limit(limit)
+            if category:
+                search = search.where(f"category = '{category}'", prefilter=True)
+            return search.to_list()
+        except Exception as e:
+            logger.debug(f"FTS search on '{column}' skipped: {e}")
+            return []
+
+    def hybrid_search(self, query: str, limit: int = 3, category: str = None) -> list:
+        """
+        Vector Search + Column အလိုက် Full-text Search ရလဒ်တွေကို Weighted Reciprocal Rank Fusion နဲ့ ပေါင်းမယ်
+        score(doc) = Σ weight / (RRF_K + rank)
+        Full-text မှာ တွေ့တဲ့ Doc တွေကို (Error Code, Package Name စသဖြင့် တိုက်ရိုက်တူလို့) Distance မကြည့်ဘဲ လက်ခံမယ်၊
+        Vector တစ်ခုတည်းနဲ့ ရတာတွေကိုတော့ Distance Threshold နဲ့ စစ်မယ်။
+        """
+        depth = max(limit * 4, 10)
+        rrf_k = Config.HYBRID_RRF_K
+        docs, scores, fts_hits = {}, {}, set()
+
+        for rank, res in enumerate(self._vector_search(self._embed([query])[0], depth, category)):
+            docs[res["id"]] = res
+            scores[res["id"]] = scores.get(res["id"], 0.0) + Config.HYBRID_VECTOR_WEIGHT / (rrf_k + rank + 1)
+
+        for column in self._index_state.get("fts", []):
+            weight = Config.HYBRID_FTS_WEIGHTS.get(column, 0.0)
+            if weight <= 0:
+                continue
+            for rank, res in enumerate(self._fts_search(query, column, depth, category)):
+                docs.setdefault(res["id"], res)
+                fts_hits.add(res["id"])
+                scores[res["id"]] = scores.get(res["id"], 0.0) + weight / (rrf_k + rank + 1)
+
+        # Query တိုရင် Vector Match က မတိကျလို့ Threshold ကို ပိုတင်းမယ်
+        max_distance = Config.HYBRID_SHORT_QUERY_MAX_DISTANCE if len(query.split()) < 3 else Config.HYBRID_MAX_DISTANCE
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        results = []
+        for doc_id in ranked:
+            res = docs[doc_id]
+            distance = res.get("_distance")
+            if doc_id in fts_hits or (distance is not None and distance < max_distance):
+                results.append({**res, "_score": scores[doc_id]})
+            if len(results) >= limit:
+                break
+        return results
+
+    def _embed(self, texts: list) -> list:
+        """Embedding Cache ကနေ ယူမယ်၊ မရှိတာကိုပဲ Model နဲ့ Batch Embed လုပ်မယ်"""
+        return embedding_cache.get_many(texts, embed_fn.compute_source_embeddings)
+
+    def warm_up(self) -> bool:
+        """Background Warm-up: DB ချိတ်ပြီး Embedding Model ကို ကြို Load လုပ်ထားမယ် (ပထမဆုံး Search မနှေးအောင်)"""
+        if not self._ensure_table():
+            return False
+        if not self.model_loaded:
+            try:
+                embed_fn.compute_query_embeddings("warm up")
+                self.model_loaded = True
+            except Exception as e:
+                print(f"❌ Embedding Warm-up Error: {e}")
+        return self.model_loaded
+
+    def status(self) -> dict:
+        """/ready Endpoint အတွက် Subsystem State"""
+        return {
+            "backend_loaded": KnowledgeSchema is not None,
+            "connected": self.table is not None,
+            "embedding_model_loaded": self.model_loaded,
+        }
+
+    # ==========================================
+    # Insert (Batch + Buffer)
+    # ==========================================
+    def save_knowledge_many(self, items: list) -> int:
+        """
+        items: [{"category", "task_or_query", "solution", "code_snippet"}, ...]
+        Embedding ကို Batch တစ်ခါတည်း လုပ်ပြီး table.add တစ်ကြိမ်တည်း (Fragment / Version တစ်ခုတည်း) နဲ့ ထည့်မယ်
+        """
+        items = [item for item in items if item.get("category") in KNOWLEDGE_CATEGORIES]
+        if not items:
+            return 0
         # Table မရှိရင် Auto-Reconnect ပြန်လုပ်မယ့်စနစ် (Bullet-proof)
-        if self.table is None:
-            print("⚠️ self.table is None. Retrying to connect to Vector DB...")
-            if lancedb and KnowledgeSchema:
-                self._init_db()
-            
-        if self.table is None:
+        if not self._ensure_table():
             print("❌ Save Error: Vector DB သို့ ချိတ်ဆက်၍ မရပါ။")
-            return False
-        
+            return 0
+
         try:
             import uuid
-            data = [{
-                "id": uuid.uuid4().hex,
-                "category": category,
-                "task_or_query": task,
-                "solution": solution,
-                "code_snippet": code_snippet,
-                "timestamp": datetime.now(Config.TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
-            }]
-            self.table.add(data)
-            print(f"✅ Data successfully saved to Vector DB: [{category}]")
-            return True
+            now = datetime.now(Config.TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
+            # Vector ကို ကိုယ်တိုင်ထည့်ပေးလို့ LanceDB က ထပ်မ Embed တော့ဘူး
+            vectors = self._embed([item["task_or_query"] for item in items])
+            data, pending = [], []
+            stats = {"added": 0, "updated": 0, "skipped": 0}
+            for item, vector in zip(items, vectors):
+                row = {
+                    "id": uuid.uuid4().hex,
+                    "category": item["category"],
+                    "task_or_query": item["task_or_query"],
+                    "solution": item["solution"],
+                    "code_snippet": item.get("code_snippet") or "",
+                    "timestamp": now,
+                    "vector": vector,
+                }
+                # တူညီလုနီးပါး Knowledge ရှိပြီးသားဆိုရင် Row အသစ် မထည့်ဘဲ Skip / Update / Merge လုပ်မယ်
+                action = self._dedup_row(row, pending)
+                stats[action] += 1
+                if action == "added":
+                    data.append(row)
+                    pending.append(row)
+            if data:
+                self.table.add(data)
+            self.model_loaded = True
+            print(f"✅ Vector DB save: {stats}")
+            # Threshold ကို ပထမဆုံး ကျော်တဲ့အချိန်မှာ ANN Index ဆောက်မယ် (ပြန်ဆောက်တာကိုတော့ Maintenance Job က လုပ်မယ်)
+            if data and not self._index_state.get("vector_rows") and self.table.count_rows() >= Config.VECTOR_INDEX_MIN_ROWS:
+                self.ensure_indexes()
+            return len(items)
         except Exception as e:
             print(f"❌ Save Vector Error: {e}")
+            return 0
+
+    # ==========================================
+    # Near-duplicate Suppression
+    # ==========================================
+    @staticmethod
+    def _squared_l2(a, b) -> float:
+        """LanceDB ရဲ့ L2 _distance နဲ့ တူအောင် Squared Euclidean"""
+        return sum((x - y) ** 2 for x, y in zip(a, b))
+
+    @staticmethod
+    def _same_text(a: str, b: str) -> bool:
+        return " ".join((a or "").split()).lower() == " ".join((b or "").split()).lower()
+
+    @staticmethod
+    def _merged_fields(existing: dict, incoming: dict, policy: str) -> dict:
+        """Update = အသစ်နဲ့ အစားထိုး / Merge = Solution အသစ်ကို နောက်မှာ ဆက်ထည့် (မပါသေးရင်)"""
+        solution = incoming["solution"]
+        if policy == "merge" and incoming["solution"].strip() not in (existing.get("solution") or ""):
+            solution = f"{existing.get('solution', '').rstrip()}\n---\n{incoming['solution']}"[-Config.KNOWLEDGE_MERGE_MAX_CHARS:]
+        elif policy == "merge":
+            solution = existing.get("solution") or incoming["solution"]
+        return {
+            "solution": solution,
+            "code_snippet": incoming["code_snippet"] or existing.get("code_snippet") or "",
+            "timestamp": incoming["timestamp"],
+        }
+
+    def _dedup_row(self, row: dict, pending: list) -> str:
+        """
+        Category တူတဲ့ အနီးဆုံး Entry နဲ့ Distance စစ်ပြီး 'added' / 'updated' / 'skipped' တစ်ခုခု ပြန်ပေးမယ်
+        (Table ထဲက Entry အပြင် ဒီ Batch ထဲမှာ ရှေ့ကထည့်ထားတဲ့ Row တွေနဲ့ပါ စစ်မယ်)
+        """
+        threshold = Config.KNOWLEDGE_DEDUP_DISTANCE
+        if threshold <= 0:
+            return "added"
+
+        # 1. ဒီ Batch ထဲမှာပဲ ထပ်နေရင်
+        for other in pending:
+            if other["category"] == row["category"] and self._squared_l2(other["vector"], row["vector"]) < threshold:
+                if self._same_text(other["solution"], row["solution"]) or Config.KNOWLEDGE_DEDUP_POLICY == "skip":
+                    return "skipped"
+                other.update(self._merged_fields(other, row, Config.KNOWLEDGE_DEDUP_POLICY))
+                return "updated"
+
+        # 2. Table ထဲမှာ ရှိပြီးသားဆိုရင်
+        matches = self._vector_search(row["vector"], 1, row["category"])
+        if not matches or matches[0].get("_distance", threshold) >= threshold:
+            return "added"
+        existing = matches[0]
+        if self._same_text(existing.get("solution"), row["solution"]) or Config.KNOWLEDGE_DEDUP_POLICY == "skip":
+            return "skipped"
+        values = self._merged_fields(existing, row, Config.KNOWLEDGE_DEDUP_POLICY)
+        self.table.update(where=f"id = '{existing['id']}'", values=values)
+        return "updated"
+
+    @staticmethod
+    def _dedup_keys(category: str, text: str) -> set:
+        """
+        MinHash Blocking Key များ - Band တစ်ခုစီအတွက် (Category, Band, Seed တစ်ခုစီရဲ့ အငယ်ဆုံး Token Hash များ)
+        စကားလုံး ဆင်တူလေ Key တစ်ခုခု တူနိုင်ခြေ များလေ၊ Key တူတဲ့ Row တွေကိုပဲ Vector နဲ့ စစ်မယ်
+        """
+        normalized = " ".join((text or "").split()).lower()
+        tokens = {token for token in re.findall(r"\w+", normalized) if len(token) > 2} or {normalized}
+        hashes = [min(zlib.crc32(f"{seed}:{token}".encode("utf-8")) for token in tokens)
+                  for seed in range(DEDUP_MINHASH_BANDS * DEDUP_MINHASH_ROWS)]
+        return {
+            (category, band) + tuple(hashes[band * DEDUP_MINHASH_ROWS:(band + 1) * DEDUP_MINHASH_ROWS])
+            for band in range(DEDUP_MINHASH_BANDS)
+        }
+
+    def _rows_by_id(self, ids: list, columns: list) -> list:
+        rows = []
+        for start in range(0, len(ids), 200):
+            id_list = ", ".join(f"'{doc_id}'" for doc_id in ids[start:start + 200])
+            rows += self.table.search().where(f"id IN ({id_list})").select(columns).limit(None).to_list()
+        return rows
+
+    def dedup_table(self) -> dict:
+        """
+        Offline Dedup Pass - ရှိပြီးသား Table ထဲက တူညီလုနီးပါး Entry တွေကို Category အလိုက် စုပြီး
+        အသစ်ဆုံး တစ်ခုကိုပဲ ချန်မယ် (ဖျက်လိုက်တဲ့ Entry ရဲ့ Code Snippet ကို လိုရင် ယူထားမယ်)
+        Table တစ်ခုလုံး (Vector အပါအဝင်) ကို RAM ထဲ မတင်ဘဲ id/category/task_or_query ကိုပဲ Batch လိုက် ဖတ်ပြီး
+        MinHash Key တူတဲ့ Candidate Group တွေအတွက်ပဲ Vector ကို ယူစစ်မယ်
+        """
+        if not self._ensure_table():
+            return {"removed": 0}
+        self.flush_inserts()
+        threshold = Config.KNOWLEDGE_DEDUP_DISTANCE
+
+        buckets, scanned = {}, 0
+        reader = (self.table.search().select(["id", "category", "task_or_query"]).limit(None)
+                  .to_batches(Config.KNOWLEDGE_DEDUP_SCAN_BATCH))
+        for batch in reader:
+            for row in batch.to_pylist():
+                scanned += 1
+                for key in self._dedup_keys(row["category"], row["task_or_query"]):
+                    buckets.setdefault(key, []).append(row["id"])
+
+        removed, snippets, candidates = set(), {}, set()
+        for ids in buckets.values():
+            ids = [doc_id for doc_id in ids if doc_id not in removed]
+            if len(ids) < 2:
+                continue
+            if len(ids) > DEDUP_MAX_GROUP:
+                logger.debug(f"Dedup group of {len(ids)} rows skipped (over {DEDUP_MAX_GROUP})")
+                continue
+            candidates.update(ids)
+            rows = self._rows_by_id(ids, ["id", "code_snippet", "timestamp", "vector"])
+            rows.sort(key=lambda r: r.get("timestamp") or "", reverse=True)
+            for i, row in enumerate(rows):
+                if row["id"] in removed:
+                    continue
+                duplicates = [other for other in rows[i + 1:]
+                              if other["id"] not in removed and self._squared_l2(row["vector"], other["vector"]) < threshold]
+                if not duplicates:
+                    continue
+                removed.update(other["id"] for other in duplicates)
+                if not (snippets.get(row["id"]) or row.get("code_snippet")):
+                    snippet = next((snippets.get(other["id"]) or other.get("code_snippet")
+                                    for other in duplicates if snippets.get(other["id"]) or other.get("code_snippet")), "")
+                    if snippet:
+                        snippets[row["id"]] = snippet
+
+        for doc_id, snippet in snippets.items():
+            if doc_id not in removed:
+                self.table.update(where=f"id = '{doc_id}'", values={"code_snippet": snippet})
+        removed = list(removed)
+        for start in range(0, len(removed), 200):
+            ids = ", ".join(f"'{doc_id}'" for doc_id in removed[start:start + 200])
+            self.table.delete(f"id IN ({ids})")
+        if removed:
+            logger.info(f"🧽 Knowledge dedup removed {len(removed)} near-duplicate entries.")
+        return {"scanned": scanned, "candidates": len(candidates), "removed": len(removed)}
+
+    def set_executor(self, executor):
+        """Timer ကနေ Flush လုပ်တဲ့အခါ Bare Timer Thread မှာ မဟုတ်ဘဲ Vector Thread Pool ထဲမှာ Run မယ်"""
+        self._executor = executor
+
+    def save_knowledge(self, category: str, task: str, solution: str, code_snippet: str = ""):
+        """တစ်ခုချင်း Save တွေကို Insert Buffer ထဲ စုပြီး save_knowledge_many နဲ့ Batch အလိုက် ရေးမယ်"""
+        # Queue ထဲ မထည့်ခင် စစ်မယ် (မမှန်တဲ့ Category က Batch တစ်ခုလုံးကို ကျရှုံးစေပြီး where Filter ထဲ ရောက်မသွားအောင်)
+        if category not in KNOWLEDGE_CATEGORIES:
+            print(f"❌ Save Error: Unknown knowledge category '{category}'")
             return False
+        if not self._ensure_table():
+            print("❌ Save Error: Vector DB သို့ ချိတ်ဆက်၍ မရပါ။")
+            return False
+
+        item = {"category": category, "task_or_query": task, "solution": solution, "code_snippet": code_snippet}
+        with self._buffer_lock:
+            self._insert_buffer.append(item)
+            size = len(self._insert_buffer)
+            if size < Config.VECTOR_INSERT_BATCH_SIZE:
+                self._schedule_flush()
+        print(f"📥 Knowledge queued for Vector DB: [{category}]")
+        if size >= Config.VECTOR_INSERT_BATCH_SIZE:
+            return self.flush_inserts() > 0
+        return True
+
+    def _schedule_flush(self):
+        """Flush Timer မရှိသေးရင် စမယ် (_buffer_lock ကိုင်ထားပြီးမှ ခေါ်ရမယ်)"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(Config.VECTOR_INSERT_FLUSH_INTERVAL, self._on_flush_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
-    def search_knowledge(self, query: str, limit: int = 3):
+    def _on_flush_timer(self):
+        """Timer Thread က အချိန်ပဲ စောင့်မယ်၊ Embedding / table.add ကို Vector Thread Pool ထဲ ပို့မယ်"""
+        if self._executor is not None:
+            try:
+                self._executor.submit(self.flush_inserts)
+                return
+            except RuntimeError:
+                pass  # Shutdown ဖြစ်နေရင် ဒီမှာပဲ Flush လုပ်မယ်
+        self.flush_inserts()
+
+    def flush_inserts(self) -> int:
+        """
+        Buffer ထဲက Knowledge တွေကို ရေးမယ်
+        မအောင်မြင်ရင် Buffer ထဲ ပြန်ထည့်ပြီး Timer ပြန်စမယ်၊ VECTOR_INSERT_MAX_ATTEMPTS ကြိမ် ကျရှုံးပြီးသား Item တွေကိုတော့ Log ထုတ်ပြီး ပစ်မယ်
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                items, self._insert_buffer = self._insert_buffer, []
+            if not items:
+                return 0
+            saved = self.save_knowledge_many(items)
+            if not saved:
+                retry = []
+                for item in items:
+                    item["_attempts"] = item.get("_attempts", 0) + 1
+                    if item["_attempts"] < Config.VECTOR_INSERT_MAX_ATTEMPTS:
+                        retry.append(item)
+                    else:
+                        logger.error(f"🗑️ Dropping knowledge after {item['_attempts']} failed saves: "
+                                     f"[{item['category']}] {item['task_or_query'][:80]}")
+                if retry:
+                    with self._buffer_lock:
+                        self._insert_buffer[:0] = retry
+                        self._schedule_flush()
+            return saved
+
+    # ==========================================
+    # Maintenance (Compaction)
+    # ==========================================
+    def _fragment_count(self):
+        try:
+            return len(self.table.to_lance().get_fragments())
+        except Exception:
+            return None  # pylance မရှိရင် မသိနိုင်
+
+    def _probe_latency_ms(self):
+        try:
+            vector = self._embed(["latency probe"])[0]
+            started = datetime.now()
+            self._vector_search(vector, 3)
+            return round((datetime.now() - started).total_seconds() * 1000, 2)
+        except Exception:
+            return None
+
+    def compact(self) -> dict:
+        """
+        Fragment အသေးလေးတွေကို ပေါင်းမယ်၊ Version အဟောင်းတွေကို ရှင်းမယ်၊ Index ကို Update / ပြန်ဆောက်မယ်။
+        ရှေ့/နောက် Fragment အရေအတွက်နဲ့ Search Latency ကို Report ပြန်ပေးမယ်။
+        """
+        if not self._ensure_table():
+            return {"compacted": False}
+        self.flush_inserts()
+        report = {"dedup": self.dedup_table() if Config.KNOWLEDGE_DEDUP_ON_MAINTENANCE else None}
+        report.update({"fragments_before": self._fragment_count(), "search_ms_before": self._probe_latency_ms()})
+        retention = timedelta(days=Config.VECTOR_VERSION_RETENTION_DAYS)
+        with self._index_lock:
+            try:
+                self.table.optimize(cleanup_older_than=retention)
+            except AttributeError:
+                # lancedb Version အဟောင်း
+                self.table.compact_files()
+                self.table.cleanup_old_versions(older_than=retention)
+        report["index"] = self.ensure_indexes()
+        report["fragments_after"] = self._fragment_count()
+        report["search_ms_after"] = self._probe_latency_ms()
+        report["compacted"] = True
+        logger.info(f"🗜️ Knowledge table compacted: {report}")
+        return report
+
+    def search_knowledge(self, query: str, limit: int = 3, category: str = None):
         # ရှာတဲ့အချိန်မှာလည်း Table မရှိရင် ပြန်ချိတ်မယ်
-        if self.table is None:
-            if lancedb and KnowledgeSchema:
-                self._init_db()
-        
-        if self.table is None: 
+        if not self._ensure_table():
+            return ""
+        if category and category not in KNOWLEDGE_CATEGORIES:
             return ""
+        # Save ထားပြီး မရေးရသေးတာတွေကို ရှာလို့ရအောင် အရင် Flush လုပ်မယ်
+        self.flush_inserts()
         
         try:
-            results = self.table.search(query).limit(limit).to_list()
+            # Full-text (BM25) + Vector ကို Rank Fusion နဲ့ ပေါင်းရှာမယ် (Relevance စစ်ပြီးသား)
+            results = self.hybrid_search(query, limit, category)
+            self.model_loaded = True
             if not results: return ""
             
             memory_text = "🧠 [JARVIS PAST EXPERIENCE & KNOWLEDGE]:\n"
             for res in results:
-                if res.get('_distance', 1.0) < 1.2:  
-                    cat = res['category']
-                    task = res['task_or_query']
-                    sol = res['solution']
-                    code = res['code_snippet']
-                    
-                    memory_text += f"\n[{cat}] Situation/Query: {task}\nAction/Fact: {sol}\n"
-                    if code: memory_text += f"Code Snippet:\n```\n{code}\n```\n"
+                cat = res['category']
+                task = res['task_or_query']
+                sol = res['solution']
+                code = res['code_snippet']
+                
+                memory_text += f"\n[{cat}] Situation/Query: {task}\nAction/Fact: {sol}\n"
+                if code: memory_text += f"Code Snippet:\n```\n{code}\n```\n"
                         
             return memory_text.strip()
         except Exception as e:
@@ -121,10 +609,11 @@ class VectorStorage:
             return ""
 
     def delete_knowledge(self, search_query: str):
-        if self.table is None: return False
+        if not self._ensure_table(): return False
+        self.flush_inserts()
         try:
             # အရင်ဆုံး ဖျက်ချင်တဲ့ အကြောင်းအရာကို ရှာမယ်
-            results = self.table.search(search_query).limit(1).to_list()
+            results = self._vector_search(self._embed([search_query])[0], 1)
             if results and results[0].get('_distance', 1.0) < 1.0:
                 target_id = results[0]['id']
                 # တွေ့ရင် အဲ့ဒီ ID ကို တိတိကျကျ ဖျက်မယ်
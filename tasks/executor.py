@@ -2,7 +2,7 @@ import asyncio
 import logging
 from telegram import Bot
 from config import Config
-from core.agent import JarvisAgent
+from core.agent_pool import agent_pool
 
 logger = logging.getLogger("TASK_EXECUTOR")
 
@@ -19,9 +19,7 @@ async def run_scheduled_task(prompt: str, user_id: int):
     
     try:
         # 1. Agent ကို အလုပ်ခိုင်းခြင်း
-        # (Task တစ်ခု run တိုင်း Agent အသစ်ခေါ်တာက Memory Leak မဖြစ်အောင်ပါ)
-        agent = JarvisAgent()
-        
+        # (Agent Pool ကနေ ငှားသုံးမယ်၊ Run ပြီးတိုင်း State ကို Reset လုပ်ပြီးမှ ပြန်ထည့်လို့ Memory Leak မဖြစ်ဘူး)
         # 🔥 FIX: AI ကို "ဒါ နှိုးစက်မြည်တာ၊ ဆရာ့ကို သွားသတင်းပို့တော့" လို့ အတိအကျ အမိန့်ပေးခြင်း
         system_trigger_prompt = f"""
         [SYSTEM ALERT: SCHEDULED EVENT TRIGGERED]
@@ -33,7 +31,8 @@ async def run_scheduled_task(prompt: str, user_id: int):
         - If it's a reminder, notify the Sir immediately (e.g., "Sir, it is time to go to work.").
         - If it's a research/report task, use your tools to get the data first, then present the final report to the Sir.
         """
-        response = await agent.chat(system_trigger_prompt, user_id=user_id)
+        async with agent_pool.acquire("ceo") as agent:
+            response = await agent.chat(system_trigger_prompt, user_id=user_id)
         
         # 2. Telegram ပို့ခြင်း (Log တင်မကတော့ဘူး)
         if Config.TELEGRAM_TOKEN and user_id:
@@ -0,0 +1,36 @@
+import logging
+from config import Config
+from memory.memory_controller import memory_controller
+
+logger = logging.getLogger("TASK_MAINTENANCE")
+
+MAINTENANCE_JOB_ID = "jarvis_memory_maintenance"
+KNOWLEDGE_MAINTENANCE_JOB_ID = "jarvis_knowledge_maintenance"
+
+async def run_memory_maintenance():
+    """
+    Scheduler ကနေ နေ့စဉ် ခေါ်မယ့် Memory Maintenance Job.
+    ၁။ Retention ကျော်တဲ့ Chat Turn တွေကို Archive Table ထဲ ရွှေ့မယ်။
+    ၂။ Incremental Vacuum နဲ့ DB File ကို ချုံ့မယ် (DB အဟောင်းဆိုရင် auto_vacuum=INCREMENTAL ကို အရင် တစ်ကြိမ် ပြောင်းမယ်)။
+    """
+    try:
+        result = await memory_controller.arun_maintenance(
+            Config.CHAT_RETENTION_DAYS, Config.CHAT_RETENTION_MAX_ROWS
+        )
+        logger.info(f"🧹 Memory maintenance done: {result}")
+    except Exception as e:
+        logger.error(f"❌ Memory Maintenance Failed: {e}")
+
+async def run_knowledge_maintenance():
+    """
+    Knowledge (LanceDB) Table Maintenance Job.
+    Fragment အသေးလေးတွေ ပေါင်းမယ်၊ Version အဟောင်း ရှင်းမယ်၊ ANN Index ကို Update / ပြန်ဆောက်မယ်။
+    """
+    try:
+        report = await memory_controller.acompact_knowledge()
+        logger.info(
+            f"🗜️ Knowledge maintenance done: fragments {report.get('fragments_before')} -> {report.get('fragments_after')}, "
+            f"search {report.get('search_ms_before')}ms -> {report.get('search_ms_after')}ms"
+        )
+    except Exception as e:
+        logger.error(f"❌ Knowledge Maintenance Failed: {e}")
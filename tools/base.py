@@ -1,6 +1,25 @@
+import logging
+from contextvars import ContextVar
 from typing import Dict, Any, List
 from google.genai import types
 
+logger = logging.getLogger("JARVIS_TOOLS")
+
+# Agent ရဲ့ send_status Callback (Tool Call တစ်ခုချင်းစီရဲ့ Task Context ထဲမှာ Agent က Set လုပ်ပေးမယ်)
+tool_status_callback: ContextVar = ContextVar("tool_status_callback", default=None)
+# Agent Run (chat() တစ်ခါ) အတွင်း Tool တွေ မျှသုံးမယ့် Resource များ (ဥပမာ - Persistent Shell)
+# Run ပြီးတာနဲ့ Agent က close_run_resources() နဲ့ ရှင်းမယ်
+tool_run_resources: ContextVar = ContextVar("tool_run_resources", default=None)
+
+async def close_run_resources(resources: Dict[str, Any]):
+    """Resource တစ်ခုချင်းစီရဲ့ close() ကို ခေါ်မယ် (တစ်ခု Error တက်လည်း ကျန်တာကို ဆက်ရှင်းမယ်)"""
+    for name, resource in list(resources.items()):
+        try:
+            await resource.close()
+        except Exception as e:
+            logger.error(f"❌ Run resource '{name}' close error: {e}")
+    resources.clear()
+
 class BaseTool:
     """
     Tool အားလုံးရဲ့ ဖခင် (Base Template).
@@ -9,6 +28,8 @@ class BaseTool:
     name: str = "base_tool"
     description: str = "Base description"
     owner_role: str = "all"  # 'ceo', 'web_surfer', 'sysadmin', 'researcher', သို့မဟုတ် 'all'
+    concurrency_safe: bool = True  # Shared Resource (ဥပမာ - Browser Page) ကိုင်တဲ့ Tool ဆိုရင် False ထားပါ
+    timeout: float = 120  # Call တစ်ခုရဲ့ အများဆုံးကြာချိန် (စက္ကန့်)၊ None ဆိုရင် အကန့်အသတ်မရှိ
     
     def get_parameters(self) -> Dict[str, types.Schema]:
         """
@@ -38,6 +59,25 @@ class BaseTool:
             )
         )
 
+    async def report_status(self, message: str):
+        """ကြာတဲ့ Tool တွေက Progress ကို User ဆီ ပို့ချင်ရင် ခေါ်ပါ (Callback မရှိရင် ဘာမှမလုပ်ဘူး)"""
+        callback = tool_status_callback.get()
+        if callback is None:
+            return
+        try:
+            await callback(message)
+        except Exception:
+            pass
+
+    def run_resource(self, key: str, factory):
+        """လက်ရှိ Agent Run ရဲ့ Resource ကို ယူမယ် (မရှိသေးရင် factory() နဲ့ ဆောက်မယ်)၊ Run အပြင်ဘက်ဆိုရင် None"""
+        resources = tool_run_resources.get()
+        if resources is None:
+            return None
+        if key not in resources:
+            resources[key] = factory()
+        return resources[key]
+
     async def execute(self, **kwargs) -> str:
         """
         Tool အလုပ်လုပ်မယ့် Main Logic ကို ဒီမှာရေးရပါမယ်။
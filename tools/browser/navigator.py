@@ -14,6 +14,7 @@ class NavigatorTool(BaseTool):
     """
     name = "browser_navigate"
     description = "Navigate and interact with websites dynamically. Use this to login to social media, click buttons, type messages, or read specific elements."
+    concurrency_safe = False  # Browser Page တစ်ခုတည်းကို မျှသုံးလို့ ပြိုင်တူ မ Run ရ
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
@@ -1,7 +1,6 @@
 import os
 import logging
 import json
-from playwright.async_api import async_playwright
 
 logger = logging.getLogger("JARVIS_BROWSER")
 
@@ -19,6 +18,8 @@ class BrowserManager:
             logger.info("Launching Persistent RAM-Optimized Browser...")
             os.makedirs(cls._user_data_dir, exist_ok=True)
             
+            # Playwright Import က လေးလို့ Browser တကယ်လိုမှပဲ Load လုပ်မယ်
+            from playwright.async_api import async_playwright
             cls._playwright = await async_playwright().start()
             
             # Persistent Context ကို သုံးခြင်းဖြင့် Login ဝင်ပြီးသား အကောင့်များ ပြန်မထွက်သွားတော့ပါ
@@ -73,6 +74,10 @@ class BrowserManager:
 
         return cls._context
 
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._context is not None
+
     @classmethod
     async def close_browser(cls):
         """အလုပ်လုပ်ပြီးပါက Browser ကို ပြန်ပိတ်ပြီး RAM ကို ရှင်းလင်းမည်"""
@@ -2,11 +2,13 @@ import os
 import base64
 import logging
 from typing import Dict, List
-from google.genai import types, Client
+from google.genai import types
 
 from tools.base import BaseTool
 from tools.browser.session import BrowserManager
 from config import Config
+from core.client_pool import client_pool
+from core.key_scheduler import key_scheduler
 
 logger = logging.getLogger("JARVIS_VISUAL")
 
@@ -17,6 +19,7 @@ class VisualTool(BaseTool):
     """
     name = "browser_visual"
     description = "Take a screenshot of the current browser page and analyze it using AI vision. Use this to bypass simple captchas, read hidden text, or debug UI errors when the HTML reading tool fails."
+    concurrency_safe = False  # Browser Page တစ်ခုတည်းကို မျှသုံးလို့ ပြိုင်တူ မ Run ရ
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
@@ -56,19 +59,25 @@ class VisualTool(BaseTool):
                 image_data = image_file.read()
 
             # Gemini API အား ခေါ်ယူ၍ ပုံကို ဖတ်ခိုင်းခြင်း
-            client = Client(api_key=Config.get_next_api_key())
+            api_key = Config.get_next_api_key()
+            client = client_pool.get_async_client(api_key)
             
             vision_prompt = f"Analyze this screenshot. {prompt}"
             if action == "solve_captcha":
                 vision_prompt = f"This is a captcha image. You must strictly return ONLY the solution (the text characters to type). Do not add any extra conversational text or formatting. {prompt}"
 
-            response = client.models.generate_content(
-                model=Config.MODEL_NAME,
-                contents=[
-                    types.Part.from_bytes(data=image_data, mime_type='image/png'),
-                    vision_prompt
-                ]
-            )
+            try:
+                response = await client.models.generate_content(
+                    model=Config.MODEL_NAME,
+                    contents=[
+                        types.Part.from_bytes(data=image_data, mime_type='image/png'),
+                        vision_prompt
+                    ]
+                )
+            except Exception as e:
+                key_scheduler.report_outcome(api_key, e)  # 429 ဆို Scheduler က ဒီ Key ကို ခဏနားခိုင်းမယ်
+                raise
+            key_scheduler.report_outcome(api_key)
 
             # နေရာမယူစေရန် Screenshot ဖိုင်ကို ချက်ချင်း ပြန်ဖျက်ခြင်း
             if os.path.exists(screenshot_path):
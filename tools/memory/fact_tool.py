@@ -41,7 +41,7 @@ class RememberFactTool(BaseTool):
         user_id = Config.ALLOWED_USER_ID 
         
         try:
-            if memory_controller.save_user_fact(user_id, key, val):
+            if await memory_controller.asave_user_fact(user_id, key, val):
                 return f"✅ Saved to Long-term Memory: {key} = {val}"
             return "Error saving fact to database."
         except Exception as e:
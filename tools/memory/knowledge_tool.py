@@ -24,7 +24,7 @@ class KnowledgeTool(BaseTool):
             "category": types.Schema(
                 type=types.Type.STRING,
                 enum=["Skill", "Mistake", "Fact"],
-                description="Category of the knowledge (required for 'save'). 'Skill' for solutions, 'Mistake' for errors to avoid."
+                description="Category of the knowledge (required for 'save', optional filter for 'search'). 'Skill' for solutions, 'Mistake' for errors to avoid."
             ),
             "task_or_query": types.Schema(
                 type=types.Type.STRING,
@@ -60,7 +60,7 @@ class KnowledgeTool(BaseTool):
                 if not cat or not task or not sol:
                     return "Error: 'category', 'task_or_query', and 'solution' are required to save knowledge."
                     
-                success = memory_controller.save_knowledge(cat, task, sol, code)
+                success = await memory_controller.asave_knowledge(cat, task, sol, code)
                 if success:
                     return f"✅ Experience saved successfully to Deep Memory as [{cat}]."
                 return "❌ Failed to save knowledge to Vector DB."
@@ -70,7 +70,8 @@ class KnowledgeTool(BaseTool):
                 if not query:
                     return "Error: 'search_query' is required to search."
                     
-                results = memory_controller.search_knowledge(query)
+                # Category ပေးထားရင် အဲ့ဒီ အမျိုးအစားထဲမှာပဲ ရှာမယ် (Prefilter)
+                results = await memory_controller.asearch_knowledge(query, category=kwargs.get("category"))
                 if results:
                     return results
                 return "No relevant past knowledge found in Deep Memory."
@@ -80,7 +81,7 @@ class KnowledgeTool(BaseTool):
                 if not query:
                     return "Error: 'search_query' is required to delete."
                     
-                if memory_controller.delete_knowledge(query):
+                if await memory_controller.adelete_knowledge(query):
                     return f"✅ Knowledge related to '{query}' has been permanently deleted from Deep Memory."
                 return "❌ Failed to find or delete the specified knowledge. It might not exist."    
                 
@@ -45,12 +45,12 @@ class TaskTool(BaseTool):
                 if not desc:
                     return "Error: 'task_description' is required to add a task."
                 
-                if memory_controller.add_task(user_id, desc):
+                if await memory_controller.aadd_task(user_id, desc):
                     return f"✅ Ongoing task added: {desc}"
                 return "❌ Failed to add ongoing task."
                 
             elif action == "list":
-                tasks = memory_controller.get_tasks(user_id)
+                tasks = await memory_controller.aget_tasks(user_id)
                 if tasks:
                     return tasks
                 return "No ongoing tasks at the moment."
@@ -59,10 +59,10 @@ class TaskTool(BaseTool):
                 t_id = kwargs.get("task_id")
                 if not t_id:
                     # ID မသိရင် User ကို List အရင်ပြမယ်
-                    tasks = memory_controller.get_tasks(user_id)
+                    tasks = await memory_controller.aget_tasks(user_id)
                     return f"Error: 'task_id' is required to remove a task. Current tasks:\n{tasks}"
                 
-                if memory_controller.remove_task(t_id):
+                if await memory_controller.aremove_task(t_id):
                     return f"✅ Task [{t_id}] marked as completed and removed."
                 return f"❌ Failed to remove task ID [{t_id}]."
                 
@@ -14,6 +14,7 @@ class QATesterTool(BaseTool):
     name = "manage_qa_testing"
     description = "Run Quality Assurance (QA), Security checks, and Execution tests on a completed project. It automatically loops back to the developer if bugs are found."
     owner_role = "ceo"
+    timeout = None  # QA <-> Coder Loop တစ်ခုလုံး ကြာနိုင်လို့
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
@@ -27,8 +28,9 @@ class QATesterTool(BaseTool):
         return ["project_name"]
 
     async def execute(self, **kwargs) -> str:
-        # Circular Import မဖြစ်အောင် Function အထဲရောက်မှ Agent ကို ခေါ်မယ်
-        from core.agent import JarvisAgent 
+        # Circular Import မဖြစ်အောင် Function အထဲရောက်မှ Agent Pool ကို ခေါ်မယ်
+        from core.agent_pool import agent_pool
+        from core.brain import load_role_prompt
         
         project_name = kwargs.get("project_name")
         logger.info(f"🔎 Initiating QA Testing for Project: {project_name}")
@@ -62,15 +64,10 @@ class QATesterTool(BaseTool):
             logger.info(f"🔄 QA Loop {current_loop}/{max_loops}...")
 
             # --- 1. QA Agent ကို အလုပ်ခိုင်းခြင်း ---
-            qa_agent = JarvisAgent(role="qa_tester")
-            qa_prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', 'qa_tester.md')
-            if os.path.exists(qa_prompt_path):
-                with open(qa_prompt_path, 'r', encoding='utf-8') as f:
-                    qa_agent.brain.system_instruction = f.read()
-
             qa_msg = f"PROJECT: {project_name}\nRead the 'final_blueprint.md' and the written code. Run the code using your 'shell_exec' tool. Output [STATUS: PASSED] or [STATUS: FAILED] with a detailed bug report."
             
-            qa_result = await qa_agent.chat(qa_msg, user_id=999999)
+            async with agent_pool.acquire("qa_tester", system_instruction=load_role_prompt("qa_tester")) as qa_agent:
+                qa_result = await qa_agent.chat(qa_msg, user_id=999999)
 
             # --- 2. ရလဒ်ကို စစ်ဆေးခြင်း ---
             if "[STATUS: PASSED]" in qa_result:
@@ -80,16 +77,11 @@ class QATesterTool(BaseTool):
                 logger.warning(f"⚠️ QA Failed. Sending back to Coder...")
                 
                 # --- 3. Error တက်ရင် Coder ဆီ အလိုလို ပြန်ပို့ခြင်း ---
-                coder_agent = JarvisAgent(role="coder")
-                c_prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', 'coder.md')
-                if os.path.exists(c_prompt_path):
-                    with open(c_prompt_path, 'r', encoding='utf-8') as f:
-                        coder_agent.brain.system_instruction = f.read()
-                
                 fix_msg = f"PROJECT: {project_name}\nCRITICAL: QA testing FAILED with the following report:\n\n{qa_result}\n\nPlease read the affected files, FIX the code, and save the changes using 'manage_file'."
                 
                 logger.info("👨‍💻 Coder is fixing the bugs...")
-                await coder_agent.chat(fix_msg, user_id=999999)
+                async with agent_pool.acquire("coder", system_instruction=load_role_prompt("coder")) as coder_agent:
+                    await coder_agent.chat(fix_msg, user_id=999999)
                 
                 current_loop += 1
             else:
@@ -15,6 +15,7 @@ class SETeamManagerTool(BaseTool):
     name = "manage_se_team"
     description = "Delegate a full software engineering project to the SE Team. Use this when the user asks to build an app, website, or complex software project."
     owner_role = "ceo" # CEO သာလျှင် ဒီ Tool ကို သုံးခွင့်ရှိသည်
+    timeout = None  # Planner -> Researcher -> Coder Pipeline တစ်ခုလုံး ကြာနိုင်လို့
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
@@ -32,7 +33,8 @@ class SETeamManagerTool(BaseTool):
         return ["project_name", "project_description"]
 
     async def execute(self, **kwargs) -> str:
-        from core.agent import JarvisAgent
+        from core.agent_pool import agent_pool
+        from core.brain import load_role_prompt
         project_name = kwargs.get("project_name")
         project_desc = kwargs.get("project_description")
 
@@ -47,14 +49,8 @@ class SETeamManagerTool(BaseTool):
         # ၂။ Planner Agent ဆီသို့ အလုပ်စတင် လွှဲပြောင်းပေးခြင်း
         logger.info("🧠 Step 1: Calling Planner Agent...")
         
-        # Planner အတွက် သီးသန့် Agent တစ်ကောင် မွေးဖွားမယ်
-        planner_agent = JarvisAgent(role="planner")
-
-        # 🧠 FIX: Planner ရဲ့ ဦးနှောက် (planner.md) ကို ဖတ်ပြီး အတင်းထည့်သွင်းပေးခြင်း
-        prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', 'planner.md')
-        if os.path.exists(prompt_path):
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                planner_agent.brain.system_instruction = f.read()
+        # 🧠 FIX: Planner ရဲ့ ဦးနှောက် (planner.md) ကို ဖတ်ပြီး Pool ထဲက Agent ကို အတင်းထည့်သွင်းပေးခြင်း
+        planner_prompt = load_role_prompt("planner")
 
         # Planner ကို အမိန့်ပေးမယ်
         prompt = f"""
@@ -72,29 +68,20 @@ class SETeamManagerTool(BaseTool):
         try:
             # --- [STAGE 1: PLANNER] ---
             logger.info("🧠 STAGE 1: Architecting Plan...")
-            await planner_agent.chat(prompt, user_id=999999)
+            async with agent_pool.acquire("planner", system_instruction=planner_prompt) as planner_agent:
+                await planner_agent.chat(prompt, user_id=999999)
             
             # --- [STAGE 2: RESEARCHER] ---
             logger.info("🕵️ STAGE 2: Researching Tech Stack...")
-            researcher_agent = JarvisAgent(role="researcher")
-            r_prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', 'researcher.md')
-            if os.path.exists(r_prompt_path):
-                with open(r_prompt_path, 'r', encoding='utf-8') as f:
-                    researcher_agent.brain.system_instruction = f.read()
-                    
             r_msg = f"PROJECT: {project_name}\nRead the plan.md, research the best practices, and output 'final_blueprint.md'."
-            await researcher_agent.chat(r_msg, user_id=999999)
+            async with agent_pool.acquire("researcher", system_instruction=load_role_prompt("researcher")) as researcher_agent:
+                await researcher_agent.chat(r_msg, user_id=999999)
             
             # --- [STAGE 3: CODER] ---
             logger.info("👨‍💻 STAGE 3: Writing Code...")
-            coder_agent = JarvisAgent(role="coder")
-            c_prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', 'coder.md')
-            if os.path.exists(c_prompt_path):
-                with open(c_prompt_path, 'r', encoding='utf-8') as f:
-                    coder_agent.brain.system_instruction = f.read()
-                    
             c_msg = f"PROJECT: {project_name}\nRead 'final_blueprint.md', strictly build the exact folder structure, and write the complete code for ALL Phases outlined in the blueprint. Do not stop until the entire functional project is built."
-            coder_result = await coder_agent.chat(c_msg, user_id=999999)
+            async with agent_pool.acquire("coder", system_instruction=load_role_prompt("coder")) as coder_agent:
+                coder_result = await coder_agent.chat(c_msg, user_id=999999)
             
             # --- [STAGE 4: HUMAN-IN-THE-LOOP (CREDENTIAL HANDSHAKE)] ---
             logger.info("🔐 STAGE 4: Checking .env for missing credentials...")
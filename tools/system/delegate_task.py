@@ -1,5 +1,4 @@
 import logging
-import os
 from typing import Dict, List
 from google.genai import types
 
@@ -13,6 +12,7 @@ class DelegateTaskTool(BaseTool):
     """
     name = "delegate_task"
     description = "Delegate complex tasks to specialized Sub-Agents (web_surfer, sysadmin, researcher). The CEO must use this to assign workload instead of doing it manually."
+    timeout = None  # Sub-Agent ရဲ့ ReAct Loop တစ်ခုလုံး ကြာနိုင်လို့
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
@@ -36,25 +36,19 @@ class DelegateTaskTool(BaseTool):
 
         logger.info(f"👔 CEO Delegating task to {role.upper()}...")
 
-        # 👈 FIX: Hardcode မသုံးတော့ဘဲ core/prompts/ အောက်က ဖိုင်များကိုသာ အလိုအလျောက် ဖတ်မည်
-        prompt_path = os.path.join(os.getcwd(), 'core', 'prompts', f'{role}.md')
-        
-        if os.path.exists(prompt_path):
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                system_instruction = f.read()
-        else:
-            system_instruction = "You are a specialized Assistant."
+        from core.brain import load_role_prompt
+        # 👈 FIX: Hardcode မသုံးတော့ဘဲ core/prompts/ အောက်က ဖိုင်များကိုသာ အလိုအလျောက် ဖတ်မည် (mtime Cache နဲ့)
+        system_instruction = load_role_prompt(role) or "You are a specialized Assistant."
 
-        system_instruction += f"\n\nYOUR ASSIGNED MISSION:\n{task}\n\nExecute this mission using your tools and report the final result back to the CEO."
+        # Mission ကို System Instruction ထဲ မထည့်တော့ဘဲ User Turn ထဲပဲ ထည့်မယ် (Role Prompt က Cache လုပ်လို့ရအောင် မပြောင်းလဲဘဲ ရှိနေမယ်)
+        mission = f"YOUR ASSIGNED MISSION:\n{task}\n\nExecute this mission using your tools and report the final result back to the CEO."
 
         try:
-            from core.agent import JarvisAgent
-            # Sub-Agent အသစ်တစ်ခုကို သီးသန့် ဉာဏ်ရည်ဖြင့် မွေးဖွားခြင်း
-            worker_agent = JarvisAgent(role=role)
-            worker_agent.brain.system_instruction = system_instruction
-            
-            # Sub-Agent ကို အလုပ်ခိုင်းခြင်း
-            result = await worker_agent.chat(f"Execute mission: {task}", user_id=999999) # ID သီးသန့်ခွဲထားမည်
+            from core.agent_pool import agent_pool
+            # Sub-Agent ကို Pool ထဲကနေ သီးသန့် ဉာဏ်ရည် (Role Prompt) ဖြင့် ငှားယူခြင်း
+            async with agent_pool.acquire(role, system_instruction=system_instruction) as worker_agent:
+                # Sub-Agent ကို အလုပ်ခိုင်းခြင်း
+                result = await worker_agent.chat(mission, user_id=999999) # ID သီးသန့်ခွဲထားမည်
             
             return f"[{role.upper()} REPORT]:\n{result}"
         except Exception as e:
@@ -71,6 +71,10 @@ class FileManagerTool(BaseTool):
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 with open(target_path, "w", encoding="utf-8") as f:
                     f.write(content)
+                # Tool ဖိုင်အသစ် ရေးလိုက်ရင် Registry ကို နောက်တစ်ခါ ပြန်စစ်ခိုင်းမယ်
+                if target_path.suffix == ".py" and str(target_path).startswith(str((base_dir / "custom_skills").resolve())):
+                    from core.registry import tool_registry
+                    tool_registry.mark_dirty()
                 return f"✅ Successfully wrote data to '{file_path_str}'."
 
             elif action == "list":
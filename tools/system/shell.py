@@ -1,31 +1,244 @@
-import subprocess
+import asyncio
+import codecs
 import logging
+import shlex
+import shutil
 import signal
+import time
+import uuid
 import os
+from collections import deque
 from typing import Dict, List
 from google.genai import types
 
+from config import Config
+from core.sandbox import shell_sandbox, ResourceMonitor
 from tools.base import BaseTool
 
 logger = logging.getLogger("JARVIS_SHELL")
 
 PROTECTED_ITEMS = [
-    "core", "tools", "memory", "interfaces", "main.py", "config.py", 
+    "core", "tools", "memory", "interfaces", "main.py", "config.py",
     "tasks", "venv", ".env", ".git", "/etc", "/boot", "/bin"
 ]
 
+class OutputBuffer:
+    """
+    Stream တစ်ခု (stdout/stderr) အတွက် Bounded Buffer.
+    - အစပိုင်း head_chars ကို သိမ်းမယ် (Command ဘာလုပ်နေလဲ သိရအောင်)
+    - နောက်ဆုံးပိုင်း tail_chars ကို Ring Buffer နဲ့ သိမ်းမယ် (Error က အဆုံးမှာ ရှိတတ်လို့)
+    - ကြားက စာတွေကို အရေအတွက်ပဲ မှတ်မယ် (Memory / Prompt မပေါက်အောင်)
+    """
+    def __init__(self, head_chars: int, tail_chars: int):
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+        self._head: List[str] = []
+        self._head_len = 0
+        self._tail: deque = deque()
+        self._tail_len = 0
+        self.omitted = 0
+        self.last_line = ""
+
+    def feed(self, text: str):
+        if not text:
+            return
+        # Progress Bar တွေက \r နဲ့ Line ကို ပြန်ရေးတတ်လို့ \r ကိုပါ Line ခွဲမယ်
+        lines = [line.strip() for line in text.replace("\r", "\n").split("\n") if line.strip()]
+        if lines:
+            self.last_line = lines[-1]
+
+        if self._head_len < self.head_chars:
+            take = text[:self.head_chars - self._head_len]
+            self._head.append(take)
+            self._head_len += len(take)
+            text = text[len(take):]
+            if not text:
+                return
+
+        self._tail.append(text)
+        self._tail_len += len(text)
+        while self._tail_len > self.tail_chars:
+            excess = self._tail_len - self.tail_chars
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                dropped = len(first)
+            else:
+                self._tail[0] = first[excess:]
+                dropped = excess
+            self._tail_len -= dropped
+            self.omitted += dropped
+
+    def text(self) -> str:
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if self.omitted:
+            return f"{head}\n... [{self.omitted} chars omitted] ...\n{tail}"
+        return head + tail
+
+async def _pump(stream: asyncio.StreamReader, buffer: OutputBuffer, marker: str = None):
+    """
+    Stream ကို Chunk လိုက် ဖတ်ပြီး Buffer ထဲ ထည့်မယ်။
+    marker ပေးထားရင် အဲ့ဒီ Sentinel တွေ့တာနဲ့ ရပ်ပြီး နောက်က Line (Exit Code) ကို ပြန်ပေးမယ်၊ EOF ဆိုရင် None
+    """
+    # UTF-8 Character တွေ Chunk နှစ်ခုကြား ပြတ်နေရင်လည်း မှန်အောင် Incremental Decode လုပ်မယ်
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    carry = ""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            buffer.feed(carry + decoder.decode(b"", final=True))
+            return None
+        text = carry + decoder.decode(chunk)
+        if marker is None:
+            buffer.feed(text)
+            continue
+
+        index = text.find(marker)
+        if index >= 0:
+            buffer.feed(text[:index])
+            rest = text[index + len(marker):]
+            while "\n" not in rest:
+                more = await stream.read(64)
+                if not more:
+                    break
+                rest += decoder.decode(more)
+            return rest.split("\n", 1)[0]
+
+        # Sentinel က Chunk နှစ်ခုကြား ပြတ်နေနိုင်လို့ အဆုံးပိုင်းကို နောက် Chunk နဲ့ တွဲစစ်ဖို့ ချန်ထားမယ်
+        keep = len(marker) - 1
+        buffer.feed(text[:-keep])
+        carry = text[-keep:]
+
+async def _kill_group(proc: asyncio.subprocess.Process):
+    """SIGTERM ကို Process Group တစ်ခုလုံးဆီ ပို့မယ်၊ Grace Period ပြီးရင် ကျန်နေသေးတာတွေကို SIGKILL"""
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), Config.SHELL_KILL_GRACE)
+    except asyncio.TimeoutError:
+        pass
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+class ShellSession:
+    """
+    Agent Run တစ်ခုလုံးအတွက် Long-lived Bash Process.
+    cd / source venv/bin/activate / export တွေက Step ကြားမှာ မပျောက်တော့ဘူး၊ Command တိုင်း /bin/sh အသစ် Fork စရာ မလိုဘူး။
+    Command တစ်ခုချင်းစီရဲ့ အဆုံးကို stdout/stderr နှစ်ခုလုံးမှာ Sentinel Line နဲ့ ခွဲသိမယ်။
+    """
+    def __init__(self):
+        self.proc = None
+        self.cgroup = None
+        self.last_exit_code = None
+        self.commands = 0
+        self._lock = asyncio.Lock()  # Parallel Tool Call တွေ Bash တစ်ခုတည်းကို ပြိုင်မရေးအောင်
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def _start(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            "bash", "--noprofile", "--norc",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        # Command မရေးရသေးခင် Limit / Priority ချမှတ်မယ် (Bash ကနေ Fork တဲ့ Command တိုင်း Inherit လုပ်မယ်)
+        self.cgroup = shell_sandbox.confine(self.proc.pid)
+        logger.info(f"🐚 Shell session started (pid {self.proc.pid})")
+
+    async def run(self, command: str, stdout: OutputBuffer, stderr: OutputBuffer, timeout: float):
+        """
+        Command ကို Session ထဲမှာ Run မယ်။ (timed_out, ResourceMonitor) ပြန်ပေးမယ်
+        Timeout ဖြစ်ရင် Session ကို သတ်ပြီး နောက် Command မှာ အသစ်ပြန်စမယ်
+        """
+        async with self._lock:
+            if not self.alive:
+                await self._start()
+            monitor = ResourceMonitor(self.proc.pid)
+            monitor.sample()  # Baseline (Session ရဲ့ ယခင် Command တွေရဲ့ CPU ကို နုတ်ဖို့)
+
+            marker = f"__JARVIS_DONE_{uuid.uuid4().hex}__"
+            # eval နဲ့ Run လို့ Syntax Error ဖြစ်လည်း Session မသေဘူး၊ stdin ကို ပိတ်ထားလို့ Command က Sentinel ကို မစားနိုင်ဘူး
+            script = (
+                monitor.wrap(f"eval {shlex.quote(command)} < /dev/null")
+                + f"printf '\\n{marker}%d\\n' $__jarvis_rc\n"
+                f"printf '\\n{marker}\\n' >&2\n"
+            )
+            self.commands += 1
+            self.proc.stdin.write(script.encode("utf-8"))
+            await self.proc.stdin.drain()
+
+            sampler = asyncio.create_task(monitor.run(Config.SHELL_SAMPLE_INTERVAL))
+            try:
+                exit_code, _ = await asyncio.wait_for(asyncio.gather(
+                    _pump(self.proc.stdout, stdout, marker),
+                    _pump(self.proc.stderr, stderr, marker),
+                ), timeout)
+                monitor.sample()
+            except asyncio.TimeoutError:
+                logger.warning(f"⏱️ Shell session timeout after {timeout}s: {command}")
+                await self.close(force=True)
+                monitor.finish()
+                return True, monitor
+            except asyncio.CancelledError:
+                await self.close(force=True)
+                monitor.finish()
+                raise
+            finally:
+                sampler.cancel()
+            monitor.finish()
+
+            if exit_code is None:
+                # Command ထဲမှာ exit / set -e ပါလို့ Bash ကိုယ်တိုင် ထွက်သွားတာ
+                logger.info("🐚 Shell session exited by command; will restart on next call.")
+                await self.close(force=True)
+            else:
+                self.last_exit_code = int(exit_code) if exit_code.strip().isdigit() else None
+            return False, monitor
+
+    async def close(self, force: bool = False):
+        """Run ပြီးရင် (သို့) Timeout မှာ ခေါ်မယ် - Background Process တွေပါ မကျန်အောင် Group လိုက် ရှင်းမယ်"""
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if not force and proc.returncode is None:
+            try:
+                proc.stdin.write(b"exit\n")
+                await proc.stdin.drain()
+                await asyncio.wait_for(proc.wait(), Config.SHELL_KILL_GRACE)
+            except (asyncio.TimeoutError, BrokenPipeError, ConnectionResetError):
+                pass
+        await _kill_group(proc)
+        shell_sandbox.release_cgroup(self.cgroup)
+        self.cgroup = None
+        logger.info(f"🐚 Shell session closed after {self.commands} command(s).")
+
 class ShellTool(BaseTool):
     """
-    Executes Linux shell commands on the VPS. 
+    Executes Linux shell commands on the VPS.
     ENHANCED: Properly handles silent success without confusing the AI.
+    Asyncio Subprocess နဲ့ Run လို့ ကြာတဲ့ Command တွေက Event Loop (Telegram/Scheduler) ကို မပိတ်တော့ဘူး။
+    SHELL_PERSISTENT_SESSION ဖွင့်ထားရင် Agent Run တစ်ခုလုံး Bash Session တစ်ခုတည်းကို ပြန်သုံးမယ်။
     """
     name = "shell_exec"
     description = "Execute Linux terminal commands on the VPS. USE WITH CAUTION."
+    if Config.SHELL_PERSISTENT_SESSION:
+        description += " The working directory, activated virtualenv and exported variables persist between calls within the same task."
+    timeout = Config.SHELL_TIMEOUT + 30  # Command ကိုယ်တိုင်မှာ SHELL_TIMEOUT ရှိပြီးသား (Kill ချိန်ပါ ချန်ထားမယ်)
 
     def get_parameters(self) -> Dict[str, types.Schema]:
         return {
             "command": types.Schema(
-                type=types.Type.STRING, 
+                type=types.Type.STRING,
                 description="The Linux command to execute."
             )
         }
@@ -38,49 +251,150 @@ class ShellTool(BaseTool):
         if not command:
             return "Error: No command provided."
 
+        session = self._session()
+
         # --- 🛡️ SMART SAFETY CHECK ---
         dangerous_keywords = ["rm ", "mv ", ">", "truncate", "dd "]
         is_destructive = any(keyword in command for keyword in dangerous_keywords)
-        
+
         if is_destructive:
             for protected in PROTECTED_ITEMS:
                 if protected in command:
                     logger.warning(f"⛔ Blocked dangerous command: {command}")
                     return f"⛔ SAFETY ALERT: Access Denied! Target '{protected}' is a CORE file."
+            # Session မှာ `cd core` ပြီးမှ `rm -rf *` ဆိုရင် Command ထဲမှာ Path မပါလို့ Working Directory ကိုပါ စစ်မယ်
+            protected = self._protected_cwd(session, command)
+            if protected:
+                logger.warning(f"⛔ Blocked dangerous command in protected directory: {command}")
+                return f"⛔ SAFETY ALERT: Access Denied! The working directory is inside (or contains) CORE path '{protected}'."
         # ------------------------------------
 
         logger.info(f"💻 Executing: {command}")
-        
+
+        stdout = OutputBuffer(Config.SHELL_OUTPUT_HEAD_CHARS, Config.SHELL_OUTPUT_TAIL_CHARS)
+        stderr = OutputBuffer(Config.SHELL_OUTPUT_HEAD_CHARS, Config.SHELL_OUTPUT_TAIL_CHARS)
+        progress = asyncio.create_task(self._report_progress(stdout, stderr))
         try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=60 
-            )
-            
+            if session is not None:
+                timed_out, monitor = await session.run(command, stdout, stderr, Config.SHELL_TIMEOUT)
+            else:
+                timed_out, monitor = await self._run(command, stdout, stderr, Config.SHELL_TIMEOUT)
+            shell_sandbox.record(monitor, timed_out)
+            usage = f"\n\n{monitor.summary()}" if Config.SHELL_REPORT_RESOURCES else ""
+
+            if timed_out:
+                partial_output = ""
+                if stdout.text().strip(): partial_output += f"STDOUT:\n{stdout.text().strip()}\n"
+                if stderr.text().strip(): partial_output += f"STDERR:\n{stderr.text().strip()}\n"
+
+                return f"⚠️ TIMEOUT ALERT: The command stopped because it took too long.\nLOGS CAPTURED:\n{partial_output}\n(Hint: Is it waiting for 'yes/no' input?){usage}"
+
             # 🔥 FIX: STDOUT အလွတ်ကြီး ထွက်မလာအောင် သေချာစစ်ထုတ်မယ်
             output = ""
-            if result.stdout and result.stdout.strip():
-                output += f"STDOUT:\n{result.stdout.strip()}\n"
-            if result.stderr and result.stderr.strip():
-                output += f"STDERR (Error Logs):\n{result.stderr.strip()}"
-                
+            if stdout.text().strip():
+                output += f"STDOUT:\n{stdout.text().strip()}\n"
+            if stderr.text().strip():
+                output += f"STDERR (Error Logs):\n{stderr.text().strip()}"
+
             final_output = output.strip()
-            
+
             # Output လုံးဝမရှိရင် AI နားလည်အောင် Success လို့ တိတိကျကျ ပြောပြမယ်
             if not final_output:
-                return "[Success] Command executed silently with no errors. Task completed."
-                
-            return final_output
+                return f"[Success] Command executed silently with no errors. Task completed.{usage}"
 
-        except subprocess.TimeoutExpired as e:
-            partial_output = ""
-            if e.stdout: partial_output += f"STDOUT:\n{e.stdout.decode('utf-8', errors='ignore')}\n"
-            if e.stderr: partial_output += f"STDERR:\n{e.stderr.decode('utf-8', errors='ignore')}\n"
-            
-            return f"⚠️ TIMEOUT ALERT: The command stopped because it took too long.\nLOGS CAPTURED:\n{partial_output}\n(Hint: Is it waiting for 'yes/no' input?)"
+            return final_output + usage
 
         except Exception as e:
-            return f"System Execution Error: {str(e)}"
\ No newline at end of file
+            return f"System Execution Error: {str(e)}"
+        finally:
+            progress.cancel()
+
+    def _session(self):
+        """Persistent Mode ဖွင့်ထားပြီး Agent Run အတွင်းဆိုရင် ဒီ Run ရဲ့ ShellSession ကို ပြန်ပေးမယ်"""
+        if not Config.SHELL_PERSISTENT_SESSION or shutil.which("bash") is None:
+            return None
+        return self.run_resource("shell_session", ShellSession)
+
+    @staticmethod
+    def _protected_cwd(session, command: str):
+        """
+        Command Run မယ့် Directory (Session ဆို Bash ရဲ့ လက်ရှိ cwd) က Protected Path အထဲမှာ ရှိရင်၊
+        (သို့) Wildcard ပါပြီး Protected Path ကို ထိနိုင်တဲ့ Parent Directory ဖြစ်နေရင် အဲ့ဒီ Item ကို ပြန်ပေးမယ်
+        """
+        cwd = os.getcwd()
+        if session is not None and session.alive:
+            try:
+                cwd = os.readlink(f"/proc/{session.proc.pid}/cwd")
+            except OSError:
+                pass
+        cwd = os.path.realpath(cwd)
+        root = os.path.realpath(os.getcwd())  # Relative Protected Item တွေက Bot ရဲ့ Project Root အောက်က
+        for item in PROTECTED_ITEMS:
+            path = os.path.realpath(item if os.path.isabs(item) else os.path.join(root, item))
+            if cwd == path or cwd.startswith(path + os.sep):
+                return item
+            if "*" in command and path.startswith(cwd.rstrip(os.sep) + os.sep):
+                return item
+        return None
+
+    # ==========================================
+    # ⚙️ Streaming Subprocess Engine (One-shot)
+    # ==========================================
+    async def _run(self, command: str, stdout: OutputBuffer, stderr: OutputBuffer, timeout: float):
+        """
+        Command ကို Process Group သီးသန့်နဲ့ Run ပြီး stdout/stderr ကို တဖြည်းဖြည်း ဖတ်မယ်။ (timed_out, ResourceMonitor) ပြန်ပေးမယ်
+        Shell က stdin ကနေ Script ကို စောင့်နေတုန်း Limit ချမှတ်လို့ Command က Limit မရှိဘဲ တစ်စက္ကန့်မှ မ Run ရဘူး
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "/bin/sh",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,  # Timeout မှာ Child/Grandchild အကုန် တစ်ခါတည်း သတ်လို့ရအောင်
+        )
+        cgroup = shell_sandbox.confine(proc.pid)
+        monitor = ResourceMonitor(proc.pid)
+        monitor.sample()
+        script = monitor.wrap(f"eval {shlex.quote(command)} < /dev/null") + "exit $__jarvis_rc\n"
+        proc.stdin.write(script.encode("utf-8"))
+        proc.stdin.close()
+
+        readers = [
+            asyncio.create_task(_pump(proc.stdout, stdout)),
+            asyncio.create_task(_pump(proc.stderr, stderr)),
+        ]
+        sampler = asyncio.create_task(monitor.run(Config.SHELL_SAMPLE_INTERVAL))
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning(f"⏱️ Shell timeout after {timeout}s: {command}")
+            await _kill_group(proc)
+        except asyncio.CancelledError:
+            # Registry Timeout / Agent Cancel ဖြစ်ရင်လည်း Process တွေ မကျန်ခဲ့အောင် သတ်မယ်
+            await _kill_group(proc)
+            for reader in readers:
+                reader.cancel()
+            monitor.finish(shell_sandbox.release_cgroup(cgroup))
+            raise
+        finally:
+            sampler.cancel()
+
+        # Background (&) နဲ့ ထွက်သွားတဲ့ Process က Pipe ကို ဆက်ကိုင်ထားရင် ထာဝရ မစောင့်ဘူး
+        _, pending = await asyncio.wait(readers, timeout=Config.SHELL_KILL_GRACE)
+        for reader in pending:
+            reader.cancel()
+        monitor.finish(shell_sandbox.release_cgroup(cgroup))
+        return timed_out, monitor
+
+    async def _report_progress(self, stdout: OutputBuffer, stderr: OutputBuffer):
+        """ကြာနေတဲ့ Command ရဲ့ နောက်ဆုံး Output Line ကို Telegram Status မှာ ပြမယ်"""
+        started = time.monotonic()
+        while True:
+            await asyncio.sleep(Config.SHELL_PROGRESS_INTERVAL)
+            elapsed = int(time.monotonic() - started)
+            line = (stdout.last_line or stderr.last_line)[:120]
+            message = f"Executing system command... ({elapsed}s)"
+            await self.report_status(f"{message}\n{line}" if line else message)
@@ -1,12 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
-import html2text
+import asyncio
 import logging
 from typing import Dict, List
 from google.genai import types
 
 # ဖခင် Class ကို လှမ်းခေါ်မယ် (စနစ်သစ်အတွက်)
 from tools.base import BaseTool
+from core.http_pool import http_pool
+from core.page_cache import page_cache
+from config import Config
 
 logger = logging.getLogger("JARVIS_SCRAPER")
 
@@ -38,34 +39,67 @@ class ScraperTool(BaseTool):
         if not url:
             return "Error: No URL provided."
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
         try:
+            # TTL အတွင်း Cache ရှိရင် Network ကော Parse ကော မလုပ်တော့ဘူး
+            cached = await asyncio.to_thread(page_cache.lookup, url)
+            if cached and cached["fresh"]:
+                logger.info(f"📦 Page cache hit: {url}")
+                return self._truncate(cached["markdown"])
+
             logger.info(f"🌐 Scraping URL: {url}")
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status() # Check for 404/500 errors
-
-            # 1. Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 2. Remove Junk (Ads, Navigation, Scripts) - RAM Saver
-            for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                script.decompose()
-
-            # 3. Convert to Markdown (Clean Text)
-            converter = html2text.HTML2Text()
-            converter.ignore_links = False
-            converter.ignore_images = True # ပုံတွေ မယူဘူး (Token သက်သာအောင်)
-            
-            markdown_text = converter.handle(str(soup))
-            
-            # စာလုံးရေကန့်သတ်မယ် (Gemini Context မပြည့်အောင်)
-            if len(markdown_text) > 10000:
-                return markdown_text[:10000] + "\n...(Content truncated for brevity)"
-            return markdown_text
+            # Shared Async Client (Keep-alive / HTTP2) နဲ့ Stream ပြီး SCRAPER_MAX_BYTES မှာ ဖြတ်မယ် (4xx/5xx ဆို Error တက်မယ်)
+            page = await http_pool.fetch(url, max_bytes=Config.SCRAPER_MAX_BYTES,
+                                         headers=page_cache.conditional_headers(cached))
+            if page.status == 304 and cached:
+                logger.info(f"📦 Page not modified (revalidated): {url}")
+                await asyncio.to_thread(page_cache.revalidated, url, page.headers)
+                return self._truncate(cached["markdown"])
+            if page.truncated:
+                logger.info(f"✂️ Download capped at {Config.SCRAPER_MAX_BYTES} bytes: {url}")
+
+            # Content တူတာ Parse ပြီးသားဆိုရင် ပြန်သုံးမယ်၊ မဟုတ်ရင် HTML Parse ကို Thread ထဲမှာ လုပ်မယ် (Event Loop မပိတ်အောင်)
+            digest = page_cache.content_hash(page.content)
+            markdown_text = await asyncio.to_thread(page_cache.markdown_for, digest)
+            if markdown_text is None:
+                markdown_text = await asyncio.to_thread(self._to_markdown, page.text, page.content_type)
+            # ဖြတ်ထားတဲ့ Body ကို ETag/Last-Modified နဲ့ သိမ်းရင် နောက် 304 တိုင်းမှာ ပိုင်းနေတဲ့ Page ကိုပဲ ပြန်ပေးနေမှာမို့
+            # Validator မပါဘဲ သိမ်းမယ် (TTL အတွင်းပဲ သုံးပြီး ကုန်ရင် အပြည့် ပြန် Download လုပ်မယ်)
+            validators = {} if page.truncated else page.headers
+            await asyncio.to_thread(page_cache.store, url, page.content, markdown_text, validators, digest)
+
+            return self._truncate(markdown_text)
 
         except Exception as e:
             logger.error(f"Scraping Error: {e}")
-            return f"Failed to read page: {str(e)}"
\ No newline at end of file
+            return f"Failed to read page: {str(e)}"
+
+    @staticmethod
+    def _truncate(markdown_text: str) -> str:
+        # စာလုံးရေကန့်သတ်မယ် (Gemini Context မပြည့်အောင်)
+        if len(markdown_text) > Config.SCRAPER_MAX_CHARS:
+            return markdown_text[:Config.SCRAPER_MAX_CHARS] + "\n...(Content truncated for brevity)"
+        return markdown_text
+
+    @staticmethod
+    def _to_markdown(html: str, content_type: str = "text/html") -> str:
+        # Plain Text / JSON ဆိုရင် Parse စရာ မလိုဘူး
+        if content_type and "html" not in content_type and (content_type.startswith("text/") or content_type.endswith("json")):
+            return html
+
+        # HTML Parsing Library တွေကို ဒီ Tool တကယ်သုံးမှပဲ Load လုပ်မယ်
+        import html2text
+        from bs4 import BeautifulSoup
+
+        # 1. Parse HTML
+        soup = BeautifulSoup(html, "html.parser")
+
+        # 2. Remove Junk (Ads, Navigation, Scripts) - RAM Saver
+        for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
+            script.decompose()
+
+        # 3. Convert to Markdown (Clean Text)
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = True # ပုံတွေ မယူဘူး (Token သက်သာအောင်)
+
+        return converter.handle(str(soup))
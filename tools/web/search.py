@@ -7,12 +7,6 @@ from google.genai import types
 from tools.base import BaseTool
 from config import Config
 
-# Tavily Library
-try:
-    from tavily import TavilyClient
-except ImportError:
-    TavilyClient = None
-
 logger = logging.getLogger("TOOL_SEARCH")
 
 class WebSearchTool(BaseTool):
@@ -23,13 +17,21 @@ class WebSearchTool(BaseTool):
     description = "Search the internet for real-time information, news, or coding solutions."
 
     def __init__(self):
-        # Tool စခေါ်တာနဲ့ Tavily Key ကို တစ်ခါတည်း ချိတ်ဆက်ထားမယ်
-        if hasattr(Config, 'TAVILY_KEY') and Config.TAVILY_KEY:
-            self.tavily = TavilyClient(api_key=Config.TAVILY_KEY)
-        else:
-            self.tavily = None
+        # Tavily Client ကို ပထမဆုံး ရှာမှပဲ ဆောက်မယ် (Startup မှာ Library Import မလုပ်အောင်)
+        self._tavily = None
+        if not getattr(Config, 'TAVILY_KEY', None):
             logger.warning("⚠️ Tavily API Key missing. Search tool will not work.")
 
+    @property
+    def tavily(self):
+        if self._tavily is None and getattr(Config, 'TAVILY_KEY', None):
+            try:
+                from tavily import TavilyClient
+                self._tavily = TavilyClient(api_key=Config.TAVILY_KEY)
+            except ImportError:
+                logger.error("❌ tavily library is not installed.")
+        return self._tavily
+
     def get_parameters(self) -> Dict[str, types.Schema]:
         """Brain (Gemini) ကို ဒီ Tool မှာ ဘာတွေထည့်ပေးရမလဲ (Parameters) ရှင်းပြခြင်း"""
         return {